@@ -13,47 +13,54 @@ This example shows the FULL pipeline from physics to video-ready exports.
 
 import asyncio
 
+from _shared import flush_lines, get_manager, release_manager
+
 from chuk_mcp_stage import (
     CameraPath,
     CameraPathMode,
     EasingFunction,
-    ExportFormat,
-    Material,
     MaterialPreset,
     ObjectType,
-    SceneManager,
     SceneMetadata,
     SceneObject,
     Shot,
     Transform,
-    Vector3,
+    material_preset,
+    vec3,
 )
-from chuk_mcp_stage.exporters import SceneExporter
+
+# Banner rules, built once per process rather than on every main() call
+_BANNER = "═" * 70
+_RULE = "-" * 70
+_BAR = "=" * 70
 
 
 async def main():
     """Demonstrate the golden path: physics → stage → export."""
-    print("🎯 GOLDEN PATH EXAMPLE: Ball Throw")
-    print("=" * 70)
-    print()
-    print("This example demonstrates the complete pipeline:")
-    print("  Physics Simulation → Scene Composition → Baking → Export → Video")
-    print()
-    print("=" * 70)
+    out: list[str] = []
+    out.append("🎯 GOLDEN PATH EXAMPLE: Ball Throw")
+    out.append(_BAR)
+    out.append("")
+    out.append("This example demonstrates the complete pipeline:")
+    out.append("  Physics Simulation → Scene Composition → Baking → Export → Video")
+    out.append("")
+    out.append(_BAR)
+
+    manager = get_manager()
 
-    manager = SceneManager()
+    flush_lines(out)
 
     # ═══════════════════════════════════════════════════════════════
     # PHASE 1: AUTHORING (Declarative)
     # ═══════════════════════════════════════════════════════════════
 
-    print("\n" + "═" * 70)
-    print("PHASE 1: AUTHORING (Define the world)")
-    print("═" * 70)
+    out.append("\n" + _BANNER)
+    out.append("PHASE 1: AUTHORING (Define the world)")
+    out.append(_BANNER)
 
     # Step 1: Create scene
-    print("\n📋 Step 1: Create Scene")
-    print("-" * 70)
+    out.append("\n📋 Step 1: Create Scene")
+    out.append(_RULE)
     scene = await manager.create_scene(
         scene_id="golden-path-ball-throw",
         name="Golden Path: Ball Throw",
@@ -62,107 +69,101 @@ async def main():
             author="CHUK Example",
         ),
     )
-    print(f"✓ Created scene: {scene.id}")
-    print(f"  Workspace: artifact://stage/{scene.id}")
+    out.append(f"✓ Created scene: {scene.id}")
+    out.append(f"  Workspace: artifact://stage/{scene.id}")
 
     # Step 2: Add ground plane (static)
-    print("\n🌍 Step 2: Add Ground Plane")
-    print("-" * 70)
+    out.append("\n🌍 Step 2: Add Ground Plane")
+    out.append(_RULE)
     ground = SceneObject(
         id="ground",
         type=ObjectType.PLANE,
-        transform=Transform(position=Vector3(x=0, y=0, z=0)),
-        size=Vector3(x=30, y=30, z=1),
-        material=Material(preset=MaterialPreset.METAL_DARK),
+        transform=Transform(position=vec3(0, 0, 0)),
+        size=vec3(30, 30, 1),
+        material=material_preset(MaterialPreset.METAL_DARK),
     )
-    await manager.add_object(scene.id, ground)
-    print("✓ Added ground plane (30x30m)")
-    print("  Position: (0, 0, 0)")
-    print("  Material: metal-dark")
-    print("  Role: Static - no physics binding needed")
+    out.append("✓ Defined ground plane (30x30m)")
+    out.append("  Position: (0, 0, 0)")
+    out.append("  Material: metal-dark")
+    out.append("  Role: Static - no physics binding needed")
 
     # Step 3: Add ball (will be thrown)
-    print("\n⚾ Step 3: Add Ball (Dynamic Object)")
-    print("-" * 70)
+    out.append("\n⚾ Step 3: Add Ball (Dynamic Object)")
+    out.append(_RULE)
     ball = SceneObject(
         id="ball",
         type=ObjectType.SPHERE,
-        transform=Transform(position=Vector3(x=0, y=2, z=0)),  # Start at 2m height
+        transform=Transform(position=vec3(0, 2, 0)),  # Start at 2m height
         radius=0.5,
-        material=Material(
-            preset=MaterialPreset.GLASS_BLUE,
-            color={"r": 0.2, "g": 0.5, "b": 1.0},
-        ),
+        material=material_preset(MaterialPreset.GLASS_BLUE, color=(0.2, 0.5, 1.0)),
     )
-    await manager.add_object(scene.id, ball)
-    print("✓ Added ball (sphere, radius=0.5m)")
-    print("  Initial position: (0, 2, 0)")
-    print("  Material: glass-blue")
-    print("  Role: Dynamic - will be physics-driven")
+    await manager.add_objects(scene.id, [ground, ball])
+    out.append("✓ Added ball (sphere, radius=0.5m)")
+    out.append("  Initial position: (0, 2, 0)")
+    out.append("  Material: glass-blue")
+    out.append("  Role: Dynamic - will be physics-driven")
 
     # Step 4: Add camera shots
-    print("\n📹 Step 4: Add Camera Shots")
-    print("-" * 70)
+    out.append("\n📹 Step 4: Add Camera Shots")
+    out.append(_RULE)
 
     # Chase shot - follows the ball
     chase_shot = Shot(
         id="chase",
         camera_path=CameraPath(
             mode=CameraPathMode.CHASE,
-            target="ball",
-            offset=Vector3(x=-3, y=2, z=-5),  # Behind and above
-            look_ahead=True,
+            focus="ball",
+            offset=vec3(-3, 2, -5),  # Behind and above
         ),
         start_time=0.0,
         end_time=3.0,
         easing=EasingFunction.SPRING,
         label="Chase ball in flight",
     )
-    await manager.add_shot(scene.id, chase_shot)
-    print("✓ Shot 1: CHASE (0-3s)")
-    print("  Follows ball with spring easing")
-    print("  Offset: (-3, 2, -5) - behind and above")
+    out.append("✓ Shot 1: CHASE (0-3s)")
+    out.append("  Follows ball with spring easing")
+    out.append("  Offset: (-3, 2, -5) - behind and above")
 
     # Static wide shot - see the whole trajectory
     static_shot = Shot(
         id="wide",
         camera_path=CameraPath(
             mode=CameraPathMode.STATIC,
-            position=Vector3(x=10, y=5, z=10),
-            look_at=Vector3(x=0, y=2, z=0),
+            position=vec3(10, 5, 10),
+            look_at=vec3(0, 2, 0),
         ),
         start_time=3.0,
         end_time=5.0,
         easing=EasingFunction.LINEAR,
         label="Wide static view",
     )
-    await manager.add_shot(scene.id, static_shot)
-    print("✓ Shot 2: STATIC (3-5s)")
-    print("  Wide angle from (10, 5, 10)")
-    print("  Looking at: (0, 2, 0)")
+    await manager.add_shots(scene.id, [chase_shot, static_shot])
+    out.append("✓ Shot 2: STATIC (3-5s)")
+    out.append("  Wide angle from (10, 5, 10)")
+    out.append("  Looking at: (0, 2, 0)")
 
     # Step 5: Physics binding (metadata only)
-    print("\n🔗 Step 5: Bind Physics (Metadata Only)")
-    print("-" * 70)
-    print("NOTE: This is where you would create a physics simulation")
-    print("      using chuk-mcp-physics. For this example, we show")
-    print("      the binding step conceptually.")
-    print()
+    out.append("\n🔗 Step 5: Bind Physics (Metadata Only)")
+    out.append(_RULE)
+    out.append("NOTE: This is where you would create a physics simulation")
+    out.append("      using chuk-mcp-physics. For this example, we show")
+    out.append("      the binding step conceptually.")
+    out.append("")
 
     # Conceptual physics setup
     simulation_id = "sim-ball-throw-demo"  # Would come from chuk-mcp-physics
-    print("Conceptual physics setup:")
-    print(f"  1. create_simulation(sim_id='{simulation_id}', gravity_y=-9.81)")
-    print("  2. add_rigid_body(")
-    print("       sim_id='{simulation_id}',")
-    print("       body_id='ball',")
-    print("       shape='sphere',")
-    print("       radius=0.5,")
-    print("       position=[0, 2, 0],")
-    print("       velocity=[5, 8, 0]  # Throw upward and forward")
-    print("     )")
-    print("  3. step_simulation(sim_id='{simulation_id}', steps=300)  # 5s @ 60 FPS")
-    print()
+    out.append("Conceptual physics setup:")
+    out.append(f"  1. create_simulation(sim_id='{simulation_id}', gravity_y=-9.81)")
+    out.append("  2. add_rigid_body(")
+    out.append("       sim_id='{simulation_id}',")
+    out.append("       body_id='ball',")
+    out.append("       shape='sphere',")
+    out.append("       radius=0.5,")
+    out.append("       position=[0, 2, 0],")
+    out.append("       velocity=[5, 8, 0]  # Throw upward and forward")
+    out.append("     )")
+    out.append("  3. step_simulation(sim_id='{simulation_id}', steps=300)  # 5s @ 60 FPS")
+    out.append("")
 
     # Bind the ball to physics body
     await manager.bind_physics(
@@ -170,42 +171,44 @@ async def main():
         object_id="ball",
         physics_body_id=f"rapier://{simulation_id}/body-ball",
     )
-    print(f"✓ Bound 'ball' → rapier://{simulation_id}/body-ball")
-    print("  ⚠️  This is METADATA ONLY - no motion data yet!")
-    print("  The actual motion comes from baking (Phase 2)")
+    out.append(f"✓ Bound 'ball' → rapier://{simulation_id}/body-ball")
+    out.append("  ⚠️  This is METADATA ONLY - no motion data yet!")
+    out.append("  The actual motion comes from baking (Phase 2)")
+
+    flush_lines(out)
 
     # ═══════════════════════════════════════════════════════════════
     # PHASE 2: BAKING (Computational)
     # ═══════════════════════════════════════════════════════════════
 
-    print("\n" + "═" * 70)
-    print("PHASE 2: BAKING (Generate animation keyframes)")
-    print("═" * 70)
-
-    print("\n🔥 Step 6: Bake Simulation to Keyframes")
-    print("-" * 70)
-    print("⚠️  NOTE: This step requires an ACTUAL physics simulation.")
-    print("    In a real workflow, you would:")
-    print()
-    print("    1. Run the physics simulation (chuk-mcp-physics)")
-    print("    2. Call stage_bake_simulation to sample the physics state")
-    print("    3. Keyframes would be saved to VFS")
-    print()
-    print("Command that would be run:")
-    print("  await manager.bake_simulation(")
-    print(f"      scene_id='{scene.id}',")
-    print(f"      simulation_id='{simulation_id}',")
-    print("      fps=60,")
-    print("      duration=5.0")
-    print("  )")
-    print()
-    print("This would:")
-    print("  • Connect to Rapier service (https://rapier.chukai.io)")
-    print("  • Sample physics at 60 FPS for 5 seconds (300 frames)")
-    print("  • Generate keyframes: {time, position, rotation, velocity}")
-    print("  • Save to VFS: /animations/ball.json")
-    print()
-    print("⏭️  Skipping actual baking (requires live physics simulation)")
+    out.append("\n" + _BANNER)
+    out.append("PHASE 2: BAKING (Generate animation keyframes)")
+    out.append(_BANNER)
+
+    out.append("\n🔥 Step 6: Bake Simulation to Keyframes")
+    out.append(_RULE)
+    out.append("⚠️  NOTE: This step requires an ACTUAL physics simulation.")
+    out.append("    In a real workflow, you would:")
+    out.append("")
+    out.append("    1. Run the physics simulation (chuk-mcp-physics)")
+    out.append("    2. Call stage_bake_simulation to sample the physics state")
+    out.append("    3. Keyframes would be saved to VFS")
+    out.append("")
+    out.append("Command that would be run:")
+    out.append("  await manager.bake_simulation(")
+    out.append(f"      scene_id='{scene.id}',")
+    out.append(f"      simulation_id='{simulation_id}',")
+    out.append("      fps=60,")
+    out.append("      duration=5.0")
+    out.append("  )")
+    out.append("")
+    out.append("This would:")
+    out.append("  • Connect to Rapier service (https://rapier.chukai.io)")
+    out.append("  • Sample physics at 60 FPS for 5 seconds (300 frames)")
+    out.append("  • Generate keyframes: {time, position, rotation, velocity}")
+    out.append("  • Save to VFS: /animations/ball.json")
+    out.append("")
+    out.append("⏭️  Skipping actual baking (requires live physics simulation)")
 
     # In a real workflow:
     # bake_result = await manager.bake_simulation(
@@ -217,148 +220,162 @@ async def main():
     # print(f"✓ Baked {bake_result.total_frames} frames")
     # print(f"✓ Objects animated: {', '.join(bake_result.baked_objects)}")
 
+    flush_lines(out)
+
     # ═══════════════════════════════════════════════════════════════
     # PHASE 3: EXPORT (Generate rendering-ready code)
     # ═══════════════════════════════════════════════════════════════
 
-    print("\n" + "═" * 70)
-    print("PHASE 3: EXPORT (Generate rendering code)")
-    print("═" * 70)
+    out.append("\n" + _BANNER)
+    out.append("PHASE 3: EXPORT (Generate rendering code)")
+    out.append(_BANNER)
+
+    # Deferred import: exporters are only needed once we reach this phase
+    from chuk_mcp_stage.exporters import SceneExporter
+    from chuk_mcp_stage.models import ExportFormat
 
-    final_scene = await manager.get_scene(scene.id)
     vfs = await manager.get_scene_vfs(scene.id)
 
-    # Export 1: JSON (scene data)
-    print("\n📦 Export 1: JSON (Scene Data)")
-    print("-" * 70)
-    json_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.JSON,
-        vfs=vfs,
-        output_path="/exports/scene.json",
+    # The three exports write to disjoint paths, so run them concurrently
+    json_result, r3f_result, remotion_result = await asyncio.gather(
+        SceneExporter.export_scene(
+            scene=scene,
+            format=ExportFormat.JSON,
+            vfs=vfs,
+            output_path="/exports/scene.json",
+        ),
+        SceneExporter.export_scene(
+            scene=scene,
+            format=ExportFormat.R3F_COMPONENT,
+            vfs=vfs,
+            output_path="/exports/r3f",
+        ),
+        SceneExporter.export_scene(
+            scene=scene,
+            format=ExportFormat.REMOTION_PROJECT,
+            vfs=vfs,
+            output_path="/exports/remotion",
+        ),
     )
-    print(f"✓ Exported: {json_result['scene']}")
-    print("  Use case: Backup, API responses, debugging")
-    print("  Artifact URI: artifact://stage/{scene.id}/exports/scene.json")
+
+    # Export 1: JSON (scene data)
+    out.append("\n📦 Export 1: JSON (Scene Data)")
+    out.append(_RULE)
+    out.append(f"✓ Exported: {json_result['scene']}")
+    out.append("  Use case: Backup, API responses, debugging")
+    out.append("  Artifact URI: artifact://stage/{scene.id}/exports/scene.json")
 
     # Export 2: R3F Component
-    print("\n📦 Export 2: React Three Fiber Component")
-    print("-" * 70)
-    r3f_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.R3F_COMPONENT,
-        vfs=vfs,
-        output_path="/exports/r3f",
-    )
-    print(f"✓ Component: {r3f_result['component']}")
+    out.append("\n📦 Export 2: React Three Fiber Component")
+    out.append(_RULE)
+    out.append(f"✓ Component: {r3f_result['component']}")
     if "camera" in r3f_result:
-        print(f"✓ Camera:    {r3f_result['camera']}")
-    print("  Use case: Interactive 3D web experiences")
-    print("  Artifact URI: artifact://stage/{scene.id}/exports/r3f/Scene.tsx")
+        out.append(f"✓ Camera:    {r3f_result['camera']}")
+    out.append("  Use case: Interactive 3D web experiences")
+    out.append("  Artifact URI: artifact://stage/{scene.id}/exports/r3f/Scene.tsx")
 
     # Export 3: Remotion Project
-    print("\n📦 Export 3: Remotion Project (Video Rendering)")
-    print("-" * 70)
-    remotion_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.REMOTION_PROJECT,
-        vfs=vfs,
-        output_path="/exports/remotion",
-    )
-    print(f"✓ Composition: {remotion_result['composition']}")
-    print(f"✓ Root:        {remotion_result['root']}")
-    print(f"✓ Package:     {remotion_result['package']}")
-    print("  Use case: MP4 video export, animations")
-    print("  Artifact URI: artifact://stage/{scene.id}/exports/remotion/")
+    out.append("\n📦 Export 3: Remotion Project (Video Rendering)")
+    out.append(_RULE)
+    out.append(f"✓ Composition: {remotion_result['composition']}")
+    out.append(f"✓ Root:        {remotion_result['root']}")
+    out.append(f"✓ Package:     {remotion_result['package']}")
+    out.append("  Use case: MP4 video export, animations")
+    out.append("  Artifact URI: artifact://stage/{scene.id}/exports/remotion/")
+
+    flush_lines(out)
 
     # ═══════════════════════════════════════════════════════════════
     # SUMMARY
     # ═══════════════════════════════════════════════════════════════
 
-    print("\n" + "═" * 70)
-    print("✅ GOLDEN PATH COMPLETE")
-    print("═" * 70)
-
-    print("\n📊 Scene Summary:")
-    print(f"   Name: {final_scene.name}")
-    print(f"   Objects: {len(final_scene.objects)}")
-    print(f"   Shots: {len(final_scene.shots)}")
-    print("   Duration: 5 seconds")
-
-    print("\n🎨 Objects:")
-    for obj_id, obj in final_scene.objects.items():
-        pos = obj.transform.position
-        physics = "✓ Physics-bound" if obj.physics_binding else "✗ Static"
-        print(
-            f"   • {obj_id:8} {obj.type.value:8} at ({pos.x:4.1f}, {pos.y:4.1f}, {pos.z:4.1f})  {physics}"
-        )
-
-    print("\n📹 Camera Shots:")
-    for shot_id, shot in final_scene.shots.items():
-        mode = shot.camera_path.mode.value
-        label = shot.label or "No label"
-        print(f"   • {shot.start_time:4.1f}s - {shot.end_time:4.1f}s  {mode:8}  {label}")
-
-    print("\n📂 Artifact URIs (Not file contents!):")
-    print(f"   Scene data:  artifact://stage/{scene.id}/exports/scene.json")
-    print(f"   R3F:         artifact://stage/{scene.id}/exports/r3f/Scene.tsx")
-    print(f"   Remotion:    artifact://stage/{scene.id}/exports/remotion/")
-
-    print("\n🎬 Complete Pipeline:")
-    print("   ┌─────────────────────────────────────────────┐")
-    print("   │  1. Authoring   - Define scene structure   │")
-    print("   │  2. Physics     - Create simulation         │")
-    print("   │  3. Binding     - Link objects → bodies     │")
-    print("   │  4. Baking      - Physics → keyframes       │")
-    print("   │  5. Export      - Scene → R3F/Remotion      │")
-    print("   │  6. Render      - Remotion → MP4            │")
-    print("   └─────────────────────────────────────────────┘")
-
-    print("\n💡 To Complete This Workflow:")
-    print()
-    print("   1. Install chuk-mcp-physics:")
-    print("      uvx chuk-mcp-physics")
-    print()
-    print("   2. Create simulation:")
-    print("      sim = await create_simulation(gravity_y=-9.81)")
-    print("      await add_rigid_body(")
-    print("          sim.sim_id,")
-    print("          body_id='ball',")
-    print("          shape='sphere',")
-    print("          radius=0.5,")
-    print("          position=[0, 2, 0],")
-    print("          velocity=[5, 8, 0]  # Throw!")
-    print("      )")
-    print("      await step_simulation(sim.sim_id, steps=300)")
-    print()
-    print("   3. Bake to stage:")
-    print("      await manager.bake_simulation(")
-    print("          scene_id, sim.sim_id, fps=60, duration=5.0")
-    print("      )")
-    print()
-    print("   4. Render with Remotion:")
-    print("      cd exports/remotion")
-    print("      npm install")
-    print("      npm run build")
-    print()
-    print("   🎥 Result: MP4 video with physics-driven ball throw!")
-
-    print("\n🌐 Artifact URI Benefits:")
-    print("   • No inline bloat - returns URIs, not massive JSON")
-    print("   • VFS operations - Use vfs_ls, vfs_read, vfs_cp")
-    print("   • Cross-tool sharing - Other MCP servers can access")
-    print("   • Persistent storage - Scenes survive across sessions")
-
-    print("\n🚀 What Makes This 'Golden Path':")
-    print("   ✓ Shows FULL pipeline (authoring → baking → export)")
-    print("   ✓ Demonstrates two-phase model (declarative → computational)")
-    print("   ✓ Uses artifact URIs (not inline data)")
-    print("   ✓ Integrates with physics oracle (chuk-mcp-physics)")
-    print("   ✓ Exports to multiple formats (JSON, R3F, Remotion)")
-    print("   ✓ Ready for video rendering (Remotion → MP4)")
-
-    # Cleanup
-    await manager.close()
+    out.append("\n" + _BANNER)
+    out.append("✅ GOLDEN PATH COMPLETE")
+    out.append(_BANNER)
+
+    out.append("\n📊 Scene Summary:")
+    out.append(f"   Name: {scene.name}")
+    out.append(f"   Objects: {len(scene.objects)}")
+    out.append(f"   Shots: {len(scene.shots)}")
+    out.append("   Duration: 5 seconds")
+
+    out.append("\n🎨 Objects:")
+    out.extend(
+        f"   • {obj_id:8} {obj.type.value:8} at ({obj.transform.position.x:4.1f}, "
+        f"{obj.transform.position.y:4.1f}, {obj.transform.position.z:4.1f})  "
+        f"{'✓ Physics-bound' if obj.physics_binding else '✗ Static'}"
+        for obj_id, obj in scene.objects.items()
+    )
+
+    out.append("\n📹 Camera Shots:")
+    out.extend(
+        f"   • {shot.start_time:4.1f}s - {shot.end_time:4.1f}s  "
+        f"{shot.camera_path.mode.value:8}  {shot.label or 'No label'}"
+        for shot in scene.shots.values()
+    )
+
+    out.append("\n📂 Artifact URIs (Not file contents!):")
+    out.append(f"   Scene data:  artifact://stage/{scene.id}/exports/scene.json")
+    out.append(f"   R3F:         artifact://stage/{scene.id}/exports/r3f/Scene.tsx")
+    out.append(f"   Remotion:    artifact://stage/{scene.id}/exports/remotion/")
+
+    out.append("\n🎬 Complete Pipeline:")
+    out.append("   ┌─────────────────────────────────────────────┐")
+    out.append("   │  1. Authoring   - Define scene structure   │")
+    out.append("   │  2. Physics     - Create simulation         │")
+    out.append("   │  3. Binding     - Link objects → bodies     │")
+    out.append("   │  4. Baking      - Physics → keyframes       │")
+    out.append("   │  5. Export      - Scene → R3F/Remotion      │")
+    out.append("   │  6. Render      - Remotion → MP4            │")
+    out.append("   └─────────────────────────────────────────────┘")
+
+    out.append("\n💡 To Complete This Workflow:")
+    out.append("")
+    out.append("   1. Install chuk-mcp-physics:")
+    out.append("      uvx chuk-mcp-physics")
+    out.append("")
+    out.append("   2. Create simulation:")
+    out.append("      sim = await create_simulation(gravity_y=-9.81)")
+    out.append("      await add_rigid_body(")
+    out.append("          sim.sim_id,")
+    out.append("          body_id='ball',")
+    out.append("          shape='sphere',")
+    out.append("          radius=0.5,")
+    out.append("          position=[0, 2, 0],")
+    out.append("          velocity=[5, 8, 0]  # Throw!")
+    out.append("      )")
+    out.append("      await step_simulation(sim.sim_id, steps=300)")
+    out.append("")
+    out.append("   3. Bake to stage:")
+    out.append("      await manager.bake_simulation(")
+    out.append("          scene_id, sim.sim_id, fps=60, duration=5.0")
+    out.append("      )")
+    out.append("")
+    out.append("   4. Render with Remotion:")
+    out.append("      cd exports/remotion")
+    out.append("      npm install")
+    out.append("      npm run build")
+    out.append("")
+    out.append("   🎥 Result: MP4 video with physics-driven ball throw!")
+
+    out.append("\n🌐 Artifact URI Benefits:")
+    out.append("   • No inline bloat - returns URIs, not massive JSON")
+    out.append("   • VFS operations - Use vfs_ls, vfs_read, vfs_cp")
+    out.append("   • Cross-tool sharing - Other MCP servers can access")
+    out.append("   • Persistent storage - Scenes survive across sessions")
+
+    out.append("\n🚀 What Makes This 'Golden Path':")
+    out.append("   ✓ Shows FULL pipeline (authoring → baking → export)")
+    out.append("   ✓ Demonstrates two-phase model (declarative → computational)")
+    out.append("   ✓ Uses artifact URIs (not inline data)")
+    out.append("   ✓ Integrates with physics oracle (chuk-mcp-physics)")
+    out.append("   ✓ Exports to multiple formats (JSON, R3F, Remotion)")
+    out.append("   ✓ Ready for video rendering (Remotion → MP4)")
+
+    flush_lines(out)
+
+    # Cleanup (the cached manager is kept alive under pytest or CHUK_KEEP_MANAGER)
+    await release_manager(manager)
 
 
 if __name__ == "__main__":
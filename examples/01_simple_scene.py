@@ -5,61 +5,49 @@ Demonstrates basic scene creation, object placement, and camera setup.
 
 import asyncio
 
+from _shared import flush_lines, get_manager, release_manager
+
 from chuk_mcp_stage import (
     CameraPath,
     CameraPathMode,
     EasingFunction,
-    Material,
     MaterialPreset,
     ObjectType,
-    SceneManager,
     SceneObject,
     Shot,
     Transform,
-    Vector3,
+    material_preset,
+    vec3,
 )
 
 
 async def main():
     """Create a simple scene with a falling ball."""
-    print("Creating simple falling ball scene...")
+    out: list[str] = []
+    out.append("Creating simple falling ball scene...")
 
-    # Create scene manager
-    manager = SceneManager()
+    # Get the shared scene manager
+    manager = get_manager()
 
-    # 1. Create scene
-    scene = await manager.create_scene(
-        scene_id="falling-ball",
-        name="Falling Ball Demo",
-    )
-    print(f"✓ Created scene: {scene.id}")
-
-    # 2. Add ground plane
+    # 1. Define ground plane
     ground = SceneObject(
         id="ground",
         type=ObjectType.PLANE,
-        transform=Transform(position=Vector3(x=0, y=0, z=0)),
-        size=Vector3(x=20, y=20, z=1),
-        material=Material(preset=MaterialPreset.METAL_DARK),
+        transform=Transform(position=vec3(0, 0, 0)),
+        size=vec3(20, 20, 1),
+        material=material_preset(MaterialPreset.METAL_DARK),
     )
-    await manager.add_object(scene.id, ground)
-    print("✓ Added ground plane")
 
-    # 3. Add falling ball
+    # 2. Define falling ball
     ball = SceneObject(
         id="ball",
         type=ObjectType.SPHERE,
-        transform=Transform(position=Vector3(x=0, y=5, z=0)),
+        transform=Transform(position=vec3(0, 5, 0)),
         radius=1.0,
-        material=Material(
-            preset=MaterialPreset.GLASS_BLUE,
-            color={"r": 0.3, "g": 0.5, "b": 1.0},
-        ),
+        material=material_preset(MaterialPreset.GLASS_BLUE, color=(0.3, 0.5, 1.0)),
     )
-    await manager.add_object(scene.id, ball)
-    print("✓ Added ball at (0, 5, 0)")
 
-    # 4. Add orbiting camera shot
+    # 3. Define orbiting camera shot
     shot = Shot(
         id="orbit-shot",
         camera_path=CameraPath(
@@ -73,29 +61,41 @@ async def main():
         end_time=10.0,
         easing=EasingFunction.EASE_IN_OUT_CUBIC,
     )
-    await manager.add_shot(scene.id, shot)
-    print("✓ Added orbit camera shot (10s)")
 
-    # 5. Get final scene
-    final_scene = await manager.get_scene(scene.id)
-    print("\n📋 Final scene summary:")
-    print(f"   Name: {final_scene.name}")
-    print(f"   Objects: {len(final_scene.objects)}")
-    print(f"   Shots: {len(final_scene.shots)}")
-
-    for obj_id, obj in final_scene.objects.items():
-        print(
-            f"   - {obj_id}: {obj.type.value} at ({obj.transform.position.x}, {obj.transform.position.y}, {obj.transform.position.z})"
-        )
+    # 4. Create the scene with all of its content in a single save
+    scene = await manager.create_scene(
+        scene_id="falling-ball",
+        name="Falling Ball Demo",
+        objects=[ground, ball],
+        shots=[shot],
+    )
+    out.append(f"✓ Created scene: {scene.id}")
+    out.append("✓ Added ground plane")
+    out.append("✓ Added ball at (0, 5, 0)")
+    out.append("✓ Added orbit camera shot (10s)")
+
+    # 5. Summarize (scene is the manager's live instance - no refetch needed)
+    out.append("\n📋 Final scene summary:")
+    out.append(f"   Name: {scene.name}")
+    out.append(f"   Objects: {len(scene.objects)}")
+    out.append(f"   Shots: {len(scene.shots)}")
+
+    out.extend(
+        f"   - {obj_id}: {obj.type.value} at ({obj.transform.position.x}, "
+        f"{obj.transform.position.y}, {obj.transform.position.z})"
+        for obj_id, obj in scene.objects.items()
+    )
+    out.extend(
+        f"   - {shot_id}: {shot.camera_path.mode.value} ({shot.end_time - shot.start_time}s)"
+        for shot_id, shot in scene.shots.items()
+    )
 
-    for shot_id, shot in final_scene.shots.items():
-        duration = shot.end_time - shot.start_time
-        print(f"   - {shot_id}: {shot.camera_path.mode.value} ({duration}s)")
+    out.append("\n✅ Scene created successfully!")
 
-    print("\n✅ Scene created successfully!")
+    flush_lines(out)
 
-    # Cleanup
-    await manager.close()
+    # Cleanup (the cached manager is kept alive under pytest or CHUK_KEEP_MANAGER)
+    await release_manager(manager)
 
 
 if __name__ == "__main__":
@@ -6,8 +6,8 @@ Shows all camera movement modes and easing functions available in chuk-mcp-stage
 import asyncio
 
 from chuk_mcp_stage import (
-    CameraPath,
-    CameraPathMode,
+    V_ONE,
+    V_ZERO,
     EasingFunction,
     Material,
     MaterialPreset,
@@ -17,15 +17,27 @@ from chuk_mcp_stage import (
     Shot,
     Transform,
     Vector3,
+    vec3,
 )
 
+from _shared import shared_manager
 
-async def main():
-    """Demonstrate all camera shot types."""
-    print("🎬 Camera Shots & Cinematography Demo")
-    print("=" * 60)
+# Banner rules, built once per process rather than on every main() call
+_BAR = "=" * 60
+
+# (x, z) positions of the surrounding boxes: radius 5 at 0, 90, 180 and 270 degrees.
+# Exact constants, so no per-box trig (and no -0.0 / 3e-16 rounding noise).
+_BOX_RING = ((5.0, 0.0), (0.0, 5.0), (-5.0, 0.0), (0.0, -5.0))
 
-    manager = SceneManager()
+
+async def main(manager: SceneManager) -> None:
+    """Demonstrate all camera shot types.
+
+    Args:
+        manager: SceneManager to build the scene with
+    """
+    print("🎬 Camera Shots & Cinematography Demo")
+    print(_BAR)
 
     # Create scene
     print("\n📋 Step 1: Creating scene...")
@@ -35,185 +47,161 @@ async def main():
     )
     print(f"✓ Scene created: {scene.id}")
 
+    # Objects are built from literal, known-valid values, so model_construct
+    # skips re-validating them (the server tools still validate their inputs)
     # Add a central object to focus on
     print("\n🎨 Step 2: Adding scene objects...")
 
     # Central sphere
-    center = SceneObject(
+    center = SceneObject.model_construct(
         id="center",
         type=ObjectType.SPHERE,
-        transform=Transform(position=Vector3(x=0, y=1.5, z=0)),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=0.0, y=1.5, z=0.0)),
         radius=1.0,
-        material=Material(preset=MaterialPreset.GLASS_BLUE),
+        material=Material.of(MaterialPreset.GLASS_BLUE),
     )
-    await manager.add_object(scene.id, center)
     print("✓ Added center sphere")
 
     # Ground plane
-    ground = SceneObject(
+    ground = SceneObject.model_construct(
         id="ground",
         type=ObjectType.PLANE,
-        transform=Transform(position=Vector3(x=0, y=0, z=0)),
-        size=Vector3(x=30, y=30, z=1),
-        material=Material(preset=MaterialPreset.METAL_DARK),
+        transform=Transform.model_construct(position=V_ZERO),
+        size=Vector3.model_construct(x=30.0, y=30.0, z=1.0),
+        material=Material.of(MaterialPreset.METAL_DARK),
     )
-    await manager.add_object(scene.id, ground)
     print("✓ Added ground plane")
 
-    # Add some surrounding objects for depth
-    for i in range(4):
-        angle = i * 90  # 0, 90, 180, 270 degrees
-        import math
-
-        rad = math.radians(angle)
-        x = math.cos(rad) * 5
-        z = math.sin(rad) * 5
+    objects = [center, ground]
 
-        box = SceneObject(
+    # Add some surrounding objects for depth
+    for i, (x, z) in enumerate(_BOX_RING):
+        box = SceneObject.model_construct(
             id=f"box-{i}",
             type=ObjectType.BOX,
-            transform=Transform(position=Vector3(x=x, y=0.5, z=z)),
-            size=Vector3(x=1, y=1, z=1),
-            material=Material(preset=MaterialPreset.PLASTIC_RED),
+            transform=Transform.model_construct(position=Vector3.model_construct(x=x, y=0.5, z=z)),
+            size=V_ONE,
+            material=Material.of(MaterialPreset.PLASTIC_RED),
         )
-        await manager.add_object(scene.id, box)
+        objects.append(box)
     print("✓ Added 4 surrounding boxes")
 
+    # Persist all objects in one batch
+    await manager.add_objects(scene.id, objects)
+
     # Add camera shots showcasing different modes
     print("\n📹 Step 3: Adding camera shots...")
 
-    # Shot 1: ORBIT - Classic orbiting camera
-    shot1 = Shot(
-        id="orbit-shot",
-        camera_path=CameraPath(
-            mode=CameraPathMode.ORBIT,
-            focus="center",
-            radius=8.0,
-            elevation=25.0,
-            speed=0.05,  # Slow orbit (0.05 revolutions/second)
-        ),
+    # Shot 1: ORBIT - Classic orbiting camera (0.05 revolutions/second)
+    shot1 = Shot.orbit(
+        "orbit-shot",
+        focus="center",
+        radius=8.0,
+        elevation=25.0,
+        speed=0.05,
         start_time=0.0,
         end_time=10.0,
-        easing=EasingFunction.EASE_IN_OUT_CUBIC,
         label="Smooth orbit around center",
     )
-    await manager.add_shot(scene.id, shot1)
     print("✓ Shot 1: ORBIT (10s, smooth)")
 
     # Shot 2: STATIC - Fixed camera position
-    shot2 = Shot(
-        id="static-shot",
-        camera_path=CameraPath(
-            mode=CameraPathMode.STATIC,
-            position=Vector3(x=10, y=3, z=10),
-            look_at=Vector3(x=0, y=1.5, z=0),
-        ),
+    shot2 = Shot.static(
+        "static-shot",
+        position=vec3(10.0, 3.0, 10.0),
+        look_at=vec3(0.0, 1.5, 0.0),
         start_time=10.0,
         end_time=15.0,
         easing=EasingFunction.LINEAR,
         label="Static wide angle",
     )
-    await manager.add_shot(scene.id, shot2)
     print("✓ Shot 2: STATIC (5s, wide angle)")
 
     # Shot 3: DOLLY - Camera moves along a path
-    shot3 = Shot(
-        id="dolly-shot",
-        camera_path=CameraPath(
-            mode=CameraPathMode.DOLLY,
-            start_position=Vector3(x=-10, y=2, z=0),
-            end_position=Vector3(x=10, y=2, z=0),
-            look_at=Vector3(x=0, y=1.5, z=0),
-        ),
+    shot3 = Shot.dolly(
+        "dolly-shot",
+        from_position=vec3(-10.0, 2.0, 0.0),
+        to_position=vec3(10.0, 2.0, 0.0),
+        look_at=vec3(0.0, 1.5, 0.0),
         start_time=15.0,
         end_time=22.0,
-        easing=EasingFunction.EASE_IN_OUT_CUBIC,
         label="Dolly tracking shot",
     )
-    await manager.add_shot(scene.id, shot3)
     print("✓ Shot 3: DOLLY (7s, left to right)")
 
     # Shot 4: CHASE - Follow a moving object
-    shot4 = Shot(
-        id="chase-shot",
-        camera_path=CameraPath(
-            mode=CameraPathMode.CHASE,
-            target="center",
-            offset=Vector3(x=0, y=2, z=-5),
-            look_ahead=True,
-        ),
+    shot4 = Shot.chase(
+        "chase-shot",
+        focus="center",
+        offset=vec3(0.0, 2.0, -5.0),
         start_time=22.0,
         end_time=28.0,
         easing=EasingFunction.SPRING,
         label="Chase camera with spring easing",
     )
-    await manager.add_shot(scene.id, shot4)
     print("✓ Shot 4: CHASE (6s, spring easing)")
 
     # Shot 5: ORBIT with different easing - Fast spin
-    shot5 = Shot(
-        id="fast-orbit",
-        camera_path=CameraPath(
-            mode=CameraPathMode.ORBIT,
-            focus="center",
-            radius=6.0,
-            elevation=15.0,
-            speed=0.2,  # Faster spin
-        ),
+    shot5 = Shot.orbit(
+        "fast-orbit",
+        focus="center",
+        radius=6.0,
+        elevation=15.0,
+        speed=0.2,
         start_time=28.0,
         end_time=33.0,
         easing=EasingFunction.LINEAR,
         label="Fast linear orbit",
     )
-    await manager.add_shot(scene.id, shot5)
     print("✓ Shot 5: FAST ORBIT (5s, linear)")
 
     # Shot 6: STATIC - Low angle dramatic
-    shot6 = Shot(
-        id="low-angle",
-        camera_path=CameraPath(
-            mode=CameraPathMode.STATIC,
-            position=Vector3(x=3, y=0.5, z=3),
-            look_at=Vector3(x=0, y=2, z=0),
-        ),
+    shot6 = Shot.static(
+        "low-angle",
+        position=vec3(3.0, 0.5, 3.0),
+        look_at=vec3(0.0, 2.0, 0.0),
         start_time=33.0,
         end_time=38.0,
         easing=EasingFunction.EASE_OUT_CUBIC,
         label="Low angle hero shot",
     )
-    await manager.add_shot(scene.id, shot6)
     print("✓ Shot 6: LOW ANGLE STATIC (5s)")
 
+    # Persist all shots in one batch
+    await manager.add_shots(scene.id, [shot1, shot2, shot3, shot4, shot5, shot6])
+
     # Get final scene
     print("\n📊 Step 4: Scene summary...")
-    final_scene = await manager.get_scene(scene.id)
+    final_scene = manager.snapshot(scene.id)
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("✅ CAMERA SHOTS DEMO COMPLETE")
-    print("=" * 60)
+    print(_BAR)
 
     print(f"\n📋 Scene: {final_scene.name}")
     print(f"   Objects: {len(final_scene.objects)}")
     print(f"   Shots: {len(final_scene.shots)}")
     print("   Total duration: 38 seconds")
 
-    print("\n🎨 Objects:")
-    for obj_id, obj in final_scene.objects.items():
-        pos = obj.transform.position
-        print(f"   • {obj_id:12} {obj.type.value:8} at ({pos.x:5.1f}, {pos.y:5.1f}, {pos.z:5.1f})")
-
-    print("\n📹 Shot Sequence:")
-    total_time = 0
-    for shot_id, shot in final_scene.shots.items():
-        duration = shot.end_time - shot.start_time
-        mode = shot.camera_path.mode.value
-        easing = shot.easing.value if shot.easing else "default"
-        label = shot.label or "No label"
-
-        print(f"   • {shot.start_time:5.1f}s - {shot.end_time:5.1f}s ({duration:4.1f}s)")
-        print(f"     {shot_id:15} Mode: {mode:8} Easing: {easing}")
-        print(f"     Label: {label}")
-        total_time = max(total_time, shot.end_time)
+    # Build each listing as one string so it goes out in a single write
+    object_lines = [
+        f"   • {obj_id:12} {obj.type.value:8} at "
+        f"({obj.transform.position.x:5.1f}, {obj.transform.position.y:5.1f}, "
+        f"{obj.transform.position.z:5.1f})"
+        for obj_id, obj in final_scene.objects.items()
+    ]
+    print("\n🎨 Objects:\n" + "\n".join(object_lines))
+
+    shot_lines = [
+        f"   • {shot.start_time:5.1f}s - {shot.end_time:5.1f}s "
+        f"({shot.end_time - shot.start_time:4.1f}s)\n"
+        f"     {shot_id:15} Mode: {shot.camera_path.mode.value:8} "
+        f"Easing: {shot.easing.value if shot.easing else 'default'}\n"
+        f"     Label: {shot.label or 'No label'}"
+        for shot_id, shot in final_scene.shots.items()
+    ]
+    print("\n📹 Shot Sequence:\n" + "\n".join(shot_lines))
+    total_time = max((shot.end_time for shot in final_scene.shots.values()), default=0)
 
     print(f"\n⏱️  Total Timeline: {total_time} seconds")
 
@@ -235,9 +223,12 @@ async def main():
     print("   3. Export to Remotion for final video rendering")
     print("   4. Try different easing functions and timings")
 
-    # Cleanup
-    await manager.close()
+
+async def run() -> None:
+    """Run the example with the shared manager."""
+    async with shared_manager() as manager:
+        await main(manager)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
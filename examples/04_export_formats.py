@@ -1,17 +1,20 @@
 """Export formats demonstration.
 
 Shows how to export the same scene to different formats:
-- JSON (scene data)
+- JSON (scene data, pretty-printed and compact)
 - R3F Component (React Three Fiber)
 - Remotion Project (video rendering)
-- glTF (3D model format)
+- glTF (3D model format, text and binary .glb)
 """
 
 import asyncio
 
+import orjson
+from _shared import shared_manager
+
 from chuk_mcp_stage import (
-    CameraPath,
-    CameraPathMode,
+    V_ONE,
+    V_ZERO,
     EasingFunction,
     ExportFormat,
     Material,
@@ -25,13 +28,19 @@ from chuk_mcp_stage import (
 )
 from chuk_mcp_stage.exporters import SceneExporter
 
+# Banner rules, built once per process rather than on every main() call
+_BAR = "=" * 60
+_RULE = "-" * 60
 
-async def main():
-    """Demonstrate exporting to all supported formats."""
-    print("📦 Export Formats Demo")
-    print("=" * 60)
 
-    manager = SceneManager()
+async def main(manager: SceneManager) -> None:
+    """Demonstrate exporting to all supported formats.
+
+    Args:
+        manager: SceneManager to build the scene with
+    """
+    print("📦 Export Formats Demo")
+    print(_BAR)
 
     # Create a simple but complete scene
     print("\n📋 Step 1: Creating demo scene...")
@@ -41,108 +50,143 @@ async def main():
     )
     print(f"✓ Scene created: {scene.id}")
 
+    # Objects are built from literal, known-valid values, so model_construct
+    # skips re-validating them (the server tools still validate their inputs)
     # Add objects
     print("\n🎨 Step 2: Adding objects...")
 
     # Ground
-    ground = SceneObject(
+    ground = SceneObject.model_construct(
         id="ground",
         type=ObjectType.PLANE,
-        transform=Transform(position=Vector3(x=0, y=0, z=0)),
-        size=Vector3(x=20, y=20, z=1),
-        material=Material(preset=MaterialPreset.METAL_DARK),
+        transform=Transform.model_construct(position=V_ZERO),
+        size=Vector3.model_construct(x=20.0, y=20.0, z=1.0),
+        material=Material.of(MaterialPreset.METAL_DARK),
     )
-    await manager.add_object(scene.id, ground)
 
     # Center sphere
-    sphere = SceneObject(
+    sphere = SceneObject.model_construct(
         id="sphere",
         type=ObjectType.SPHERE,
-        transform=Transform(position=Vector3(x=0, y=2, z=0)),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=0.0, y=2.0, z=0.0)),
         radius=1.5,
-        material=Material(
-            preset=MaterialPreset.GLASS_BLUE,
-            color={"r": 0.2, "g": 0.5, "b": 1.0},
-        ),
+        material=Material.of(MaterialPreset.GLASS_BLUE, color=(0.2, 0.5, 1.0)),
     )
-    await manager.add_object(scene.id, sphere)
 
     # Boxes
-    box1 = SceneObject(
+    box1 = SceneObject.model_construct(
         id="box-red",
         type=ObjectType.BOX,
-        transform=Transform(position=Vector3(x=-3, y=0.5, z=0)),
-        size=Vector3(x=1, y=1, z=1),
-        material=Material(preset=MaterialPreset.PLASTIC_RED),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=-3.0, y=0.5, z=0.0)),
+        size=V_ONE,
+        material=Material.of(MaterialPreset.PLASTIC_RED),
     )
-    await manager.add_object(scene.id, box1)
 
-    box2 = SceneObject(
+    box2 = SceneObject.model_construct(
         id="box-blue",
         type=ObjectType.BOX,
-        transform=Transform(position=Vector3(x=3, y=0.5, z=0)),
-        size=Vector3(x=1, y=1, z=1),
-        material=Material(preset=MaterialPreset.PLASTIC_BLUE),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=3.0, y=0.5, z=0.0)),
+        size=V_ONE,
+        material=Material.of(MaterialPreset.PLASTIC_BLUE),
     )
-    await manager.add_object(scene.id, box2)
-
+    await manager.add_objects(scene.id, [ground, sphere, box1, box2])
     print("✓ Added 4 objects (1 plane, 1 sphere, 2 boxes)")
 
     # Add camera shot
     print("\n📹 Step 3: Adding camera shot...")
-    shot = Shot(
-        id="main-shot",
-        camera_path=CameraPath(
-            mode=CameraPathMode.ORBIT,
-            focus="sphere",
-            radius=8.0,
-            elevation=30.0,
-            speed=0.1,
-        ),
+    shot = Shot.orbit(
+        "main-shot",
+        focus="sphere",
+        radius=8.0,
+        elevation=30.0,
+        speed=0.1,
         start_time=0.0,
         end_time=10.0,
         easing=EasingFunction.EASE_IN_OUT_CUBIC,
     )
-    await manager.add_shot(scene.id, shot)
+    await manager.add_shots(scene.id, [shot])
     print("✓ Added orbit camera shot")
 
     # Get the scene for export
-    final_scene = await manager.get_scene(scene.id)
+    final_scene = manager.snapshot(scene.id)
 
     # Get VFS for exports
     vfs = await manager.get_scene_vfs(scene.id)
 
     # Export to all formats
     print("\n📦 Step 4: Exporting to all formats...")
-    print("=" * 60)
+    print(_BAR)
+
+    # The JSON and R3F exports all read the same dump, so take it once and share it
+    scene_data = final_scene.model_dump(mode="json")
+
+    # Each format writes to its own path, so run the exports concurrently
+    (
+        json_result,
+        compact_result,
+        r3f_result,
+        remotion_result,
+        gltf_result,
+        glb_result,
+    ) = await asyncio.gather(
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.JSON,
+            vfs=vfs,
+            output_path="/exports/scene.json",
+            scene_data=scene_data,
+        ),
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.JSON_COMPACT,
+            vfs=vfs,
+            output_path="/exports/scene.min.json",
+            scene_data=scene_data,
+        ),
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.R3F_COMPONENT,
+            vfs=vfs,
+            output_path="/exports/r3f",
+            scene_data=scene_data,
+        ),
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.REMOTION_PROJECT,
+            vfs=vfs,
+            output_path="/exports/remotion",
+        ),
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.GLTF,
+            vfs=vfs,
+            output_path="/exports/scene.gltf",
+        ),
+        SceneExporter.export_scene(
+            scene=final_scene,
+            format=ExportFormat.GLB,
+            vfs=vfs,
+            output_path="/exports/scene.glb",
+        ),
+    )
 
     # 1. JSON Export
     print("\n1️⃣  JSON Export")
-    print("-" * 60)
-    json_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.JSON,
-        vfs=vfs,
-        output_path="/exports/scene.json",
-    )
+    print(_RULE)
     print(f"✓ Exported to: {json_result['scene']}")
     print("   Use case: Scene data backup, API responses, debugging")
     print("   Contains: Full scene graph, materials, transforms, shots")
 
-    # Read and show snippet
-    json_content = await vfs.read_text(json_result["scene"])
-    print(f"   File size: {len(json_content)} characters")
+    # The exporter reports its size, so there is no need to read the file back
+    print(f"   File size: {json_result['bytes_written']} bytes")
     print("   Preview: { id, name, objects, shots, environment, ... }")
+    print(f"✓ Compact:     {compact_result['scene']} (format='json-compact')")
+    print(f"   File size: {compact_result['bytes_written']} bytes")
+    print("   Same data, minified - smaller and faster to parse")
 
     # 2. R3F Component Export
     print("\n2️⃣  React Three Fiber (R3F) Component")
-    print("-" * 60)
-    r3f_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.R3F_COMPONENT,
-        vfs=vfs,
-        output_path="/exports/r3f",
-    )
+    print(_RULE)
     print(f"✓ Component: {r3f_result['component']}")
     if "camera" in r3f_result:
         print(f"✓ Camera:    {r3f_result['camera']}")
@@ -150,24 +194,17 @@ async def main():
     print("   Framework: React + Three.js")
     print("   Features: Camera controls, orbit controls, materials")
 
-    # Show component preview
-    component_content = await vfs.read_text(r3f_result["component"])
-    print(f"   Lines: {len(component_content.splitlines())}")
+    # Show component preview (the line count comes from the export result)
+    print(f"   Lines: {r3f_result['line_count']}")
     print("   Preview:")
-    lines = component_content.splitlines()[:5]
-    for line in lines:
+    component_content = await vfs.read_text(r3f_result["component"])
+    for line in component_content.splitlines()[:5]:
         print(f"      {line}")
     print("      ...")
 
     # 3. Remotion Project Export
     print("\n3️⃣  Remotion Project")
-    print("-" * 60)
-    remotion_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.REMOTION_PROJECT,
-        vfs=vfs,
-        output_path="/exports/remotion",
-    )
+    print(_RULE)
     print(f"✓ Composition: {remotion_result['composition']}")
     print(f"✓ Root:        {remotion_result['root']}")
     print(f"✓ Package:     {remotion_result['package']}")
@@ -177,10 +214,7 @@ async def main():
     print(f"   Duration:  {10 * 30} frames @ 30 FPS (10 seconds)")
 
     # Show package.json
-    package_content = await vfs.read_text(remotion_result["package"])
-    import json as json_module
-
-    package_data = json_module.loads(package_content)
+    package_data = orjson.loads(await vfs.read_binary(remotion_result["package"]))
     print(f"   Project name: {package_data['name']}")
     print("   Scripts:")
     for script, cmd in package_data["scripts"].items():
@@ -188,23 +222,18 @@ async def main():
 
     # 4. glTF Export
     print("\n4️⃣  glTF (GL Transmission Format)")
-    print("-" * 60)
-    gltf_result = await SceneExporter.export_scene(
-        scene=final_scene,
-        format=ExportFormat.GLTF,
-        vfs=vfs,
-        output_path="/exports/scene.gltf",
-    )
+    print(_RULE)
     print(f"✓ Exported to: {gltf_result['gltf']}")
+    print(f"✓ Binary:      {glb_result['glb']} (format='glb')")
     print("   Use case: 3D model exchange, game engines, AR/VR")
     print("   Format: Industry standard 3D interchange")
     print("   Compatible with: Blender, Unity, Unreal, Three.js")
     print("   Contains: Meshes, materials, transforms (simplified)")
 
     # Summary
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("✅ EXPORT COMPLETE")
-    print("=" * 60)
+    print(_BAR)
 
     print("\n📊 Summary:")
     print(f"   Scene: {final_scene.name}")
@@ -225,7 +254,7 @@ async def main():
     print("   JSON        | Data storage/API            | Single .json file")
     print("   R3F         | Interactive web 3D          | .tsx components")
     print("   Remotion    | Video rendering             | Full project folder")
-    print("   glTF        | 3D model interchange        | .gltf file")
+    print("   glTF        | 3D model interchange        | .gltf / .glb file")
 
     print("\n💡 Next Steps:")
     print("   JSON:")
@@ -248,9 +277,12 @@ async def main():
     print("      - Import to game engine")
     print("      - Use in AR/VR applications")
 
-    # Cleanup
-    await manager.close()
+
+async def run() -> None:
+    """Run the example with the shared manager."""
+    async with shared_manager() as manager:
+        await main(manager)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
@@ -11,13 +11,18 @@ NOTE: This example demonstrates the workflow. For actual physics simulation,
 you would use chuk-mcp-physics to create and run the simulation first.
 
 The baking step uses the public Rapier service at https://rapier.chukai.io by default.
+
+Pass --verbose to also print the pipeline diagram and the next-steps guide.
 """
 
+import argparse
 import asyncio
 
+from _shared import shared_manager
+
 from chuk_mcp_stage import (
-    CameraPath,
-    CameraPathMode,
+    V_ONE,
+    V_ZERO,
     EasingFunction,
     ExportFormat,
     Material,
@@ -29,26 +34,87 @@ from chuk_mcp_stage import (
     Shot,
     Transform,
     Vector3,
+    vec3,
 )
 from chuk_mcp_stage.exporters import SceneExporter
 
-
-async def main():
-    """Demonstrate full physics-to-video workflow."""
+# Banner rules, built once per process rather than on every main() call
+_BAR = "=" * 60
+_RULE = "-" * 60
+
+_PIPELINE_BOX = """\
+   ┌─────────────────────────────────────────────────┐
+   │  1. Physics Simulation (chuk-mcp-physics)      │
+   │     ↓                                           │
+   │  2. Scene Composition (chuk-mcp-stage) ✓       │
+   │     ↓                                           │
+   │  3. Bind Physics ✓                             │
+   │     ↓                                           │
+   │  4. Bake Simulation (Rapier service)           │
+   │     ↓                                           │
+   │  5. Export (R3F/Remotion) ✓                    │
+   │     ↓                                           │
+   │  6. Render Video (Remotion)                    │
+   └─────────────────────────────────────────────────┘"""
+
+
+_NEXT_STEPS = f"""
+🎬 Complete Pipeline:
+{_PIPELINE_BOX}
+
+💡 To Complete This Workflow:
+
+   1. Install chuk-mcp-physics:
+      uvx chuk-mcp-physics
+
+   2. Create simulation:
+      sim = await create_simulation(gravity_y=-9.81)
+      await add_rigid_body(sim.sim_id, 'ball', ...)
+      await add_rigid_body(sim.sim_id, 'box', ...)
+      await step_simulation(sim.sim_id, steps=600)
+
+   3. Bake to scene:
+      await stage_bake_simulation(
+          scene_id, sim.sim_id, fps=60, duration=10.0
+      )
+
+   4. Render with Remotion:
+      cd exports/remotion
+      npm install
+      npm run build
+
+   🎥 Result: MP4 video with physics-driven animation!
+
+🌐 Public Rapier Service Info:
+   URL: https://rapier.chukai.io
+   Status: Available (no auth required)
+   Use case: Physics baking, trajectory recording
+   Rate limits: May apply for heavy usage
+
+   To use local service:
+      export RAPIER_SERVICE_URL=http://localhost:9000
+      docker run -p 9000:9000 chuk-rapier-service"""
+
+
+async def main(manager: SceneManager, verbose: bool = False) -> None:
+    """Demonstrate full physics-to-video workflow.
+
+    Args:
+        manager: SceneManager to build the scene with
+        verbose: Also print the pipeline diagram and next-steps guide
+    """
     print("🎬 Full Physics-to-Video Workflow")
-    print("=" * 60)
+    print(_BAR)
     print()
     print("This example shows the complete pipeline from physics")
     print("simulation to rendered video output.")
     print()
     print("🌐 Using public Rapier service: https://rapier.chukai.io")
-    print("=" * 60)
-
-    manager = SceneManager()
+    print(_BAR)
 
     # Step 1: Create Scene
     print("\n📋 STEP 1: Create 3D Scene")
-    print("-" * 60)
+    print(_RULE)
     scene = await manager.create_scene(
         scene_id="physics-workflow",
         name="Physics Workflow Demo",
@@ -56,45 +122,44 @@ async def main():
     )
     print(f"✓ Scene created: {scene.id}")
 
+    # Objects are built from literal, known-valid values, so model_construct
+    # skips re-validating them (the server tools still validate their inputs)
     # Add ground plane (static)
-    ground = SceneObject(
+    ground = SceneObject.model_construct(
         id="ground",
         type=ObjectType.PLANE,
-        transform=Transform(position=Vector3(x=0, y=0, z=0)),
-        size=Vector3(x=20, y=20, z=1),
-        material=Material(preset=MaterialPreset.METAL_DARK),
+        transform=Transform.model_construct(position=V_ZERO),
+        size=Vector3.model_construct(x=20.0, y=20.0, z=1.0),
+        material=Material.of(MaterialPreset.METAL_DARK),
     )
-    await manager.add_object(scene.id, ground)
     print("✓ Added ground plane (static)")
 
     # Add falling sphere
-    ball = SceneObject(
+    ball = SceneObject.model_construct(
         id="ball",
         type=ObjectType.SPHERE,
-        transform=Transform(position=Vector3(x=0, y=10, z=0)),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=0.0, y=10.0, z=0.0)),
         radius=1.0,
-        material=Material(
-            preset=MaterialPreset.GLASS_BLUE,
-            color={"r": 0.3, "g": 0.6, "b": 1.0},
-        ),
+        material=Material.of(MaterialPreset.GLASS_BLUE, color=(0.3, 0.6, 1.0)),
     )
-    await manager.add_object(scene.id, ball)
     print("✓ Added ball at (0, 10, 0) - will fall")
 
     # Add a box that will also fall
-    box = SceneObject(
+    box = SceneObject.model_construct(
         id="box",
         type=ObjectType.BOX,
-        transform=Transform(position=Vector3(x=3, y=8, z=0)),
-        size=Vector3(x=1, y=1, z=1),
-        material=Material(preset=MaterialPreset.PLASTIC_RED),
+        transform=Transform.model_construct(position=Vector3.model_construct(x=3.0, y=8.0, z=0.0)),
+        size=V_ONE,
+        material=Material.of(MaterialPreset.PLASTIC_RED),
     )
-    await manager.add_object(scene.id, box)
     print("✓ Added box at (3, 8, 0) - will fall")
 
+    # Persist all objects in one batch
+    await manager.add_objects(scene.id, [ground, ball, box])
+
     # Step 2: Physics Binding (Conceptual)
     print("\n⚙️  STEP 2: Physics Binding (Conceptual)")
-    print("-" * 60)
+    print(_RULE)
     print("In a real workflow, you would:")
     print("  1. Create physics simulation via chuk-mcp-physics:")
     print("     sim = await create_simulation(gravity_y=-9.81)")
@@ -127,46 +192,40 @@ async def main():
 
     # Step 3: Camera Setup
     print("\n📹 STEP 3: Camera Setup")
-    print("-" * 60)
+    print(_RULE)
 
     # Orbit shot to see the whole scene
-    orbit_shot = Shot(
-        id="orbit-overview",
-        camera_path=CameraPath(
-            mode=CameraPathMode.ORBIT,
-            focus="ball",
-            radius=15.0,
-            elevation=25.0,
-            speed=0.05,
-        ),
+    orbit_shot = Shot.orbit(
+        "orbit-overview",
+        focus="ball",
+        radius=15.0,
+        elevation=25.0,
+        speed=0.05,
         start_time=0.0,
         end_time=5.0,
         easing=EasingFunction.EASE_IN_OUT_CUBIC,
         label="Wide orbit overview",
     )
-    await manager.add_shot(scene.id, orbit_shot)
     print("✓ Added orbit shot (0-5s)")
 
     # Chase shot following the ball
-    chase_shot = Shot(
-        id="chase-ball",
-        camera_path=CameraPath(
-            mode=CameraPathMode.CHASE,
-            target="ball",
-            offset=Vector3(x=0, y=2, z=-5),
-            look_ahead=True,
-        ),
+    chase_shot = Shot.chase(
+        "chase-ball",
+        focus="ball",
+        offset=vec3(0.0, 2.0, -5.0),
         start_time=5.0,
         end_time=10.0,
         easing=EasingFunction.SPRING,
         label="Chase falling ball",
     )
-    await manager.add_shot(scene.id, chase_shot)
     print("✓ Added chase shot (5-10s)")
 
+    # Persist both shots in one batch
+    await manager.add_shots(scene.id, [orbit_shot, chase_shot])
+
     # Step 4: Bake Simulation
     print("\n🔥 STEP 4: Bake Physics Simulation")
-    print("-" * 60)
+    print(_RULE)
     print("⚠️  NOTE: This step requires an actual physics simulation.")
     print("    In this demo, we'll show the command but skip execution.")
     print()
@@ -199,9 +258,9 @@ async def main():
 
     # Step 5: Export
     print("\n📦 STEP 5: Export Scene")
-    print("-" * 60)
+    print(_RULE)
 
-    final_scene = await manager.get_scene(scene.id)
+    final_scene = manager.snapshot(scene.id)
     vfs = await manager.get_scene_vfs(scene.id)
 
     # Export to JSON
@@ -240,83 +299,53 @@ async def main():
     print(f"✓ Root:        {remotion_result['root']}")
     print(f"✓ Package:     {remotion_result['package']}")
 
-    # Summary
-    print("\n" + "=" * 60)
-    print("✅ WORKFLOW COMPLETE")
-    print("=" * 60)
-
-    print("\n📊 Scene Summary:")
-    print(f"   Name: {final_scene.name}")
-    print(f"   Objects: {len(final_scene.objects)}")
-    print(f"   Shots: {len(final_scene.shots)}")
-    print("   Physics bindings: 2 (ball, box)")
-    print("   Duration: 10 seconds")
-
-    print("\n🎨 Objects:")
-    for obj_id, obj in final_scene.objects.items():
-        pos = obj.transform.position
-        physics = "✓" if obj.physics_binding else "✗"
-        print(
-            f"   • {obj_id:10} {obj.type.value:8} at ({pos.x:4.1f}, {pos.y:4.1f}, {pos.z:4.1f})  Physics: {physics}"
-        )
-
-    print("\n📹 Camera Shots:")
-    for shot_id, shot in final_scene.shots.items():
-        mode = shot.camera_path.mode.value
-        label = shot.label or "No label"
-        print(f"   • {shot.start_time:4.1f}s - {shot.end_time:4.1f}s  {mode:8}  {label}")
-
-    print("\n🎬 Complete Pipeline:")
-    print("   ┌─────────────────────────────────────────────────┐")
-    print("   │  1. Physics Simulation (chuk-mcp-physics)      │")
-    print("   │     ↓                                           │")
-    print("   │  2. Scene Composition (chuk-mcp-stage) ✓       │")
-    print("   │     ↓                                           │")
-    print("   │  3. Bind Physics ✓                             │")
-    print("   │     ↓                                           │")
-    print("   │  4. Bake Simulation (Rapier service)           │")
-    print("   │     ↓                                           │")
-    print("   │  5. Export (R3F/Remotion) ✓                    │")
-    print("   │     ↓                                           │")
-    print("   │  6. Render Video (Remotion)                    │")
-    print("   └─────────────────────────────────────────────────┘")
-
-    print("\n💡 To Complete This Workflow:")
-    print()
-    print("   1. Install chuk-mcp-physics:")
-    print("      uvx chuk-mcp-physics")
-    print()
-    print("   2. Create simulation:")
-    print("      sim = await create_simulation(gravity_y=-9.81)")
-    print("      await add_rigid_body(sim.sim_id, 'ball', ...)")
-    print("      await add_rigid_body(sim.sim_id, 'box', ...)")
-    print("      await step_simulation(sim.sim_id, steps=600)")
-    print()
-    print("   3. Bake to scene:")
-    print("      await stage_bake_simulation(")
-    print("          scene_id, sim.sim_id, fps=60, duration=10.0")
-    print("      )")
-    print()
-    print("   4. Render with Remotion:")
-    print("      cd exports/remotion")
-    print("      npm install")
-    print("      npm run build")
-    print()
-    print("   🎥 Result: MP4 video with physics-driven animation!")
+    # Summary, built as one string so it goes out in a single write
+    object_lines = "\n".join(
+        f"   • {obj_id:10} {obj.type.value:8} at "
+        f"({obj.transform.position.x:4.1f}, {obj.transform.position.y:4.1f}, "
+        f"{obj.transform.position.z:4.1f})  "
+        f"Physics: {'✓' if obj.physics_binding else '✗'}"
+        for obj_id, obj in final_scene.objects.items()
+    )
+    shot_lines = "\n".join(
+        f"   • {shot.start_time:4.1f}s - {shot.end_time:4.1f}s  "
+        f"{shot.camera_path.mode.value:8}  {shot.label or 'No label'}"
+        for shot in final_scene.shots.values()
+    )
+    print(
+        f"\n{_BAR}\n"
+        "✅ WORKFLOW COMPLETE\n"
+        f"{_BAR}\n"
+        "\n📊 Scene Summary:\n"
+        f"   Name: {final_scene.name}\n"
+        f"   Objects: {len(final_scene.objects)}\n"
+        f"   Shots: {len(final_scene.shots)}\n"
+        "   Physics bindings: 2 (ball, box)\n"
+        "   Duration: 10 seconds\n"
+        f"\n🎨 Objects:\n{object_lines}\n"
+        f"\n📹 Camera Shots:\n{shot_lines}"
+    )
+
+    if verbose:
+        print(_NEXT_STEPS)
 
-    print("\n🌐 Public Rapier Service Info:")
-    print("   URL: https://rapier.chukai.io")
-    print("   Status: Available (no auth required)")
-    print("   Use case: Physics baking, trajectory recording")
-    print("   Rate limits: May apply for heavy usage")
-    print()
-    print("   To use local service:")
-    print("      export RAPIER_SERVICE_URL=http://localhost:9000")
-    print("      docker run -p 9000:9000 chuk-rapier-service")
 
-    # Cleanup
-    await manager.close()
+async def run(verbose: bool = False) -> None:
+    """Run the example with the shared manager.
+
+    Args:
+        verbose: Also print the pipeline diagram and next-steps guide
+    """
+    async with shared_manager() as manager:
+        await main(manager, verbose=verbose)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="also print the pipeline diagram and next-steps guide",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(verbose=args.verbose))
@@ -0,0 +1,76 @@
+"""Shared helpers for the chuk-mcp-stage examples.
+
+Examples import this module by name (``from _shared import get_manager``);
+running an example as a script puts ``examples/`` on ``sys.path``.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+from collections.abc import AsyncIterator
+
+from chuk_mcp_stage import SceneManager
+
+
+@functools.lru_cache(maxsize=1)
+def get_manager() -> SceneManager:
+    """Get the process-wide SceneManager used by the examples.
+
+    The manager (and its artifact store) is built once per process so that
+    running several examples back to back - e.g. from a test harness or a
+    notebook - reuses the same store instead of rebuilding it each time.
+    """
+    return SceneManager()
+
+
+def running_under_pytest() -> bool:
+    """Check whether the examples are being driven by pytest."""
+    return "pytest" in sys.modules
+
+
+def keep_manager() -> bool:
+    """Check whether the cached manager should outlive a single example.
+
+    True under pytest, or when CHUK_KEEP_MANAGER is set (e.g. when running
+    the examples back to back as a benchmark).
+    """
+    return running_under_pytest() or bool(os.environ.get("CHUK_KEEP_MANAGER"))
+
+
+async def release_manager(manager: SceneManager) -> None:
+    """Release the shared manager at the end of an example.
+
+    A kept-alive manager is left open for the next example. Otherwise it is
+    closed and dropped from the cache, so a later get_manager() call builds
+    a fresh manager instead of handing back a closed one.
+    """
+    if keep_manager():
+        return
+    await manager.close()
+    get_manager.cache_clear()
+
+
+@contextlib.asynccontextmanager
+async def shared_manager() -> AsyncIterator[SceneManager]:
+    """Lend the shared manager to an example for the duration of a block.
+
+    Examples that take the manager as a parameter run inside this block; on
+    exit the manager is released as per release_manager().
+    """
+    manager = get_manager()
+    try:
+        yield manager
+    finally:
+        await release_manager(manager)
+
+
+def flush_lines(out: list[str]) -> None:
+    """Write buffered status lines to stdout in one call and clear the buffer.
+
+    Examples collect their output per phase and flush it here, so a phase costs
+    one stdout write rather than one per line (noticeable when piped to CI logs).
+    """
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
@@ -15,13 +15,24 @@ Usage:
     python examples/test_google_drive_oauth.py
 """
 
-import asyncio
+import functools
+import importlib
+import io
 import os
 import sys
+import traceback
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Any, TextIO
+
+# Repository paths, resolved once at import
+_ROOT = Path(__file__).resolve().parent.parent
+_SRC = _ROOT / "src"
+_ENV_FILE = _ROOT / ".env"
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC))
 
 try:
     from dotenv import load_dotenv
@@ -32,123 +43,192 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-dotenv"])
     from dotenv import load_dotenv
 
+from chuk_mcp_stage.config import Config  # noqa: E402 (needs src on sys.path)
 
-async def test_oauth_provider_init():
-    """Test that OAuth provider can be initialized."""
-    print("=" * 70)
-    print("Test 1: OAuth Provider Initialization")
-    print("=" * 70)
-    print()
+
+@functools.cache
+def _import(name: str) -> ModuleType:
+    """Import a chuk_mcp_server module once; every test reuses the result.
+
+    Args:
+        name: Dotted module name
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the module is not installed (not cached, so each
+            test reports it)
+    """
+    return importlib.import_module(name)
+
+
+@functools.cache
+def _shared_mcp() -> Any:
+    """Get the ChukMCPServer shared by the tests, built on first use."""
+    return _import("chuk_mcp_server").ChukMCPServer("test-stage")
+
+
+@functools.cache
+def _shared_provider(
+    client_id: str, client_secret: str, redirect_uri: str, oauth_server_url: str
+) -> Any:
+    """Get the GoogleDriveOAuthProvider shared by the tests for these credentials."""
+    return _import("chuk_mcp_server.oauth.providers").GoogleDriveOAuthProvider(
+        google_client_id=client_id,
+        google_client_secret=client_secret,
+        google_redirect_uri=redirect_uri,
+        oauth_server_url=oauth_server_url,
+        sandbox_id="chuk-mcp-stage-test",
+    )
+
+
+def emit(out: TextIO, *lines: str) -> None:
+    """Write lines to a test's output buffer in one call.
+
+    Args:
+        out: Buffer collecting the test's output
+        *lines: Lines to write (an empty string writes a blank line)
+    """
+    out.write("\n".join(lines) + "\n")
+
+
+# Environment variables the tests read, snapshotted once after .env is loaded
+_ENV_KEYS = ("GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET", "GOOGLE_REDIRECT_URI", "OAUTH_SERVER_URL")
+
+
+def test_oauth_provider_init(env: Mapping[str, str], out: TextIO):
+    """Test that OAuth provider can be initialized.
+
+    Args:
+        env: Snapshot of the OAuth environment variables
+        out: Buffer collecting this test's output
+    """
+    emit(out, "=" * 70, "Test 1: OAuth Provider Initialization", "=" * 70, "")
 
     try:
-        from chuk_mcp_server.oauth.providers import GoogleDriveOAuthProvider
+        _import("chuk_mcp_server.oauth.providers")
     except ImportError as e:
-        print(f"❌ Failed to import GoogleDriveOAuthProvider: {e}")
-        print()
-        print("Install with:")
-        print("  pip install -e '.[google_drive]'")
+        emit(
+            out,
+            f"❌ Failed to import GoogleDriveOAuthProvider: {e}",
+            "",
+            "Install with:",
+            "  pip install -e '.[google_drive]'",
+        )
         return False
 
     # Get credentials from environment
-    client_id = os.getenv("GOOGLE_CLIENT_ID")
-    client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
+    client_id = env.get("GOOGLE_CLIENT_ID")
+    client_secret = env.get("GOOGLE_CLIENT_SECRET")
 
     if not client_id or not client_secret:
-        print("❌ Missing Google OAuth credentials")
-        print()
-        print("Set environment variables:")
-        print("  export GOOGLE_CLIENT_ID='your-client-id'")
-        print("  export GOOGLE_CLIENT_SECRET='your-client-secret'")
-        print()
-        print("Or create .env file from .env.example")
+        emit(
+            out,
+            "❌ Missing Google OAuth credentials",
+            "",
+            "Set environment variables:",
+            "  export GOOGLE_CLIENT_ID='your-client-id'",
+            "  export GOOGLE_CLIENT_SECRET='your-client-secret'",
+            "",
+            "Or create .env file from .env.example",
+        )
         return False
 
-    print(f"✓ Found GOOGLE_CLIENT_ID: {client_id[:20]}...")
-    print(f"✓ Found GOOGLE_CLIENT_SECRET: {client_secret[:10]}...")
-    print()
+    emit(
+        out,
+        f"✓ Found GOOGLE_CLIENT_ID: {client_id[:20]}...",
+        f"✓ Found GOOGLE_CLIENT_SECRET: {client_secret[:10]}...",
+        "",
+    )
 
     # Create provider
     try:
-        provider = GoogleDriveOAuthProvider(
-            google_client_id=client_id,
-            google_client_secret=client_secret,
-            google_redirect_uri=os.getenv(
-                "GOOGLE_REDIRECT_URI", "http://localhost:8000/oauth/callback"
-            ),
-            oauth_server_url=os.getenv("OAUTH_SERVER_URL", "http://localhost:8000"),
-            sandbox_id="chuk-mcp-stage-test",
+        provider = _shared_provider(
+            client_id,
+            client_secret,
+            env.get("GOOGLE_REDIRECT_URI", Config.DEFAULT_GOOGLE_REDIRECT_URI),
+            env.get("OAUTH_SERVER_URL", Config.DEFAULT_OAUTH_SERVER_URL),
+        )
+        emit(
+            out,
+            "✓ OAuth provider created successfully",
+            f"  - Redirect URI: {provider.google_client.redirect_uri}",
+            f"  - OAuth server: {provider.oauth_server_url}",
+            f"  - Sandbox ID: {provider.token_store.sandbox_id}",
+            "",
         )
-        print("✓ OAuth provider created successfully")
-        print(f"  - Redirect URI: {provider.google_client.redirect_uri}")
-        print(f"  - OAuth server: {provider.oauth_server_url}")
-        print(f"  - Sandbox ID: {provider.token_store.sandbox_id}")
-        print()
         return True
 
     except Exception as e:
-        print(f"❌ Failed to create OAuth provider: {e}")
-        import traceback
-
-        traceback.print_exc()
+        emit(out, f"❌ Failed to create OAuth provider: {e}")
+        traceback.print_exc(file=out)
         return False
 
 
-async def test_oauth_helper():
-    """Test that OAuth helper function works."""
-    print("=" * 70)
-    print("Test 2: OAuth Setup Helper")
-    print("=" * 70)
-    print()
+def test_oauth_helper(env: Mapping[str, str], out: TextIO):
+    """Test that OAuth helper function works.
+
+    Args:
+        env: Snapshot of the OAuth environment variables
+        out: Buffer collecting this test's output
+    """
+    emit(out, "=" * 70, "Test 2: OAuth Setup Helper", "=" * 70, "")
 
     try:
-        from chuk_mcp_server import ChukMCPServer
-        from chuk_mcp_server.oauth.helpers import setup_google_drive_oauth
-    except ImportError as e:
-        print(f"❌ Failed to import OAuth helpers: {e}")
+        setup_google_drive_oauth = _import("chuk_mcp_server.oauth.helpers").setup_google_drive_oauth
+        mcp = _shared_mcp()
+    except (ImportError, AttributeError) as e:
+        emit(out, f"❌ Failed to import OAuth helpers: {e}")
         return False
 
-    # Create MCP server
-    mcp = ChukMCPServer("test-stage")
-
     # Setup OAuth
     oauth_hook = setup_google_drive_oauth(mcp)
 
     if oauth_hook is None:
-        print("❌ OAuth hook not created (missing credentials?)")
+        emit(out, "❌ OAuth hook not created (missing credentials?)")
         return False
 
-    print("✓ OAuth hook created successfully")
-    print("  - Function: setup_google_drive_oauth()")
-    print("  - Returns: post_register_hook callable")
-    print()
+    emit(
+        out,
+        "✓ OAuth hook created successfully",
+        "  - Function: setup_google_drive_oauth()",
+        "  - Returns: post_register_hook callable",
+        "",
+    )
 
     # Call the hook to create middleware
     try:
         oauth_middleware = oauth_hook()
-        print("✓ OAuth middleware initialized")
-        print(f"  - Provider: {oauth_middleware.provider_name}")
-        print(f"  - Scopes: {oauth_middleware.scopes_supported}")
-        print()
+        emit(
+            out,
+            "✓ OAuth middleware initialized",
+            f"  - Provider: {oauth_middleware.provider_name}",
+            f"  - Scopes: {oauth_middleware.scopes_supported}",
+            "",
+        )
         return True
     except Exception as e:
-        print(f"❌ Failed to initialize OAuth middleware: {e}")
-        import traceback
-
-        traceback.print_exc()
+        emit(out, f"❌ Failed to initialize OAuth middleware: {e}")
+        traceback.print_exc(file=out)
         return False
 
 
-async def test_storage_helper():
-    """Test storage configuration helper."""
-    print("=" * 70)
-    print("Test 3: Storage Configuration Helper")
-    print("=" * 70)
-    print()
+def test_storage_helper(env: Mapping[str, str], out: TextIO):
+    """Test storage configuration helper.
+
+    Args:
+        env: Snapshot of the OAuth environment variables
+        out: Buffer collecting this test's output
+    """
+    emit(out, "=" * 70, "Test 3: Storage Configuration Helper", "=" * 70, "")
 
     try:
-        from chuk_mcp_server.oauth.helpers import configure_storage_from_oauth
-    except ImportError as e:
-        print(f"❌ Failed to import storage helper: {e}")
+        configure_storage_from_oauth = _import(
+            "chuk_mcp_server.oauth.helpers"
+        ).configure_storage_from_oauth
+    except (ImportError, AttributeError) as e:
+        emit(out, f"❌ Failed to import storage helper: {e}")
         return False
 
     # Mock token data
@@ -163,149 +243,172 @@ async def test_storage_helper():
     try:
         storage_config = configure_storage_from_oauth(mock_token_data)
 
-        print("✓ Storage config generated")
-        print(f"  - User ID: {storage_config['user_id']}")
-        print(f"  - Root folder: {storage_config['root_folder']}")
-        print(f"  - Has credentials: {bool(storage_config['credentials'])}")
-        print(f"  - Token present: {bool(storage_config['credentials'].get('token'))}")
-        print(
-            f"  - Refresh token present: {bool(storage_config['credentials'].get('refresh_token'))}"
+        emit(
+            out,
+            "✓ Storage config generated",
+            f"  - User ID: {storage_config['user_id']}",
+            f"  - Root folder: {storage_config['root_folder']}",
+            f"  - Has credentials: {bool(storage_config['credentials'])}",
+            f"  - Token present: {bool(storage_config['credentials'].get('token'))}",
+            f"  - Refresh token present: {bool(storage_config['credentials'].get('refresh_token'))}",
+            "",
         )
-        print()
         return True
 
     except Exception as e:
-        print(f"❌ Failed to generate storage config: {e}")
-        import traceback
-
-        traceback.print_exc()
+        emit(out, f"❌ Failed to generate storage config: {e}")
+        traceback.print_exc(file=out)
         return False
 
 
-async def test_google_drive_client():
-    """Test Google Drive OAuth client."""
-    print("=" * 70)
-    print("Test 4: Google Drive OAuth Client")
-    print("=" * 70)
-    print()
+def test_google_drive_client(env: Mapping[str, str], out: TextIO):
+    """Test Google Drive OAuth client.
+
+    Args:
+        env: Snapshot of the OAuth environment variables
+        out: Buffer collecting this test's output
+    """
+    emit(out, "=" * 70, "Test 4: Google Drive OAuth Client", "=" * 70, "")
 
     try:
-        from chuk_mcp_server.oauth.providers import GoogleDriveOAuthClient
-    except ImportError as e:
-        print(f"❌ Failed to import GoogleDriveOAuthClient: {e}")
+        GoogleDriveOAuthClient = _import("chuk_mcp_server.oauth.providers").GoogleDriveOAuthClient
+    except (ImportError, AttributeError) as e:
+        emit(out, f"❌ Failed to import GoogleDriveOAuthClient: {e}")
         return False
 
-    client_id = os.getenv("GOOGLE_CLIENT_ID")
-    client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
+    client_id = env.get("GOOGLE_CLIENT_ID")
+    client_secret = env.get("GOOGLE_CLIENT_SECRET")
 
     if not client_id or not client_secret:
-        print("⚠️  Skipping (no credentials)")
+        emit(out, "⚠️  Skipping (no credentials)")
         return True
 
     try:
         client = GoogleDriveOAuthClient(
             client_id=client_id,
             client_secret=client_secret,
-            redirect_uri=os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8000/oauth/callback"),
+            redirect_uri=env.get("GOOGLE_REDIRECT_URI", Config.DEFAULT_GOOGLE_REDIRECT_URI),
         )
 
         # Generate auth URL
         test_state = "test-state-123"
         auth_url = client.get_authorization_url(state=test_state)
 
-        print("✓ OAuth client created")
-        print(f"  - Client ID: {client.client_id[:20]}...")
-        print(f"  - Redirect URI: {client.redirect_uri}")
-        print()
-        print("✓ Authorization URL generated")
-        print(f"  - URL: {auth_url[:80]}...")
-        print(f"  - Contains state: {test_state in auth_url}")
-        print(f"  - Contains client_id: {client_id[:20] in auth_url}")
-        print()
+        emit(
+            out,
+            "✓ OAuth client created",
+            f"  - Client ID: {client.client_id[:20]}...",
+            f"  - Redirect URI: {client.redirect_uri}",
+            "",
+            "✓ Authorization URL generated",
+            f"  - URL: {auth_url[:80]}...",
+            f"  - Contains state: {test_state in auth_url}",
+            f"  - Contains client_id: {client_id[:20] in auth_url}",
+            "",
+        )
 
         # Verify required scopes
-        print("✓ Required scopes:")
-        for scope in client.SCOPES:
-            print(f"  - {scope}")
-        print()
+        emit(out, "✓ Required scopes:", *(f"  - {scope}" for scope in client.SCOPES), "")
 
         return True
 
     except Exception as e:
-        print(f"❌ Failed to test OAuth client: {e}")
-        import traceback
-
-        traceback.print_exc()
+        emit(out, f"❌ Failed to test OAuth client: {e}")
+        traceback.print_exc(file=out)
         return False
 
 
-async def test_oauth_endpoints():
-    """Test that OAuth endpoints can be registered."""
-    print("=" * 70)
-    print("Test 5: OAuth Endpoints Registration")
-    print("=" * 70)
-    print()
+def test_oauth_endpoints(env: Mapping[str, str], out: TextIO):
+    """Test that OAuth endpoints can be registered.
+
+    Args:
+        env: Snapshot of the OAuth environment variables
+        out: Buffer collecting this test's output
+    """
+    emit(out, "=" * 70, "Test 5: OAuth Endpoints Registration", "=" * 70, "")
 
     try:
-        from chuk_mcp_server import ChukMCPServer
-        from chuk_mcp_server.oauth import OAuthMiddleware
-        from chuk_mcp_server.oauth.providers import GoogleDriveOAuthProvider
-    except ImportError as e:
-        print(f"❌ Failed to import OAuth components: {e}")
+        OAuthMiddleware = _import("chuk_mcp_server.oauth").OAuthMiddleware
+        _import("chuk_mcp_server.oauth.providers")
+    except (ImportError, AttributeError) as e:
+        emit(out, f"❌ Failed to import OAuth components: {e}")
         return False
 
-    client_id = os.getenv("GOOGLE_CLIENT_ID")
-    client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
+    client_id = env.get("GOOGLE_CLIENT_ID")
+    client_secret = env.get("GOOGLE_CLIENT_SECRET")
 
     if not client_id or not client_secret:
-        print("⚠️  Skipping (no credentials)")
+        emit(out, "⚠️  Skipping (no credentials)")
         return True
 
     try:
-        # Create MCP server
-        mcp = ChukMCPServer("test-stage")
-
-        # Create provider
-        provider = GoogleDriveOAuthProvider(
-            google_client_id=client_id,
-            google_client_secret=client_secret,
-            google_redirect_uri="http://localhost:8000/oauth/callback",
-            oauth_server_url="http://localhost:8000",
-            sandbox_id="test-sandbox",
+        # Reuse the server and provider built by the earlier tests
+        mcp = _shared_mcp()
+        provider = _shared_provider(
+            client_id,
+            client_secret,
+            env.get("GOOGLE_REDIRECT_URI", Config.DEFAULT_GOOGLE_REDIRECT_URI),
+            env.get("OAUTH_SERVER_URL", Config.DEFAULT_OAUTH_SERVER_URL),
         )
 
         # Create middleware (this registers endpoints)
         _oauth = OAuthMiddleware(
             mcp_server=mcp,
             provider=provider,
-            oauth_server_url="http://localhost:8000",
+            oauth_server_url=provider.oauth_server_url,
             callback_path="/oauth/callback",
             scopes_supported=["drive.file", "userinfo.profile"],
             provider_name="Google Drive",
         )
 
-        print("✓ OAuth middleware registered")
-        print()
-        print("OAuth endpoints that should be available:")
-        print("  - GET  /.well-known/oauth-authorization-server")
-        print("  - GET  /.well-known/oauth-protected-resource")
-        print("  - GET  /oauth/authorize")
-        print("  - POST /oauth/token")
-        print("  - POST /oauth/register")
-        print("  - GET  /oauth/callback")
-        print()
+        emit(
+            out,
+            "✓ OAuth middleware registered",
+            "",
+            "OAuth endpoints that should be available:",
+            "  - GET  /.well-known/oauth-authorization-server",
+            "  - GET  /.well-known/oauth-protected-resource",
+            "  - GET  /oauth/authorize",
+            "  - POST /oauth/token",
+            "  - POST /oauth/register",
+            "  - GET  /oauth/callback",
+            "",
+        )
 
         return True
 
     except Exception as e:
-        print(f"❌ Failed to register OAuth endpoints: {e}")
-        import traceback
-
-        traceback.print_exc()
+        emit(out, f"❌ Failed to register OAuth endpoints: {e}")
+        traceback.print_exc(file=out)
         return False
 
 
-async def main():
+def run_test(
+    name: str,
+    test_func: Callable[[Mapping[str, str], TextIO], bool],
+    env: Mapping[str, str],
+) -> tuple[str, bool, str]:
+    """Run one test into its own output buffer.
+
+    Args:
+        name: Test name for the summary
+        test_func: Test function
+        env: Snapshot of the OAuth environment variables
+
+    Returns:
+        Tuple of (name, passed, captured output)
+    """
+    out = io.StringIO()
+    try:
+        passed = bool(test_func(env, out))
+    except Exception as e:
+        emit(out, f"❌ Test failed with exception: {e}")
+        traceback.print_exc(file=out)
+        passed = False
+    return name, passed, out.getvalue()
+
+
+def main():
     """Run all tests."""
     print()
     print("=" * 70)
@@ -314,16 +417,18 @@ async def main():
     print()
 
     # Load environment variables from .env file if it exists
-    env_file = Path(__file__).parent.parent / ".env"
-    if env_file.exists():
-        print(f"✓ Loading environment from {env_file}")
-        load_dotenv(env_file)
+    if _ENV_FILE.exists():
+        print(f"✓ Loading environment from {_ENV_FILE}")
+        load_dotenv(_ENV_FILE)
     else:
-        print(f"⚠️  No .env file found at {env_file}")
+        print(f"⚠️  No .env file found at {_ENV_FILE}")
         print("   Using environment variables only")
 
     print()
 
+    # Read the environment once; every test gets the same read-only view
+    env = MappingProxyType({key: os.environ[key] for key in _ENV_KEYS if key in os.environ})
+
     # Run tests
     tests = [
         ("OAuth Provider Initialization", test_oauth_provider_init),
@@ -333,17 +438,10 @@ async def main():
         ("OAuth Endpoints Registration", test_oauth_endpoints),
     ]
 
-    results = []
-    for name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
-            import traceback
-
-            traceback.print_exc()
-            results.append((name, False))
+    # Each test buffers its own output; everything is written in one go
+    outcomes = [run_test(name, test_func, env) for name, test_func in tests]
+    sys.stdout.write("".join(output for _, _, output in outcomes))
+    results = [(name, passed) for name, passed, _ in outcomes]
 
     # Print summary
     print()
@@ -378,4 +476,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(main())
@@ -17,33 +17,82 @@ Example:
         # ... build scene
 """
 
-from .exporters import SceneExporter
-from .models import (
-    BakedAnimation,
-    CameraPath,
-    CameraPathMode,
-    Color,
-    EasingFunction,
-    Environment,
-    EnvironmentType,
-    ExportFormat,
-    Label,
-    Lighting,
-    LightingPreset,
-    Material,
-    MaterialPreset,
-    ObjectType,
-    Quaternion,
-    Scene,
-    SceneMetadata,
-    SceneObject,
-    Shot,
-    Trail,
-    Transform,
-    Vector3,
-)
-from .physics_bridge import PhysicsBridge
-from .scene_manager import SceneManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .exporters import SceneExporter
+    from .models import (
+        Q_IDENTITY,
+        V_ONE,
+        V_ZERO,
+        AnimationFormat,
+        BakedAnimation,
+        CameraPath,
+        CameraPathMode,
+        Color,
+        EasingFunction,
+        Environment,
+        EnvironmentType,
+        ExportFormat,
+        Label,
+        Lighting,
+        LightingPreset,
+        Material,
+        MaterialPreset,
+        ObjectType,
+        Quaternion,
+        Scene,
+        SceneMetadata,
+        SceneObject,
+        Shot,
+        Trail,
+        Transform,
+        Vector3,
+        material_preset,
+        vec3,
+    )
+    from .physics_bridge import BakedTrajectory, KeyframeCursor, PhysicsBridge
+    from .scene_manager import SceneManager
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so e.g. importing Config or the models alone
+# does not pull in the storage and HTTP stacks.
+_LAZY_EXPORTS = {
+    "SceneExporter": ".exporters",
+    "AnimationFormat": ".models",
+    "BakedAnimation": ".models",
+    "CameraPath": ".models",
+    "CameraPathMode": ".models",
+    "Color": ".models",
+    "EasingFunction": ".models",
+    "Environment": ".models",
+    "EnvironmentType": ".models",
+    "ExportFormat": ".models",
+    "Label": ".models",
+    "Lighting": ".models",
+    "LightingPreset": ".models",
+    "Material": ".models",
+    "MaterialPreset": ".models",
+    "ObjectType": ".models",
+    "Q_IDENTITY": ".models",
+    "Quaternion": ".models",
+    "Scene": ".models",
+    "SceneMetadata": ".models",
+    "SceneObject": ".models",
+    "Shot": ".models",
+    "Trail": ".models",
+    "Transform": ".models",
+    "V_ONE": ".models",
+    "V_ZERO": ".models",
+    "Vector3": ".models",
+    "material_preset": ".models",
+    "vec3": ".models",
+    "BakedTrajectory": ".physics_bridge",
+    "KeyframeCursor": ".physics_bridge",
+    "PhysicsBridge": ".physics_bridge",
+    "SceneManager": ".scene_manager",
+}
 
 __version__ = "0.1.0"
 
@@ -62,9 +111,14 @@ __all__ = [
     "Quaternion",
     "Transform",
     "Color",
+    "vec3",
+    "V_ZERO",
+    "V_ONE",
+    "Q_IDENTITY",
     # Materials & Appearance
     "Material",
     "MaterialPreset",
+    "material_preset",
     "Trail",
     "Label",
     # Environment
@@ -77,8 +131,26 @@ __all__ = [
     "CameraPathMode",
     "EasingFunction",
     # Physics & Animation
+    "AnimationFormat",
     "BakedAnimation",
+    "BakedTrajectory",
+    "KeyframeCursor",
     # Export
     "ExportFormat",
     "ObjectType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -0,0 +1,51 @@
+"""JSON encoding helpers shared by the exporters and the physics bridge.
+
+Uses orjson when it is installed (the "fast" extra) and falls back to the
+standard library otherwise. All encoders return UTF-8 bytes.
+"""
+
+import functools
+import json
+from types import ModuleType
+from typing import Any
+
+
+@functools.cache
+def json_backend() -> ModuleType | None:
+    """Import orjson on first use, or None if it is not installed.
+
+    orjson is the "fast" extra; importing it lazily keeps it off the import
+    path of callers that never export (e.g. scene building and camera work).
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Serialize data as 2-space indented UTF-8 JSON bytes.
+
+    Both backends produce the same layout. orjson already returns bytes, so
+    the result goes to the VFS without a decode/encode trip.
+    """
+    orjson = json_backend()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Serialize data as minified UTF-8 JSON bytes."""
+    orjson = json_backend()
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_json(data: Any, pretty: bool) -> bytes:
+    """Serialize data as indented JSON bytes when pretty, else minified bytes."""
+    if pretty:
+        return dumps_indented(data)
+    return dumps_compact(data)
@@ -1,9 +1,160 @@
 """Configuration for chuk-mcp-stage.
 
 Handles environment variables and default settings.
+
+Settings are read from the environment on first use and cached for the life of
+the process; call ``Config.invalidate()`` after changing the environment.
 """
 
+import functools
+import logging
 import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# OAuth client IDs/secrets: at least 10 word, dash or dot characters. Rejects
+# whitespace, stray quotes from .env files and short placeholder values.
+_CREDENTIAL_RE = re.compile(r"[\w\-.]{10,}")
+
+
+class PhysicsProvider(str, Enum):
+    """Physics provider types."""
+
+    RAPIER = "rapier"
+    MCP = "mcp"
+    AUTO = "auto"
+
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    """Environment-derived settings, read in one pass."""
+
+    rapier_url: str
+    rapier_timeout: float
+    rapier_concurrency: int
+    physics_provider: PhysicsProvider
+    storage_provider: str
+    session_provider: str
+    google_drive: Optional[Mapping[str, str]]
+
+    @classmethod
+    def from_env(cls) -> "_Settings":
+        """Read every setting from the environment."""
+        storage_provider = os.environ.get("STORAGE_PROVIDER", "vfs-filesystem")
+        return cls(
+            rapier_url=(
+                os.environ.get("RAPIER_SERVICE_URL")
+                or os.environ.get("RAPIER_URL")
+                or Config.DEFAULT_RAPIER_URL
+            ),
+            rapier_timeout=_parse_timeout(os.environ.get("RAPIER_TIMEOUT")),
+            rapier_concurrency=_parse_concurrency(os.environ.get("RAPIER_CONCURRENCY")),
+            physics_provider=_parse_physics_provider(os.environ.get("PHYSICS_PROVIDER")),
+            storage_provider=storage_provider,
+            session_provider=os.environ.get("SESSION_PROVIDER", "memory"),
+            google_drive=_resolve_google_drive(storage_provider),
+        )
+
+
+def _parse_timeout(raw: Optional[str]) -> float:
+    """Parse a timeout in seconds, falling back to the default.
+
+    Only plain positive decimals ("30", " 60.5 ") are accepted, ignoring
+    surrounding whitespace; anything else (unset, garbage, zero, negative,
+    exponent, inf/nan) uses the default.
+
+    Args:
+        raw: Raw environment value
+
+    Returns:
+        Timeout in seconds
+    """
+    raw = raw.strip() if raw else ""
+    if raw.replace(".", "", 1).isdecimal():
+        timeout = float(raw)
+        if timeout > 0:
+            return timeout
+    return Config.DEFAULT_RAPIER_TIMEOUT
+
+
+def _parse_concurrency(raw: Optional[str]) -> int:
+    """Parse a request concurrency limit, falling back to the default.
+
+    Only plain positive integers ("8", "32") are accepted; anything else
+    (unset, garbage, zero, negative) uses the default.
+
+    Args:
+        raw: Raw environment value
+
+    Returns:
+        Maximum number of concurrent requests
+    """
+    if raw and raw.isdecimal() and int(raw) > 0:
+        return int(raw)
+    return Config.DEFAULT_RAPIER_CONCURRENCY
+
+
+def _parse_physics_provider(raw: Optional[str]) -> PhysicsProvider:
+    """Parse a physics provider name case-insensitively.
+
+    Args:
+        raw: Raw environment value
+
+    Returns:
+        Matching provider, or AUTO if unset or unknown
+    """
+    try:
+        return PhysicsProvider(raw.lower()) if raw else PhysicsProvider.AUTO
+    except ValueError:
+        logger.warning(f"Unknown PHYSICS_PROVIDER {raw!r}, using 'auto'")
+        return PhysicsProvider.AUTO
+
+
+def _resolve_google_drive(storage_provider: str) -> Optional[Mapping[str, str]]:
+    """Resolve the Google Drive OAuth config in one pass.
+
+    Args:
+        storage_provider: Configured storage provider
+
+    Returns:
+        Read-only OAuth config, or None if Google Drive is not enabled
+    """
+    # Google Drive only works with vfs-filesystem provider
+    if storage_provider != "vfs-filesystem":
+        return None
+
+    client_id = os.environ.get("GOOGLE_CLIENT_ID")
+    client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        return None
+
+    for name, value in (("GOOGLE_CLIENT_ID", client_id), ("GOOGLE_CLIENT_SECRET", client_secret)):
+        if _CREDENTIAL_RE.fullmatch(value) is None:
+            logger.warning(f"Ignoring Google Drive OAuth config: {name} is malformed")
+            return None
+
+    return MappingProxyType(
+        {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "redirect_uri": os.environ.get(
+                "GOOGLE_REDIRECT_URI", Config.DEFAULT_GOOGLE_REDIRECT_URI
+            ),
+            "oauth_server_url": os.environ.get("OAUTH_SERVER_URL", Config.DEFAULT_OAUTH_SERVER_URL),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> _Settings:
+    """Get the process-wide settings, reading the environment on first use."""
+    return _Settings.from_env()
 
 
 class Config:
@@ -11,6 +162,17 @@ class Config:
 
     # Default Rapier physics service (public)
     DEFAULT_RAPIER_URL = "https://rapier.chukai.io"
+    DEFAULT_RAPIER_TIMEOUT = 30.0
+    DEFAULT_RAPIER_CONCURRENCY = 16
+
+    # Default local OAuth endpoints for Google Drive
+    DEFAULT_GOOGLE_REDIRECT_URI = "http://localhost:8000/oauth/callback"
+    DEFAULT_OAUTH_SERVER_URL = "http://localhost:8000"
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop cached settings so the next call re-reads the environment."""
+        _settings.cache_clear()
 
     @staticmethod
     def get_rapier_url() -> str:
@@ -31,9 +193,7 @@ class Config:
             export RAPIER_SERVICE_URL=http://localhost:9000
             url = Config.get_rapier_url()  # http://localhost:9000
         """
-        return (
-            os.getenv("RAPIER_SERVICE_URL") or os.getenv("RAPIER_URL") or Config.DEFAULT_RAPIER_URL
-        )
+        return _settings().rapier_url
 
     @staticmethod
     def get_rapier_timeout() -> float:
@@ -42,24 +202,33 @@ class Config:
         Returns:
             Timeout in seconds (default 30.0)
         """
-        try:
-            return float(os.getenv("RAPIER_TIMEOUT", "30.0"))
-        except ValueError:
-            return 30.0
+        return _settings().rapier_timeout
+
+    @staticmethod
+    def get_rapier_concurrency() -> int:
+        """Get the maximum number of concurrent requests to the Rapier service.
+
+        Bounds how many body trajectories are fetched at once while baking.
+
+        Returns:
+            Concurrent request limit (default 16)
+        """
+        return _settings().rapier_concurrency
 
     @staticmethod
-    def get_physics_provider() -> str:
+    def get_physics_provider() -> PhysicsProvider:
         """Get physics provider type.
 
         Returns:
-            Provider type: 'rapier', 'mcp', or 'auto' (default)
+            Provider type: 'rapier', 'mcp', or 'auto' (default, also used for
+            unknown values)
 
         Provider types:
         - 'rapier': Use Rapier HTTP service directly (fastest for simulations)
         - 'mcp': Use chuk-mcp-physics tools (flexible, supports analytic too)
         - 'auto': Auto-detect based on available services (default)
         """
-        return os.getenv("PHYSICS_PROVIDER", "auto").lower()
+        return _settings().physics_provider
 
     @staticmethod
     def get_storage_provider() -> str:
@@ -84,7 +253,7 @@ class Config:
         Environment variable:
         - STORAGE_PROVIDER: Storage provider type
         """
-        return os.getenv("STORAGE_PROVIDER", "vfs-filesystem")
+        return _settings().storage_provider
 
     @staticmethod
     def get_session_provider() -> str:
@@ -101,7 +270,7 @@ class Config:
         - SESSION_PROVIDER: Session provider type
         - REDIS_URL: Redis connection URL (for redis provider)
         """
-        return os.getenv("SESSION_PROVIDER", "memory")
+        return _settings().session_provider
 
     @staticmethod
     def is_google_drive_enabled() -> bool:
@@ -112,27 +281,18 @@ class Config:
 
         Google Drive is only enabled when:
         1. Storage provider is 'vfs-filesystem' (default)
-        2. GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET are set
+        2. GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET are set and well-formed
         3. chuk-virtual-fs[google_drive] is installed (checked at runtime)
         """
-        storage_provider = Config.get_storage_provider()
-
-        # Google Drive only works with vfs-filesystem provider
-        if storage_provider != "vfs-filesystem":
-            return False
-
-        # Check if OAuth credentials are configured
-        client_id = os.getenv("GOOGLE_CLIENT_ID")
-        client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
-
-        return bool(client_id and client_secret)
+        return _settings().google_drive is not None
 
     @staticmethod
-    def get_google_drive_config() -> dict[str, str] | None:
+    def get_google_drive_config() -> Mapping[str, str] | None:
         """Get Google Drive OAuth configuration.
 
         Returns:
-            Dict with client_id, client_secret, redirect_uri or None if not configured
+            Read-only mapping with client_id, client_secret, redirect_uri and
+            oauth_server_url (shared across calls), or None if not configured
 
         Environment variables:
         - GOOGLE_CLIENT_ID: Google OAuth client ID
@@ -147,22 +307,4 @@ class Config:
         4. chuk-virtual-fs[google_drive] is installed
         5. StorageScope.USER is used (automatic when authenticated)
         """
-        if not Config.is_google_drive_enabled():
-            return None
-
-        # These are guaranteed to be set by is_google_drive_enabled()
-        client_id = os.getenv("GOOGLE_CLIENT_ID")
-        client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
-
-        # Type checker needs explicit check even though is_google_drive_enabled() validates
-        if not client_id or not client_secret:
-            return None
-
-        return {
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "redirect_uri": os.getenv(
-                "GOOGLE_REDIRECT_URI", "http://localhost:8000/oauth/callback"
-            ),
-            "oauth_server_url": os.getenv("OAUTH_SERVER_URL", "http://localhost:8000"),
-        }
+        return _settings().google_drive
@@ -4,11 +4,11 @@ Strongly typed models for 3D scenes, camera paths, shots, and exports.
 No dictionary goop - everything is Pydantic with enums and validation.
 """
 
+import functools
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
-
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
 # Enums and Constants
@@ -88,13 +88,22 @@ class EasingFunction(str, Enum):
     SPRING = "spring"
 
 
+class AnimationFormat(str, Enum):
+    """Baked animation data encodings."""
+
+    JSON = "json"  # Keyframe dicts as a JSON array (.json)
+    BINARY = "binary"  # Packed BakedTrajectory columns, float32 (.bin)
+
+
 class ExportFormat(str, Enum):
     """Export template formats."""
 
     R3F_COMPONENT = "r3f-component"  # React Three Fiber component
     REMOTION_PROJECT = "remotion-project"  # Full Remotion project
     GLTF = "gltf"  # Static glTF scene
+    GLB = "glb"  # Static glTF scene, binary container
     JSON = "json"  # Raw JSON scene data
+    JSON_COMPACT = "json-compact"  # Minified JSON scene data, written as UTF-8 bytes
 
 
 # ============================================================================
@@ -105,39 +114,76 @@ class ExportFormat(str, Enum):
 class Vector3(BaseModel):
     """3D vector or position."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     x: float = 0.0
     y: float = 0.0
     z: float = 0.0
 
+    @property
+    def as_tuple(self) -> tuple[float, float, float]:
+        """Components as an (x, y, z) tuple (JSON-serializes like a list)."""
+        return (self.x, self.y, self.z)
+
     def to_list(self) -> list[float]:
         """Convert to [x, y, z] list."""
         return [self.x, self.y, self.z]
 
 
+@functools.lru_cache(maxsize=256)
+def vec3(x: float = 0.0, y: float = 0.0, z: float = 0.0) -> Vector3:
+    """Get a shared Vector3 for the given components.
+
+    Vector3 is frozen, so common values (origin, unit scale, ...) can be
+    reused across objects instead of re-validated each time.
+    """
+    return Vector3(x=x, y=y, z=z)
+
+
+# Shared instances of the most common vectors (safe to share: Vector3 is frozen)
+V_ZERO = vec3(0.0, 0.0, 0.0)
+V_ONE = vec3(1.0, 1.0, 1.0)
+
+
 class Quaternion(BaseModel):
     """Quaternion rotation (x, y, z, w)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     x: float = 0.0
     y: float = 0.0
     z: float = 0.0
     w: float = 1.0  # Identity rotation
 
+    @property
+    def as_tuple(self) -> tuple[float, float, float, float]:
+        """Components as an (x, y, z, w) tuple (JSON-serializes like a list)."""
+        return (self.x, self.y, self.z, self.w)
+
     def to_list(self) -> list[float]:
         """Convert to [x, y, z, w] list."""
         return [self.x, self.y, self.z, self.w]
 
 
+# Shared identity rotation (safe to share: Quaternion is frozen)
+Q_IDENTITY = Quaternion()
+
+
 class Transform(BaseModel):
     """3D transformation."""
 
-    position: Vector3 = Field(default_factory=Vector3)
-    rotation: Quaternion = Field(default_factory=Quaternion)
-    scale: Vector3 = Field(default_factory=lambda: Vector3(x=1.0, y=1.0, z=1.0))
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    position: Vector3 = V_ZERO
+    rotation: Quaternion = Q_IDENTITY
+    scale: Vector3 = V_ONE
 
 
 class Color(BaseModel):
     """RGB color (0-1 range)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     r: float = Field(ge=0.0, le=1.0)
     g: float = Field(ge=0.0, le=1.0)
     b: float = Field(ge=0.0, le=1.0)
@@ -151,6 +197,8 @@ class Color(BaseModel):
 class Material(BaseModel):
     """Material definition."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     preset: MaterialPreset = MaterialPreset.PLASTIC_WHITE
     color: Optional[Color] = None
     roughness: float = Field(default=0.5, ge=0.0, le=1.0)
@@ -158,10 +206,61 @@ class Material(BaseModel):
     transmission: float = Field(default=0.0, ge=0.0, le=1.0)  # For glass
     opacity: float = Field(default=1.0, ge=0.0, le=1.0)
 
+    @classmethod
+    def of(cls, preset: MaterialPreset, **overrides: Any) -> "Material":
+        """Get a shared Material for a preset and field overrides.
+
+        Identical arguments return the same instance, so scenes that reuse a
+        material hold one object and exporters can emit it once.
+
+        Args:
+            preset: Material preset
+            **overrides: Other Material fields; ``color`` is an (r, g, b) tuple
+
+        Returns:
+            Cached Material instance
+
+        Raises:
+            ValidationError: If an override is out of range or unknown
+        """
+        return _cached_material(preset, tuple(sorted(overrides.items())))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_material(preset: MaterialPreset, overrides: tuple[tuple[str, Any], ...]) -> Material:
+    """Build the Material behind Material.of for a hashable overrides key."""
+    fields = dict(overrides)
+    color = fields.pop("color", None)
+    if color is not None:
+        fields["color"] = Color(r=color[0], g=color[1], b=color[2])
+    return Material(preset=preset, **fields)
+
+
+def material_preset(
+    preset: MaterialPreset, color: Optional[tuple[float, float, float]] = None
+) -> Material:
+    """Get a shared Material for a preset and optional RGB color.
+
+    Materials are frozen, so identical preset/color pairs can reuse one
+    validated instance instead of re-running validation per object.
+
+    Args:
+        preset: Material preset
+        color: Optional (r, g, b) color in the 0-1 range
+
+    Returns:
+        Cached Material instance (the same one Material.of returns)
+    """
+    if color is None:
+        return Material.of(preset)
+    return Material.of(preset, color=color)
+
 
 class Trail(BaseModel):
     """Trajectory trail visualization."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     length: int = Field(default=120, description="Number of past positions to show")
     color: str = Field(default="accent", description="Trail color (theme color or hex)")
     fade: bool = Field(default=True, description="Fade out older positions")
@@ -171,10 +270,12 @@ class Trail(BaseModel):
 class Label(BaseModel):
     """Text label attached to object."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     font_size: float = 1.0
     color: str = "white"
-    offset: Vector3 = Field(default_factory=Vector3)
+    offset: Vector3 = V_ZERO
     always_face_camera: bool = True
 
 
@@ -186,6 +287,8 @@ class Label(BaseModel):
 class SceneObject(BaseModel):
     """An object in the 3D scene."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(description="Unique object identifier")
     type: ObjectType
     transform: Transform = Field(default_factory=Transform)
@@ -241,6 +344,8 @@ class Lighting(BaseModel):
 class CameraPath(BaseModel):
     """Camera animation path definition."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     mode: CameraPathMode
     focus: Optional[str] = Field(
         default=None, description="Object ID to focus on (for orbit/chase modes)"
@@ -268,6 +373,8 @@ class CameraPath(BaseModel):
 class Shot(BaseModel):
     """A shot defines camera path + time range."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(description="Unique shot identifier")
     camera_path: CameraPath
     start_time: float = Field(ge=0.0, description="Start time in seconds")
@@ -275,6 +382,178 @@ class Shot(BaseModel):
     easing: EasingFunction = EasingFunction.EASE_IN_OUT_CUBIC
     label: Optional[str] = None
 
+    # Factories for the common camera modes. Both the camera path and the shot
+    # are validated, so a bad argument fails here rather than when the stored
+    # shot is loaded back.
+
+    @classmethod
+    def orbit(
+        cls,
+        id: str,
+        *,
+        focus: str,
+        radius: float,
+        elevation: float,
+        speed: float,
+        start_time: float,
+        end_time: float,
+        easing: EasingFunction = EasingFunction.EASE_IN_OUT_CUBIC,
+        label: Optional[str] = None,
+    ) -> "Shot":
+        """Create an orbit shot circling the focus object.
+
+        Args:
+            id: Shot identifier
+            focus: Object ID to orbit around
+            radius: Orbit radius
+            elevation: Camera elevation in degrees
+            speed: Revolutions per second
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            easing: Easing function
+            label: Optional human-readable label
+
+        Returns:
+            Shot with an ORBIT camera path
+        """
+        path = CameraPath(
+            mode=CameraPathMode.ORBIT,
+            focus=focus,
+            radius=radius,
+            elevation=elevation,
+            speed=speed,
+        )
+        return cls(
+            id=id,
+            camera_path=path,
+            start_time=start_time,
+            end_time=end_time,
+            easing=easing,
+            label=label,
+        )
+
+    @classmethod
+    def static(
+        cls,
+        id: str,
+        *,
+        position: Vector3,
+        look_at: Vector3,
+        start_time: float,
+        end_time: float,
+        easing: EasingFunction = EasingFunction.EASE_IN_OUT_CUBIC,
+        label: Optional[str] = None,
+    ) -> "Shot":
+        """Create a static shot from a fixed camera position.
+
+        Args:
+            id: Shot identifier
+            position: Camera position
+            look_at: Point the camera looks at
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            easing: Easing function
+            label: Optional human-readable label
+
+        Returns:
+            Shot with a STATIC camera path
+        """
+        path = CameraPath(mode=CameraPathMode.STATIC, position=position, look_at=look_at)
+        return cls(
+            id=id,
+            camera_path=path,
+            start_time=start_time,
+            end_time=end_time,
+            easing=easing,
+            label=label,
+        )
+
+    @classmethod
+    def dolly(
+        cls,
+        id: str,
+        *,
+        from_position: Vector3,
+        to_position: Vector3,
+        look_at: Optional[Vector3] = None,
+        start_time: float,
+        end_time: float,
+        easing: EasingFunction = EasingFunction.EASE_IN_OUT_CUBIC,
+        label: Optional[str] = None,
+    ) -> "Shot":
+        """Create a dolly shot moving the camera from one point to another.
+
+        Args:
+            id: Shot identifier
+            from_position: Camera start position
+            to_position: Camera end position
+            look_at: Optional point the camera looks at
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            easing: Easing function
+            label: Optional human-readable label
+
+        Returns:
+            Shot with a DOLLY camera path
+        """
+        path = CameraPath(
+            mode=CameraPathMode.DOLLY,
+            from_position=from_position,
+            to_position=to_position,
+            look_at=look_at,
+        )
+        return cls(
+            id=id,
+            camera_path=path,
+            start_time=start_time,
+            end_time=end_time,
+            easing=easing,
+            label=label,
+        )
+
+    @classmethod
+    def chase(
+        cls,
+        id: str,
+        *,
+        focus: str,
+        offset: Vector3,
+        damping: Optional[float] = None,
+        start_time: float,
+        end_time: float,
+        easing: EasingFunction = EasingFunction.EASE_IN_OUT_CUBIC,
+        label: Optional[str] = None,
+    ) -> "Shot":
+        """Create a chase shot following the focus object at an offset.
+
+        Args:
+            id: Shot identifier
+            focus: Object ID to follow
+            offset: Camera offset from the object
+            damping: Optional smoothing factor
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            easing: Easing function
+            label: Optional human-readable label
+
+        Returns:
+            Shot with a CHASE camera path
+        """
+        path = CameraPath(
+            mode=CameraPathMode.CHASE,
+            focus=focus,
+            offset=offset,
+            damping=damping,
+        )
+        return cls(
+            id=id,
+            camera_path=path,
+            start_time=start_time,
+            end_time=end_time,
+            easing=easing,
+            label=label,
+        )
+
 
 # ============================================================================
 # Physics Integration
@@ -297,6 +576,9 @@ class BakedAnimation(BaseModel):
     fps: int = Field(default=60, description="Frames per second")
     frames: int = Field(description="Total number of frames")
     data_path: str = Field(description="VFS path to animation data (binary or JSON)")
+    format: AnimationFormat = Field(
+        default=AnimationFormat.JSON, description="Encoding of the data at data_path"
+    )
 
 
 # ============================================================================
@@ -307,6 +589,8 @@ class BakedAnimation(BaseModel):
 class SceneMetadata(BaseModel):
     """Scene metadata."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     author: Optional[str] = None
     created: Optional[str] = None
     description: Optional[str] = None
@@ -487,6 +771,7 @@ class ExportSceneResponse(BaseModel):
     artifacts: dict[str, str] = Field(
         default_factory=dict, description="Additional generated files"
     )
+    bytes_written: int = Field(default=0, description="Total bytes written by the export")
     message: str = "Scene exported successfully"
 
 
@@ -4,17 +4,302 @@ Integrates physics simulations (Rapier) with scene objects,
 allowing simulation data to drive scene animations.
 """
 
+import asyncio
+import bisect
 import json
 import logging
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional
 
 import httpx
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 from .config import Config
-from .models import Vector3, Quaternion
+from . import _json
+from .models import Q_IDENTITY, V_ZERO, Quaternion, Vector3
 
 logger = logging.getLogger(__name__)
 
+# Seconds an idle pooled connection to the Rapier service is kept open
+_KEEPALIVE_EXPIRY = 30.0
+
+# Target size of the chunks iter_keyframes_json yields (~250 keyframes each)
+_KEYFRAME_JSON_CHUNK_BYTES = 64 * 1024
+
+# Sort key for binary searches over keyframe lists
+_keyframe_time = itemgetter("time")
+
+
+# Packed trajectory header: magic, float typecode ("f" or "d"), frame count.
+# Columns follow as little-endian floats: times, positions, rotations, velocities.
+_TRAJECTORY_MAGIC = b"BKTR"
+_TRAJECTORY_HEADER = struct.Struct("<4scI")
+_TRAJECTORY_STRIDES = (1, 3, 4, 3)
+
+
+# Above this quaternion dot product the slerp angle is too small for a stable
+# sin() division, and normalized lerp is indistinguishable from slerp
+_SLERP_NLERP_THRESHOLD = 0.9995
+
+
+def _slerp(q0: Sequence[float], q1: Sequence[float], t: float) -> tuple[float, float, float, float]:
+    """Spherically interpolate between two (x, y, z, w) quaternions.
+
+    Takes the shorter arc (q1 is negated when the dot product is negative)
+    and falls back to normalized lerp for nearly identical rotations.
+
+    Args:
+        q0: Rotation at t=0
+        q1: Rotation at t=1
+        t: Interpolation factor in [0, 1]
+
+    Returns:
+        Interpolated quaternion as (x, y, z, w)
+    """
+    x0, y0, z0, w0 = q0
+    x1, y1, z1, w1 = q1
+    d = x0 * x1 + y0 * y1 + z0 * z1 + w0 * w1
+    if d < 0.0:
+        x1, y1, z1, w1 = -x1, -y1, -z1, -w1
+        d = -d
+
+    if d > _SLERP_NLERP_THRESHOLD:
+        x = x0 + t * (x1 - x0)
+        y = y0 + t * (y1 - y0)
+        z = z0 + t * (z1 - z0)
+        w = w0 + t * (w1 - w0)
+        norm = math.sqrt(x * x + y * y + z * z + w * w)
+        return x / norm, y / norm, z / norm, w / norm
+
+    theta = math.acos(d)
+    sin_theta = math.sin(theta)
+    s0 = math.sin((1.0 - t) * theta) / sin_theta
+    s1 = math.sin(t * theta) / sin_theta
+    return (
+        s0 * x0 + s1 * x1,
+        s0 * y0 + s1 * y1,
+        s0 * z0 + s1 * z1,
+        s0 * w0 + s1 * w1,
+    )
+
+
+# (position, rotation, velocity) as plain (x, y, z), (x, y, z, w), (x, y, z) tuples
+RawState = tuple[
+    tuple[float, float, float], tuple[float, float, float, float], tuple[float, float, float]
+]
+
+# Raw state for an empty trajectory: at the origin, at rest, unrotated
+_RAW_REST: RawState = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0), (0.0, 0.0, 0.0))
+
+
+def _state_models(raw: RawState) -> tuple[Vector3, Quaternion, Vector3]:
+    """Build the (position, rotation, velocity) models for a raw state."""
+    (px, py, pz), (rx, ry, rz, rw), (vx, vy, vz) = raw
+    return (
+        Vector3(x=px, y=py, z=pz),
+        Quaternion(x=rx, y=ry, z=rz, w=rw),
+        Vector3(x=vx, y=vy, z=vz),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BakedTrajectory:
+    """Baked keyframes stored column-wise in packed float arrays.
+
+    A struct-of-arrays alternative to the ``list[dict]`` keyframe format:
+    each column is one contiguous ``array('d')`` (positions, rotations and
+    velocities flattened with a stride of 3, 4 and 3), so a long trajectory
+    costs 8 bytes per component instead of a dict, three lists and a float
+    object per frame, and lookups skip the per-frame dict indexing.
+    """
+
+    times: array
+    positions: array
+    rotations: array
+    velocities: array
+
+    @classmethod
+    def from_keyframes(cls, keyframes: Iterable[dict]) -> "BakedTrajectory":
+        """Pack keyframe dicts (as returned by ``bake_simulation``).
+
+        Args:
+            keyframes: Keyframes sorted by time
+
+        Returns:
+            Packed trajectory
+        """
+        times = array("d")
+        positions = array("d")
+        rotations = array("d")
+        velocities = array("d")
+        for kf in keyframes:
+            times.append(kf["time"])
+            positions.extend(kf["position"][:3])
+            rotations.extend(kf["rotation"][:4])
+            velocities.extend(kf["velocity"][:3])
+        return cls(times, positions, rotations, velocities)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def to_keyframes(self) -> list[dict]:
+        """Unpack back into keyframe dicts.
+
+        Returns:
+            List of keyframe dicts
+        """
+        p, r, v = self.positions, self.rotations, self.velocities
+        return [
+            {
+                "time": time,
+                "position": list(p[i * 3 : i * 3 + 3]),
+                "rotation": list(r[i * 4 : i * 4 + 4]),
+                "velocity": list(v[i * 3 : i * 3 + 3]),
+            }
+            for i, time in enumerate(self.times)
+        ]
+
+    def to_bytes(self, typecode: str = "f") -> bytes:
+        """Serialize to a compact little-endian binary blob.
+
+        Float32 (the default) is plenty for playback and is several times
+        smaller than the equivalent keyframe JSON.
+
+        Args:
+            typecode: "f" for float32 or "d" for float64 columns
+
+        Returns:
+            Header followed by the four packed columns
+
+        Raises:
+            ValueError: If typecode is not "f" or "d"
+        """
+        if typecode not in ("f", "d"):
+            raise ValueError(f"Unsupported typecode {typecode!r}, expected 'f' or 'd'")
+
+        header = _TRAJECTORY_HEADER.pack(_TRAJECTORY_MAGIC, typecode.encode(), len(self))
+        chunks = [header]
+        for column in (self.times, self.positions, self.rotations, self.velocities):
+            packed = array(typecode, column)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            chunks.append(packed.tobytes())
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BakedTrajectory":
+        """Deserialize a blob written by ``to_bytes``.
+
+        Args:
+            data: Serialized trajectory
+
+        Returns:
+            Packed trajectory (float64 columns)
+
+        Raises:
+            ValueError: If data is not a serialized trajectory
+        """
+        try:
+            magic, typecode, count = _TRAJECTORY_HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Invalid trajectory data: {e}") from e
+        if magic != _TRAJECTORY_MAGIC or typecode not in (b"f", b"d"):
+            raise ValueError("Invalid trajectory data: bad header")
+
+        itemsize = 4 if typecode == b"f" else 8
+        if len(data) != _TRAJECTORY_HEADER.size + count * sum(_TRAJECTORY_STRIDES) * itemsize:
+            raise ValueError("Invalid trajectory data: length does not match frame count")
+
+        columns = []
+        offset = _TRAJECTORY_HEADER.size
+        for stride in _TRAJECTORY_STRIDES:
+            size = count * stride * itemsize
+            packed = array(typecode.decode())
+            packed.frombytes(data[offset : offset + size])
+            if sys.byteorder == "big":
+                packed.byteswap()
+            columns.append(packed if itemsize == 8 else array("d", packed))
+            offset += size
+        return cls(*columns)
+
+    def _state(self, i: int) -> RawState:
+        """Position, rotation and velocity stored in frame i."""
+        return (
+            tuple(self.positions[i * 3 : i * 3 + 3]),
+            tuple(self.rotations[i * 4 : i * 4 + 4]),
+            tuple(self.velocities[i * 3 : i * 3 + 3]),
+        )
+
+    def interpolate(self, time: float) -> tuple[Vector3, Quaternion, Vector3]:
+        """Interpolate position/rotation/velocity at a specific time.
+
+        Same results as ``PhysicsBridge.interpolate_keyframe`` on the
+        equivalent keyframe dicts.
+
+        Args:
+            time: Time to interpolate at
+
+        Returns:
+            Tuple of (position, rotation, velocity)
+        """
+        if not self.times:
+            return V_ZERO, Q_IDENTITY, V_ZERO
+        return _state_models(self.interpolate_raw(time))
+
+    def interpolate_raw(self, time: float) -> RawState:
+        """Interpolate at a specific time, returning plain tuples.
+
+        Args:
+            time: Time to interpolate at
+
+        Returns:
+            Tuple of (position, rotation, velocity) component tuples
+        """
+        if not self.times:
+            return _RAW_REST
+        return self._interpolate_at(bisect.bisect_left(self.times, time), time)
+
+    def _interpolate_at(self, idx: int, time: float) -> RawState:
+        """Interpolate at time, given idx = bisect_left of time in the times column."""
+        times = self.times
+        if idx == 0:
+            return self._state(0)
+        if idx == len(times):
+            return self._state(idx - 1)
+        if times[idx] == time:
+            return self._state(idx)
+
+        t0 = times[idx - 1]
+        t = (time - t0) / (times[idx] - t0)
+
+        p, v = self.positions, self.velocities
+        j = (idx - 1) * 3
+        pos = (
+            p[j] + t * (p[j + 3] - p[j]),
+            p[j + 1] + t * (p[j + 4] - p[j + 1]),
+            p[j + 2] + t * (p[j + 5] - p[j + 2]),
+        )
+        vel = (
+            v[j] + t * (v[j + 3] - v[j]),
+            v[j + 1] + t * (v[j + 4] - v[j + 1]),
+            v[j + 2] + t * (v[j + 5] - v[j + 2]),
+        )
+
+        k = (idx - 1) * 4
+        return pos, _slerp(self.rotations[k : k + 4], self.rotations[k + 4 : k + 8], t), vel
+
 
 class PhysicsBridge:
     """Bridge between physics simulations and scene objects."""
@@ -36,7 +321,21 @@ class PhysicsBridge:
         """Async context manager entry."""
         if self.physics_server_url:
             timeout = Config.get_rapier_timeout()
-            self._client = httpx.AsyncClient(base_url=self.physics_server_url, timeout=timeout)
+            # Keep enough pooled connections for a full concurrent bake, and
+            # reuse them across body requests instead of re-handshaking
+            concurrency = Config.get_rapier_concurrency()
+            limits = httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            )
+            # HTTP/2 multiplexes concurrent body requests over one TLS connection
+            # (needs h2 installed; servers without it are spoken to over HTTP/1.1).
+            # retries=1 retries failed connection attempts, not failed requests.
+            transport = httpx.AsyncHTTPTransport(limits=limits, http2=_HTTP2_AVAILABLE, retries=1)
+            self._client = httpx.AsyncClient(
+                base_url=self.physics_server_url, timeout=timeout, transport=transport
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -67,7 +366,8 @@ class PhysicsBridge:
             ValueError: If physics server is not configured
             httpx.HTTPError: If physics server request fails
         """
-        if not self._client:
+        client = self._client
+        if not client:
             raise ValueError(
                 f"Physics client not initialized. Ensure PhysicsBridge is used as async context manager. "
                 f"Rapier service URL: {self.physics_server_url}"
@@ -75,53 +375,87 @@ class PhysicsBridge:
 
         logger.info(f"Baking simulation {simulation_id} for {len(body_ids)} bodies at {fps} FPS")
 
-        # Request trajectory data from physics server
-        # This assumes chuk-mcp-physics has a compatible endpoint
-        # For now, we'll use the record_trajectory tool via HTTP API
-
-        baked_data: dict[str, list[dict]] = {}
-
-        for body_id in body_ids:
-            # Calculate number of steps from duration and fps
-            if duration:
-                steps = int(duration * fps)
-            else:
-                # Get current simulation time/steps
-                steps = 600  # Default 10 seconds at 60 FPS
-
-            # Call physics server to get trajectory
-            # Rapier service endpoint: POST /simulations/{sim_id}/bodies/{body_id}/trajectory
-            try:
-                response = await self._client.post(
-                    f"/simulations/{simulation_id}/bodies/{body_id}/trajectory",
-                    json={
-                        "steps": steps,
-                        "dt": 1.0 / fps,
-                    },
-                )
-                response.raise_for_status()
-                trajectory_data = response.json()
-
-                # Convert to our keyframe format
-                keyframes = []
-                for frame in trajectory_data.get("frames", []):
-                    keyframes.append(
-                        {
-                            "time": frame["time"],
-                            "position": frame["position"],
-                            "rotation": frame["orientation"],
-                            "velocity": frame.get("velocity", [0, 0, 0]),
-                        }
-                    )
-
-                baked_data[body_id] = keyframes
-                logger.info(f"Baked {len(keyframes)} frames for body {body_id}")
-
-            except httpx.HTTPError as e:
-                logger.error(f"Failed to bake trajectory for {body_id}: {e}")
-                raise
-
-        return baked_data
+        # Calculate number of steps from duration and fps
+        # (default 10 seconds at 60 FPS when no duration is given)
+        steps = int(duration * fps) if duration else 600
+
+        # Bodies are independent, so fetch their trajectories concurrently,
+        # bounded so we don't flood the Rapier service
+        semaphore = asyncio.Semaphore(Config.get_rapier_concurrency())
+
+        async def guarded(body_id: str) -> tuple[str, list[dict]]:
+            async with semaphore:
+                return await self._fetch_one(client, simulation_id, body_id, steps, fps)
+
+        tasks = [asyncio.ensure_future(guarded(body_id)) for body_id in body_ids]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather() leaves siblings running when one fails; stop them
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return dict(results)
+
+    async def _fetch_one(
+        self,
+        client: httpx.AsyncClient,
+        simulation_id: str,
+        body_id: str,
+        steps: int,
+        fps: int,
+    ) -> tuple[str, list[dict]]:
+        """Fetch and convert one body's trajectory.
+
+        Args:
+            client: Open HTTP client for the Rapier service
+            simulation_id: Physics simulation ID
+            body_id: Physics body ID
+            steps: Number of simulation steps to record
+            fps: Frames per second for sampling
+
+        Returns:
+            Tuple of (body_id, keyframes)
+
+        Raises:
+            httpx.HTTPError: If physics server request fails
+        """
+        # Call physics server to get trajectory
+        # Rapier service endpoint: POST /simulations/{sim_id}/bodies/{body_id}/trajectory
+        try:
+            response = await client.post(
+                f"/simulations/{simulation_id}/bodies/{body_id}/trajectory",
+                json={
+                    "steps": steps,
+                    "dt": 1.0 / fps,
+                },
+            )
+            response.raise_for_status()
+            # orjson (the "fast" extra) parses float-heavy trajectories ~4x faster
+            orjson = _json.json_backend()
+            trajectory_data = (
+                orjson.loads(response.content) if orjson is not None else response.json()
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to bake trajectory for {body_id}: {e}")
+            raise
+
+        # Convert to our keyframe format
+        keyframes = [
+            {
+                "time": frame["time"],
+                "position": frame["position"],
+                "rotation": frame["orientation"],
+                # Conditional rather than .get: the [0, 0, 0] default is only built
+                # for frames that lack a velocity, not once per frame
+                "velocity": frame["velocity"] if "velocity" in frame else [0, 0, 0],  # noqa: SIM401
+            }
+            for frame in trajectory_data.get("frames", [])
+        ]
+
+        logger.info(f"Baked {len(keyframes)} frames for body {body_id}")
+        return body_id, keyframes
 
     @staticmethod
     def keyframes_to_json(keyframes: list[dict]) -> str:
@@ -135,6 +469,39 @@ class PhysicsBridge:
         """
         return json.dumps(keyframes, indent=2)
 
+    @staticmethod
+    def iter_keyframes_json(
+        keyframes: Iterable[dict], chunk_bytes: int = _KEYFRAME_JSON_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Serialize keyframes as a compact JSON array, in chunks.
+
+        Frames are encoded one at a time (with orjson when installed) and
+        yielded in chunks of roughly chunk_bytes, so a long bake can be
+        streamed to storage without holding the whole document in memory.
+
+        Args:
+            keyframes: Keyframe dicts
+            chunk_bytes: Approximate size of each yielded chunk
+
+        Yields:
+            UTF-8 JSON chunks that concatenate to one array
+        """
+        dumps = _json.dumps_compact
+        parts = [b"["]
+        size = 1
+        for i, keyframe in enumerate(keyframes):
+            if i:
+                parts.append(b",")
+            data = dumps(keyframe)
+            parts.append(data)
+            size += len(data) + 1
+            if size >= chunk_bytes:
+                yield b"".join(parts)
+                parts = []
+                size = 0
+        parts.append(b"]")
+        yield b"".join(parts)
+
     @staticmethod
     def keyframes_from_json(json_str: str) -> list[dict]:
         """Parse keyframes from JSON string.
@@ -147,97 +514,232 @@ class PhysicsBridge:
         """
         return json.loads(json_str)
 
+    @staticmethod
+    def _keyframe_state(kf: dict) -> RawState:
+        """Position, rotation and velocity stored in a single keyframe."""
+        return tuple(kf["position"][:3]), tuple(kf["rotation"][:4]), tuple(kf["velocity"][:3])
+
     @staticmethod
     def interpolate_keyframe(
-        keyframes: list[dict], time: float
+        keyframes: list[dict] | BakedTrajectory, time: float
     ) -> tuple[Vector3, Quaternion, Vector3]:
         """Interpolate position/rotation/velocity at a specific time.
 
         Args:
-            keyframes: List of keyframes
+            keyframes: List of keyframes, or a packed BakedTrajectory
             time: Time to interpolate at
 
         Returns:
             Tuple of (position, rotation, velocity)
         """
         if not keyframes:
-            return Vector3(), Quaternion(), Vector3()
+            return V_ZERO, Q_IDENTITY, V_ZERO
+        return _state_models(PhysicsBridge.interpolate_keyframe_raw(keyframes, time))
 
-        # Find surrounding keyframes
-        before = None
-        after = None
+    @staticmethod
+    def interpolate_keyframe_raw(keyframes: list[dict] | BakedTrajectory, time: float) -> RawState:
+        """Interpolate at a specific time, returning plain tuples.
 
-        for i, kf in enumerate(keyframes):
-            if kf["time"] <= time:
-                before = kf
-            if kf["time"] >= time:
-                after = kf
-                break
+        Same values as ``interpolate_keyframe`` without building the
+        Vector3/Quaternion models, which dominate the cost of a lookup. Use
+        this in tight sampling loops and build models only for what is kept.
 
-        # If exactly on a keyframe, return it
-        if before and before["time"] == time:
-            return (
-                Vector3(x=before["position"][0], y=before["position"][1], z=before["position"][2]),
-                Quaternion(
-                    x=before["rotation"][0],
-                    y=before["rotation"][1],
-                    z=before["rotation"][2],
-                    w=before["rotation"][3],
-                ),
-                Vector3(x=before["velocity"][0], y=before["velocity"][1], z=before["velocity"][2]),
+        Args:
+            keyframes: List of keyframes, or a packed BakedTrajectory
+            time: Time to interpolate at
+
+        Returns:
+            Tuple of (position, rotation, velocity) component tuples
+        """
+        if isinstance(keyframes, BakedTrajectory):
+            return keyframes.interpolate_raw(time)
+
+        if not keyframes:
+            return _RAW_REST
+
+        # Keyframes are sorted by time, so binary-search the first one at or
+        # after the requested time (O(log n) instead of a linear scan)
+        idx = bisect.bisect_left(keyframes, time, key=_keyframe_time)
+        return PhysicsBridge._interpolate_at(keyframes, idx, time)
+
+    @staticmethod
+    def interpolate_keyframes(
+        keyframes: list[dict] | BakedTrajectory, times: Iterable[float]
+    ) -> list[tuple[Vector3, Quaternion, Vector3]]:
+        """Interpolate position/rotation/velocity at many times.
+
+        The keyframe times are pulled out once into a plain float list (or, for
+        a BakedTrajectory, its packed times column is used as-is), so each
+        query is a single C-level bisect instead of a keyed search. Queries are
+        evaluated in one loop that unpacks each keyframe segment once and
+        reuses it for every query falling inside it, which is the common case
+        when sampling a trajectory per video frame.
+
+        Args:
+            keyframes: List of keyframes (sorted by time), or a packed BakedTrajectory
+            times: Times to interpolate at (any order)
+
+        Returns:
+            List of (position, rotation, velocity) tuples, one per time
+        """
+        if isinstance(keyframes, BakedTrajectory):
+            return [keyframes.interpolate(time) for time in times]
+
+        if not keyframes:
+            return [(V_ZERO, Q_IDENTITY, V_ZERO) for _ in times]
+
+        keyframe_times = [kf["time"] for kf in keyframes]
+        count = len(keyframes)
+        results = []
+        segment = -1
+
+        for time in times:
+            idx = bisect.bisect_left(keyframe_times, time)
+
+            # Clamped or exactly on a keyframe: no interpolation needed
+            if idx == 0 or idx == count or keyframe_times[idx] == time:
+                results.append(_state_models(PhysicsBridge._interpolate_at(keyframes, idx, time)))
+                continue
+
+            if idx != segment:
+                segment = idx
+                before = keyframes[idx - 1]
+                after = keyframes[idx]
+                t0 = before["time"]
+                span = after["time"] - t0
+                px, py, pz = before["position"][:3]
+                dpx = after["position"][0] - px
+                dpy = after["position"][1] - py
+                dpz = after["position"][2] - pz
+                vx, vy, vz = before["velocity"][:3]
+                dvx = after["velocity"][0] - vx
+                dvy = after["velocity"][1] - vy
+                dvz = after["velocity"][2] - vz
+                r0 = before["rotation"]
+                r1 = after["rotation"]
+
+            t = (time - t0) / span
+            rx, ry, rz, rw = _slerp(r0, r1, t)
+            results.append(
+                (
+                    Vector3(x=px + t * dpx, y=py + t * dpy, z=pz + t * dpz),
+                    Quaternion(x=rx, y=ry, z=rz, w=rw),
+                    Vector3(x=vx + t * dvx, y=vy + t * dvy, z=vz + t * dvz),
+                )
             )
 
+        return results
+
+    @staticmethod
+    def _interpolate_at(keyframes: list[dict], idx: int, time: float) -> RawState:
+        """Interpolate at time, given idx = bisect_left of time in the keyframe times."""
         # If before first keyframe, return first
-        if not before:
-            kf = keyframes[0]
-            return (
-                Vector3(x=kf["position"][0], y=kf["position"][1], z=kf["position"][2]),
-                Quaternion(
-                    x=kf["rotation"][0],
-                    y=kf["rotation"][1],
-                    z=kf["rotation"][2],
-                    w=kf["rotation"][3],
-                ),
-                Vector3(x=kf["velocity"][0], y=kf["velocity"][1], z=kf["velocity"][2]),
-            )
+        if idx == 0:
+            return PhysicsBridge._keyframe_state(keyframes[0])
 
         # If after last keyframe, return last
-        if not after:
-            kf = keyframes[-1]
-            return (
-                Vector3(x=kf["position"][0], y=kf["position"][1], z=kf["position"][2]),
-                Quaternion(
-                    x=kf["rotation"][0],
-                    y=kf["rotation"][1],
-                    z=kf["rotation"][2],
-                    w=kf["rotation"][3],
-                ),
-                Vector3(x=kf["velocity"][0], y=kf["velocity"][1], z=kf["velocity"][2]),
-            )
+        if idx == len(keyframes):
+            return PhysicsBridge._keyframe_state(keyframes[-1])
+
+        # If exactly on a keyframe, return it
+        after = keyframes[idx]
+        if after["time"] == time:
+            return PhysicsBridge._keyframe_state(after)
+
+        before = keyframes[idx - 1]
 
         # Linear interpolation between before and after
         t = (time - before["time"]) / (after["time"] - before["time"])
 
         # Lerp position
-        pos = Vector3(
-            x=before["position"][0] + t * (after["position"][0] - before["position"][0]),
-            y=before["position"][1] + t * (after["position"][1] - before["position"][1]),
-            z=before["position"][2] + t * (after["position"][2] - before["position"][2]),
+        pos = (
+            before["position"][0] + t * (after["position"][0] - before["position"][0]),
+            before["position"][1] + t * (after["position"][1] - before["position"][1]),
+            before["position"][2] + t * (after["position"][2] - before["position"][2]),
         )
 
-        # For quaternions, should use slerp, but linear works for small timesteps
-        rot = Quaternion(
-            x=before["rotation"][0] + t * (after["rotation"][0] - before["rotation"][0]),
-            y=before["rotation"][1] + t * (after["rotation"][1] - before["rotation"][1]),
-            z=before["rotation"][2] + t * (after["rotation"][2] - before["rotation"][2]),
-            w=before["rotation"][3] + t * (after["rotation"][3] - before["rotation"][3]),
-        )
+        # Slerp rotation (constant angular velocity, stays unit length)
+        rot = _slerp(before["rotation"], after["rotation"], t)
 
         # Lerp velocity
-        vel = Vector3(
-            x=before["velocity"][0] + t * (after["velocity"][0] - before["velocity"][0]),
-            y=before["velocity"][1] + t * (after["velocity"][1] - before["velocity"][1]),
-            z=before["velocity"][2] + t * (after["velocity"][2] - before["velocity"][2]),
+        vel = (
+            before["velocity"][0] + t * (after["velocity"][0] - before["velocity"][0]),
+            before["velocity"][1] + t * (after["velocity"][1] - before["velocity"][1]),
+            before["velocity"][2] + t * (after["velocity"][2] - before["velocity"][2]),
         )
 
         return pos, rot, vel
+
+
+class KeyframeCursor:
+    """Samples one keyframe list at (mostly) increasing times.
+
+    Remembers the keyframe segment of the previous sample, so a render loop
+    stepping forward frame by frame finds each segment in O(1) instead of
+    binary-searching the whole list. Out-of-order times still work; they
+    just fall back to a binary search.
+
+    Example:
+        cursor = KeyframeCursor(keyframes)
+        for frame in range(total_frames):
+            position, rotation, velocity = cursor.sample(frame / fps)
+    """
+
+    __slots__ = ("_idx", "_keyframes", "_times")
+
+    def __init__(self, keyframes: list[dict] | BakedTrajectory):
+        """Initialize a cursor at the start of the keyframes.
+
+        Args:
+            keyframes: List of keyframes (sorted by time), or a packed BakedTrajectory
+        """
+        self._keyframes = keyframes
+        if isinstance(keyframes, BakedTrajectory):
+            self._times: Sequence[float] = keyframes.times
+        else:
+            self._times = [kf["time"] for kf in keyframes]
+        self._idx = 0
+
+    def _index(self, time: float) -> int:
+        """Get bisect_left of time in the keyframe times, trying the last segment first."""
+        times = self._times
+        idx = self._idx
+        # bisect_left(times, time) is the idx with times[idx - 1] < time <= times[idx]
+        if 0 < idx < len(times) and times[idx - 1] < time:
+            if time <= times[idx]:
+                return idx
+            if idx + 1 < len(times) and time <= times[idx + 1]:
+                self._idx = idx + 1
+                return idx + 1
+        self._idx = idx = bisect.bisect_left(times, time)
+        return idx
+
+    def sample(self, time: float) -> tuple[Vector3, Quaternion, Vector3]:
+        """Interpolate position/rotation/velocity at a specific time.
+
+        Args:
+            time: Time to interpolate at
+
+        Returns:
+            Tuple of (position, rotation, velocity), as interpolate_keyframe
+        """
+        if not self._times:
+            return V_ZERO, Q_IDENTITY, V_ZERO
+        return _state_models(self.sample_raw(time))
+
+    def sample_raw(self, time: float) -> RawState:
+        """Interpolate at a specific time, returning plain tuples.
+
+        Args:
+            time: Time to interpolate at
+
+        Returns:
+            Tuple of (position, rotation, velocity) component tuples, as
+            interpolate_keyframe_raw
+        """
+        if not self._times:
+            return _RAW_REST
+        idx = self._index(time)
+        if isinstance(self._keyframes, BakedTrajectory):
+            return self._keyframes._interpolate_at(idx, time)
+        return PhysicsBridge._interpolate_at(self._keyframes, idx, time)
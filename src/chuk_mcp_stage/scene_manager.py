@@ -4,8 +4,11 @@ Manages 3D scenes using chuk-artifacts for storage.
 Each scene is a workspace namespace with structured scene data.
 """
 
+import asyncio
+import itertools
 import logging
-from typing import Optional
+from collections.abc import Awaitable, Iterable, Iterator
+from typing import Optional, TypeVar
 
 from chuk_artifacts import ArtifactStore, NamespaceType, StorageScope
 
@@ -22,9 +25,46 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Scene fields stored one file per entry instead of in /scene.json
+_SHARDED_FIELDS = {"objects", "shots"}
+
+# Most shard reads/writes in flight at once when a whole scene is loaded or saved
+_STORAGE_CONCURRENCY = 32
+
+
+def _is_shard_name(name: str) -> bool:
+    """Check whether a file name is a numbered shard, e.g. "00000004.json"."""
+    return name.endswith(".json") and name.removesuffix(".json").isdecimal()
+
+
+async def _gather_bounded(aws: Iterable[Awaitable[_T]]) -> list[_T]:
+    """Await several storage calls concurrently, at most _STORAGE_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(_STORAGE_CONCURRENCY)
+
+    async def run(aw: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
+
 
 class SceneManager:
-    """Manages 3D scenes with chuk-artifacts storage."""
+    """Manages 3D scenes with chuk-artifacts storage.
+
+    Mutations are applied to the cached scene immediately and each one only
+    touches its own part of the scene (objects, shots, environment, ...), so
+    independent mutations may run concurrently, e.g. in an asyncio.TaskGroup.
+    Saves are serialized per scene and snapshot the scene once the lock is
+    held, so the last save to finish always carries every applied mutation.
+
+    Storage is sharded so a mutation only rewrites what it changed: objects
+    and shots live in one file each under ``/objects`` and ``/shots``, and
+    ``/scene.json`` holds everything else. Shard files are numbered in
+    insertion order, which is how the order of ``objects``/``shots``
+    survives a reload.
+    """
 
     def __init__(self, store: Optional[ArtifactStore] = None):
         """Initialize scene manager.
@@ -52,6 +92,10 @@ class SceneManager:
 
         self._scenes: dict[str, Scene] = {}  # In-memory cache
         self._scene_to_namespace: dict[str, str] = {}  # scene_id -> namespace_id
+        self._save_locks: dict[str, asyncio.Lock] = {}  # scene_id -> save lock
+        # scene_id -> {(collection, item_id): shard path}, and next shard number
+        self._shard_paths: dict[str, dict[tuple[str, str], str]] = {}
+        self._shard_counters: dict[str, Iterator[int]] = {}
 
     async def create_scene(
         self,
@@ -60,6 +104,8 @@ class SceneManager:
         metadata: Optional[SceneMetadata] = None,
         scope: StorageScope = StorageScope.SESSION,
         user_id: Optional[str] = None,
+        objects: Optional[list[SceneObject]] = None,
+        shots: Optional[list[Shot]] = None,
     ) -> Scene:
         """Create a new scene.
 
@@ -69,6 +115,8 @@ class SceneManager:
             metadata: Optional scene metadata
             scope: Storage scope (SESSION, USER, or SANDBOX)
             user_id: User ID (required for USER scope)
+            objects: Optional initial objects, saved with the scene in one write
+            shots: Optional initial shots, saved with the scene in one write
 
         Returns:
             Created Scene object
@@ -88,9 +136,13 @@ class SceneManager:
             id=scene_id,
             name=name,
             metadata=metadata or SceneMetadata(),
+            objects={obj.id: obj for obj in objects or []},
+            shots={shot.id: shot for shot in shots or []},
         )
 
-        # Save to storage
+        # Save to storage (a re-created scene starts with fresh shard numbering)
+        self._shard_paths.pop(scene_id, None)
+        self._shard_counters.pop(scene_id, None)
         await self._save_scene(scene, namespace.namespace_id)
 
         # Cache
@@ -126,6 +178,27 @@ class SceneManager:
         self._scenes[scene_id] = scene
         return scene
 
+    def snapshot(self, scene_id: str) -> Scene:
+        """Get a cached scene without touching storage.
+
+        Returns the live in-memory scene, not a copy: later mutations through
+        the manager show up in it, and changes made to it directly are not
+        persisted until the next save.
+
+        Args:
+            scene_id: Scene identifier
+
+        Returns:
+            Cached Scene object
+
+        Raises:
+            ValueError: If scene is not loaded in this manager
+        """
+        try:
+            return self._scenes[scene_id]
+        except KeyError:
+            raise ValueError(f"Scene not loaded: {scene_id}") from None
+
     async def add_object(self, scene_id: str, obj: SceneObject) -> None:
         """Add object to scene.
 
@@ -135,7 +208,20 @@ class SceneManager:
         """
         scene = await self.get_scene(scene_id)
         scene.objects[obj.id] = obj
-        await self._save_scene(scene, self._scene_to_namespace[scene_id])
+        await self._save_scene(scene, self._scene_to_namespace[scene_id], objects=[obj.id])
+
+    async def add_objects(self, scene_id: str, objects: list[SceneObject]) -> None:
+        """Add several objects to a scene with a single save.
+
+        Args:
+            scene_id: Scene identifier
+            objects: SceneObjects to add
+        """
+        scene = await self.get_scene(scene_id)
+        scene.objects.update({obj.id: obj for obj in objects})
+        await self._save_scene(
+            scene, self._scene_to_namespace[scene_id], objects=[obj.id for obj in objects]
+        )
 
     async def set_environment(
         self, scene_id: str, environment: Environment, lighting: Optional[Lighting] = None
@@ -151,7 +237,7 @@ class SceneManager:
         scene.environment = environment
         if lighting:
             scene.lighting = lighting
-        await self._save_scene(scene, self._scene_to_namespace[scene_id])
+        await self._save_scene(scene, self._scene_to_namespace[scene_id], header=True)
 
     async def add_shot(self, scene_id: str, shot: Shot) -> None:
         """Add shot to scene.
@@ -162,7 +248,20 @@ class SceneManager:
         """
         scene = await self.get_scene(scene_id)
         scene.shots[shot.id] = shot
-        await self._save_scene(scene, self._scene_to_namespace[scene_id])
+        await self._save_scene(scene, self._scene_to_namespace[scene_id], shots=[shot.id])
+
+    async def add_shots(self, scene_id: str, shots: list[Shot]) -> None:
+        """Add several shots to a scene with a single save.
+
+        Args:
+            scene_id: Scene identifier
+            shots: Shot definitions to add
+        """
+        scene = await self.get_scene(scene_id)
+        scene.shots.update({shot.id: shot for shot in shots})
+        await self._save_scene(
+            scene, self._scene_to_namespace[scene_id], shots=[shot.id for shot in shots]
+        )
 
     async def get_shot(self, scene_id: str, shot_id: str) -> Shot:
         """Get shot from scene.
@@ -197,8 +296,11 @@ class SceneManager:
         if object_id not in scene.objects:
             raise ValueError(f"Object not found: {object_id}")
 
-        scene.objects[object_id].physics_binding = physics_body_id
-        await self._save_scene(scene, self._scene_to_namespace[scene_id])
+        # Scene objects are frozen - replace the object with an updated copy
+        scene.objects[object_id] = scene.objects[object_id].model_copy(
+            update={"physics_binding": physics_body_id}
+        )
+        await self._save_scene(scene, self._scene_to_namespace[scene_id], objects=[object_id])
 
     async def add_baked_animation(
         self, scene_id: str, object_id: str, animation: BakedAnimation
@@ -213,12 +315,27 @@ class SceneManager:
         Raises:
             ValueError: If object not found
         """
+        await self.add_baked_animations(scene_id, {object_id: animation})
+
+    async def add_baked_animations(
+        self, scene_id: str, animations: dict[str, BakedAnimation]
+    ) -> None:
+        """Add baked animation data for several objects with one header save.
+
+        Args:
+            scene_id: Scene identifier
+            animations: BakedAnimation data by object identifier
+
+        Raises:
+            ValueError: If any object is not found (nothing is added)
+        """
         scene = await self.get_scene(scene_id)
-        if object_id not in scene.objects:
-            raise ValueError(f"Object not found: {object_id}")
+        for object_id in animations:
+            if object_id not in scene.objects:
+                raise ValueError(f"Object not found: {object_id}")
 
-        scene.baked_animations[object_id] = animation
-        await self._save_scene(scene, self._scene_to_namespace[scene_id])
+        scene.baked_animations.update(animations)
+        await self._save_scene(scene, self._scene_to_namespace[scene_id], header=True)
 
     async def get_scene_vfs(self, scene_id: str):
         """Get VFS access for scene workspace.
@@ -239,38 +356,121 @@ class SceneManager:
     # Private Storage Methods
     # ============================================================================
 
-    async def _save_scene(self, scene: Scene, namespace_id: str) -> None:
+    def _shard_path(self, scene_id: str, collection: str, item_id: str) -> str:
+        """Get the storage path of an object or shot, allocating one if new.
+
+        Args:
+            scene_id: Scene identifier
+            collection: "objects" or "shots"
+            item_id: Object or shot identifier
+
+        Returns:
+            Namespace path of the shard file
+        """
+        paths = self._shard_paths.setdefault(scene_id, {})
+        path = paths.get((collection, item_id))
+        if path is None:
+            # One counter across both collections keeps every name unique
+            number = next(self._shard_counters.setdefault(scene_id, itertools.count()))
+            path = paths[(collection, item_id)] = f"/{collection}/{number:08d}.json"
+        return path
+
+    async def _save_scene(
+        self,
+        scene: Scene,
+        namespace_id: str,
+        objects: Optional[Iterable[str]] = None,
+        shots: Optional[Iterable[str]] = None,
+        header: bool = False,
+    ) -> None:
         """Save scene to storage.
 
+        With no parts selected the whole scene is written. Otherwise only the
+        selected object/shot shards and, if requested, the scene header are.
+
         Args:
             scene: Scene to save
             namespace_id: Namespace ID for storage
+            objects: IDs of objects to write
+            shots: IDs of shots to write
+            header: Write /scene.json (everything except objects and shots)
         """
-        # Convert scene to JSON
-        scene_json = scene.model_dump_json(indent=2)
-
-        # Write to namespace
-        await self._store.write_namespace(
-            namespace_id, path="/scene.json", data=scene_json.encode("utf-8")
-        )
+        if objects is None and shots is None and not header:
+            objects, shots, header = scene.objects, scene.shots, True
+
+        # Allocate shard paths before waiting on the lock, so new shards are
+        # numbered in the order the mutations were applied
+        shards = [
+            (self._shard_path(scene.id, collection, item_id), getattr(scene, collection), item_id)
+            for collection, item_ids in (("objects", objects), ("shots", shots))
+            for item_id in item_ids or ()
+        ]
+
+        lock = self._save_locks.setdefault(scene.id, asyncio.Lock())
+        async with lock:
+            # Serialize under the lock, so each part includes all prior mutations.
+            # Compact JSON: these files are read back by the manager, not people.
+            # The serializers emit UTF-8 bytes directly (no str -> encode copy)
+            files: dict[str, bytes] = {}
+            if header:
+                files["/scene.json"] = Scene.__pydantic_serializer__.to_json(
+                    scene, exclude=_SHARDED_FIELDS
+                )
+            for path, items, item_id in shards:
+                item = items[item_id]
+                files[path] = item.__pydantic_serializer__.to_json(item)
+
+            # Write to namespace
+            await _gather_bounded(
+                self._store.write_namespace(namespace_id, path=path, data=data)
+                for path, data in files.items()
+            )
 
-        logger.debug(f"Saved scene {scene.id} to namespace {namespace_id}")
+        logger.debug(f"Saved {len(files)} file(s) of scene {scene.id} to namespace {namespace_id}")
 
     async def _load_scene(self, namespace_id: str) -> Scene:
         """Load scene from storage.
 
+        Scenes saved before storage was sharded (objects and shots inline in
+        /scene.json) are loaded as-is and rewritten in the sharded layout.
+
         Args:
             namespace_id: Namespace ID to load from
 
         Returns:
             Loaded Scene object
         """
-        # Read from namespace
+        # Read from namespace and parse the JSON bytes as-is (no decode copy)
         scene_data = await self._store.read_namespace(namespace_id, path="/scene.json")
-        scene_json = scene_data.decode("utf-8")
-
-        # Parse JSON to Scene
-        scene = Scene.model_validate_json(scene_json)
+        scene = Scene.model_validate_json(scene_data)
+        legacy = bool(scene.objects or scene.shots)
+        shard_paths: dict[tuple[str, str], str] = {}
+        last_number = -1
+
+        vfs = self._store.get_namespace_vfs(namespace_id)
+        for collection, model in (("objects", SceneObject), ("shots", Shot)):
+            directory = f"/{collection}"
+            if not await vfs.exists(directory):
+                continue
+            # Zero-padded shard names sort in insertion order; anything else
+            # that ends up in the directory is not a shard and is skipped
+            names = sorted(filter(_is_shard_name, await vfs.ls(directory)))
+            if names:
+                last_number = max(last_number, int(names[-1].removesuffix(".json")))
+            paths = [f"{directory}/{name}" for name in names]
+            shards = await _gather_bounded(
+                self._store.read_namespace(namespace_id, path=path) for path in paths
+            )
+            items = getattr(scene, collection)
+            for path, data in zip(paths, shards, strict=True):
+                item = model.model_validate_json(data)
+                items[item.id] = item
+                shard_paths[(collection, item.id)] = path
+
+        self._shard_paths[scene.id] = shard_paths
+        self._shard_counters[scene.id] = itertools.count(last_number + 1)
+        if legacy:
+            await self._save_scene(scene, namespace_id)
 
         logger.debug(f"Loaded scene {scene.id} from namespace {namespace_id}")
         return scene
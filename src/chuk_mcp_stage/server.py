@@ -16,9 +16,12 @@ This is the "director" layer that sits between:
 All data stored via chuk-artifacts for persistence and sharing.
 """
 
+import asyncio
 import logging
 import sys
-from typing import Optional
+from collections.abc import AsyncIterator, Callable, Iterable
+from enum import Enum
+from typing import Optional, TypeVar
 
 from chuk_mcp_server import get_or_create_global_server, requires_auth, run, tool  # type: ignore[attr-defined]
 
@@ -32,22 +35,29 @@ from .exporters import SceneExporter
 from .models import (
     AddObjectResponse,
     AddShotResponse,
+    AnimationFormat,
     BakeSimulationResponse,
     BakedAnimation,
     BindPhysicsResponse,
     CameraPath,
+    CameraPathMode,
     CreateSceneResponse,
+    EasingFunction,
+    EnvironmentType,
     ExportFormat,
     ExportSceneResponse,
     GetSceneResponse,
     GetShotResponse,
+    LightingPreset,
     Material,
+    MaterialPreset,
+    ObjectType,
     SceneObject,
     SetEnvironmentResponse,
     Shot,
     Transform,
 )
-from .physics_bridge import PhysicsBridge
+from .physics_bridge import BakedTrajectory, PhysicsBridge
 from .scene_manager import SceneManager
 
 # Configure logging
@@ -56,6 +66,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_E = TypeVar("_E", bound=Enum)
+
+
+def _enum_parser(enum_cls: type[_E]) -> Callable[[str], _E]:
+    """Build a string -> member parser for a tool's enum argument.
+
+    Known values are a single dict lookup instead of a trip through the enum
+    constructor; anything else falls through to it, so invalid values still
+    raise the usual ValueError.
+    """
+    members = {member.value: member for member in enum_cls}
+
+    def parse(value: str) -> _E:
+        member = members.get(value)
+        return member if member is not None else enum_cls(value)
+
+    return parse
+
+
+_parse_object_type = _enum_parser(ObjectType)
+_parse_material_preset = _enum_parser(MaterialPreset)
+_parse_environment_type = _enum_parser(EnvironmentType)
+_parse_lighting_preset = _enum_parser(LightingPreset)
+_parse_camera_path_mode = _enum_parser(CameraPathMode)
+_parse_easing = _enum_parser(EasingFunction)
+_parse_export_format = _enum_parser(ExportFormat)
+_parse_animation_format = _enum_parser(AnimationFormat)
+
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a chunk iterator to the async stream VFS stream_write expects."""
+    for chunk in chunks:
+        yield chunk
+
+
 # Global scene manager instance
 _scene_manager: Optional[SceneManager] = None
 
@@ -220,7 +265,7 @@ async def stage_add_object(
             color_b=1.0
         )
     """
-    from .models import Color, MaterialPreset, ObjectType, Vector3
+    from .models import Vector3
 
     manager = get_scene_manager()
 
@@ -232,8 +277,8 @@ async def stage_add_object(
     )
 
     # Build material
-    material = Material(
-        preset=MaterialPreset(material_preset), color=Color(r=color_r, g=color_g, b=color_b)
+    material = Material.of(
+        _parse_material_preset(material_preset), color=(color_r, color_g, color_b)
     )
 
     # Build size vector if provided
@@ -242,7 +287,7 @@ async def stage_add_object(
     # Create object
     obj = SceneObject(
         id=object_id,
-        type=ObjectType(object_type),
+        type=_parse_object_type(object_type),
         transform=transform,
         material=material,
         size=size,
@@ -284,12 +329,12 @@ async def stage_set_environment(
             lighting_preset="three-point"
         )
     """
-    from .models import Environment, EnvironmentType, Lighting, LightingPreset
+    from .models import Environment, Lighting
 
     manager = get_scene_manager()
 
-    environment = Environment(type=EnvironmentType(environment_type), intensity=intensity)
-    lighting = Lighting(preset=LightingPreset(lighting_preset))
+    environment = Environment(type=_parse_environment_type(environment_type), intensity=intensity)
+    lighting = Lighting(preset=_parse_lighting_preset(lighting_preset))
 
     await manager.set_environment(scene_id, environment, lighting)
 
@@ -362,13 +407,13 @@ async def stage_add_shot(
             end_time=10.0
         )
     """
-    from .models import CameraPathMode, EasingFunction, Vector3
+    from .models import Vector3
 
     manager = get_scene_manager()
 
     # Build camera path
     camera_path = CameraPath(
-        mode=CameraPathMode(camera_mode),
+        mode=_parse_camera_path_mode(camera_mode),
         focus=focus_object,
         radius=orbit_radius,
         elevation=orbit_elevation,
@@ -389,7 +434,7 @@ async def stage_add_shot(
         camera_path=camera_path,
         start_time=start_time,
         end_time=end_time,
-        easing=EasingFunction(easing),
+        easing=_parse_easing(easing),
     )
 
     # Add to scene
@@ -493,6 +538,7 @@ async def stage_bake_simulation(
     fps: int = 60,
     duration: Optional[float] = None,
     physics_server_url: Optional[str] = None,
+    animation_format: str = "json",
 ) -> BakeSimulationResponse:
     """Bake physics simulation to keyframe animations.
 
@@ -507,6 +553,8 @@ async def stage_bake_simulation(
         physics_server_url: Optional Rapier HTTP server URL
             If None, defaults to public Rapier service (https://rapier.chukai.io)
             Can be overridden with RAPIER_SERVICE_URL environment variable
+        animation_format: Keyframe encoding - "json" (default) or "binary"
+            (packed float32 columns, several times smaller than JSON)
 
     Returns:
         BakeSimulationResponse with frame count and baked object list
@@ -527,6 +575,8 @@ async def stage_bake_simulation(
         )
         print(f"Baked {result.total_frames} frames for {len(result.baked_objects)} objects")
     """
+    encoding = _parse_animation_format(animation_format)
+
     manager = get_scene_manager()
     scene = await manager.get_scene(scene_id)
 
@@ -540,14 +590,13 @@ async def stage_bake_simulation(
     if not bound_objects:
         raise ValueError(f"No objects bound to simulation {simulation_id}")
 
-    # Extract body IDs from bindings
-    body_ids = []
-    for obj_id, obj in bound_objects:
-        # Parse "rapier://sim-{sim_id}/body-{body_id}"
-        parts = obj.physics_binding.split("/")  # type: ignore
-        if len(parts) >= 2:
-            body_id = parts[-1].replace("body-", "")
-            body_ids.append(body_id)
+    # Parse "rapier://sim-{sim_id}/body-{body_id}" once per bound object
+    parsed = [
+        (obj_id, obj.physics_binding.rsplit("/", 1)[-1].removeprefix("body-"))  # type: ignore
+        for obj_id, obj in bound_objects
+        if "/" in obj.physics_binding  # type: ignore
+    ]
+    body_ids = [body_id for _, body_id in parsed]
 
     logger.info(f"Baking simulation {simulation_id} for {len(body_ids)} bodies")
 
@@ -559,33 +608,52 @@ async def stage_bake_simulation(
     vfs = await manager.get_scene_vfs(scene_id)
     await vfs.mkdir("/animations")
 
-    total_frames = 0
-    baked_object_ids = []
-
-    for obj_id, obj in bound_objects:
-        # Get body ID
-        body_id = obj.physics_binding.split("/")[-1].replace("body-", "")  # type: ignore
-
-        if body_id in baked_data:
-            keyframes = baked_data[body_id]
-            total_frames = max(total_frames, len(keyframes))
-
-            # Save keyframes to VFS
-            keyframes_json = PhysicsBridge.keyframes_to_json(keyframes)
-            animation_path = f"/animations/{obj_id}.json"
-            await vfs.write_text(animation_path, keyframes_json)
-
-            # Add baked animation to scene
-            baked_anim = BakedAnimation(
+    # Bounded like the Rapier fetches, so a scene with many bodies doesn't open
+    # one VFS write per body at once
+    semaphore = asyncio.Semaphore(Config.get_rapier_concurrency())
+
+    async def _persist(obj_id: str, keyframes: list[dict]) -> BakedAnimation:
+        async with semaphore:
+            if encoding is AnimationFormat.BINARY:
+                animation_path = f"/animations/{obj_id}.bin"
+                data = BakedTrajectory.from_keyframes(keyframes).to_bytes()
+                written = await vfs.write_binary(animation_path, data)
+            else:
+                # Stream keyframes to VFS in chunks instead of building one big string
+                animation_path = f"/animations/{obj_id}.json"
+                chunks = PhysicsBridge.iter_keyframes_json(keyframes)
+                written = await vfs.stream_write(animation_path, _aiter_chunks(chunks))
+            if not written:
+                raise OSError(f"Failed to write animation data: {animation_path}")
+
+            return BakedAnimation(
                 object_id=obj_id,
                 source=simulation_id,
                 fps=fps,
                 frames=len(keyframes),
                 data_path=animation_path,
+                format=encoding,
             )
-            await manager.add_baked_animation(scene_id, obj_id, baked_anim)
 
-            baked_object_ids.append(obj_id)
+    # Per-body writes are independent, so overlap them against the VFS backend;
+    # on the first failure cancel the rest rather than leave them writing
+    tasks = [
+        asyncio.ensure_future(_persist(obj_id, baked_data[body_id]))
+        for obj_id, body_id in parsed
+        if body_id in baked_data
+    ]
+    try:
+        animations = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    # Register every animation with a single scene header save
+    await manager.add_baked_animations(scene_id, {anim.object_id: anim for anim in animations})
+
+    total_frames = max((anim.frames for anim in animations), default=0)
+    baked_object_ids = [anim.object_id for anim in animations]
 
     return BakeSimulationResponse(
         scene_id=scene_id,
@@ -604,7 +672,10 @@ async def stage_bake_simulation(
 @requires_auth()
 @tool  # type: ignore[arg-type]
 async def stage_export_scene(
-    scene_id: str, format: str = "r3f-component", output_path: Optional[str] = None
+    scene_id: str,
+    format: str = "r3f-component",
+    output_path: Optional[str] = None,
+    pretty: bool = False,
 ) -> ExportSceneResponse:
     """Export scene to R3F, Remotion, or glTF format.
 
@@ -613,17 +684,22 @@ async def stage_export_scene(
 
     Args:
         scene_id: Scene identifier
-        format: Export format - "r3f-component", "remotion-project", "gltf", "json"
+        format: Export format - "r3f-component", "remotion-project", "gltf", "glb",
+            "json", "json-compact"
         output_path: Optional VFS path for output (auto-generated if None)
+        pretty: Indent the JSON files of the R3F, Remotion and glTF exports
+            (minified by default)
 
     Returns:
-        ExportSceneResponse with output paths
+        ExportSceneResponse with output paths and total bytes written
 
     Tips for LLMs:
         - "r3f-component": Generate React Three Fiber .tsx files
         - "remotion-project": Full Remotion project with package.json
         - "gltf": Static 3D scene file
+        - "glb": Static 3D scene as a single binary glTF file
         - "json": Raw scene JSON data
+        - "json-compact": Minified scene JSON (smaller, faster to write and parse)
         - Exported files are in the scene's VFS workspace
         - Use chuk-artifacts to retrieve exported files
 
@@ -639,16 +715,27 @@ async def stage_export_scene(
     scene = await manager.get_scene(scene_id)
     vfs = await manager.get_scene_vfs(scene_id)
 
-    export_format = ExportFormat(format)
+    export_format = _parse_export_format(format)
 
-    # Use exporter
-    artifacts = await SceneExporter.export_scene(scene, export_format, vfs, output_path)
+    # Use exporter; keep the file paths as artifacts and report the size separately
+    result = await SceneExporter.export_scene(scene, export_format, vfs, output_path, pretty=pretty)
+    artifacts = {key: value for key, value in result.items() if isinstance(value, str)}
 
     # Determine main output path
-    main_path = artifacts.get("scene") or artifacts.get("component") or artifacts.get("gltf") or "/"
+    main_path = (
+        artifacts.get("scene")
+        or artifacts.get("component")
+        or artifacts.get("gltf")
+        or artifacts.get("glb")
+        or "/"
+    )
 
     return ExportSceneResponse(
-        scene_id=scene_id, format=export_format, output_path=main_path, artifacts=artifacts
+        scene_id=scene_id,
+        format=export_format,
+        output_path=main_path,
+        artifacts=artifacts,
+        bytes_written=result.get("bytes_written", 0),
     )
 
 
@@ -2,7 +2,17 @@
 
 import os
 
-from chuk_mcp_stage.config import Config
+import pytest
+
+from chuk_mcp_stage.config import Config, PhysicsProvider
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Re-read the environment in every test (settings are cached per process)."""
+    Config.invalidate()
+    yield
+    Config.invalidate()
 
 
 def test_get_rapier_url_default():
@@ -86,6 +96,43 @@ def test_get_rapier_timeout_invalid_falls_back_to_default():
         del os.environ["RAPIER_TIMEOUT"]
 
 
+def test_get_rapier_timeout_rejects_non_plain_numbers():
+    """Test zero, negative, exponent and non-finite timeouts fall back to default."""
+    for raw in ["-5", "0", "0.0", "1e3", "inf", "nan", "", "   "]:
+        os.environ["RAPIER_TIMEOUT"] = raw
+        Config.invalidate()
+
+        try:
+            assert Config.get_rapier_timeout() == 30.0, raw
+        finally:
+            del os.environ["RAPIER_TIMEOUT"]
+
+
+def test_get_rapier_timeout_ignores_surrounding_whitespace():
+    """Test whitespace-padded timeouts are accepted."""
+    os.environ["RAPIER_TIMEOUT"] = " 45 \n"
+    Config.invalidate()
+
+    try:
+        assert Config.get_rapier_timeout() == 45.0
+    finally:
+        del os.environ["RAPIER_TIMEOUT"]
+
+
+def test_get_rapier_concurrency_from_env():
+    """Test Rapier concurrency from env, with invalid values falling back to 16."""
+    os.environ["RAPIER_CONCURRENCY"] = "4"
+    try:
+        assert Config.get_rapier_concurrency() == 4
+
+        for raw in ["0", "-2", "1.5", "many", ""]:
+            os.environ["RAPIER_CONCURRENCY"] = raw
+            Config.invalidate()
+            assert Config.get_rapier_concurrency() == 16, raw
+    finally:
+        del os.environ["RAPIER_CONCURRENCY"]
+
+
 def test_get_physics_provider_default():
     """Test default physics provider."""
     if "PHYSICS_PROVIDER" in os.environ:
@@ -117,6 +164,16 @@ def test_get_physics_provider_lowercase():
         del os.environ["PHYSICS_PROVIDER"]
 
 
+def test_get_physics_provider_unknown_falls_back_to_auto():
+    """Test that an unknown physics provider falls back to auto."""
+    os.environ["PHYSICS_PROVIDER"] = "bullet"
+
+    try:
+        assert Config.get_physics_provider() is PhysicsProvider.AUTO
+    finally:
+        del os.environ["PHYSICS_PROVIDER"]
+
+
 def test_get_google_drive_config_not_configured():
     """Test Google Drive config when credentials not set."""
     # Clear all Google Drive environment variables
@@ -229,3 +286,69 @@ def test_get_google_drive_config_partial_custom():
         for key in ["GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET", "GOOGLE_REDIRECT_URI"]:
             if key in os.environ:
                 del os.environ[key]
+
+
+def test_settings_are_cached_until_invalidated():
+    """Test settings are read once and refreshed by invalidate()."""
+    os.environ["PHYSICS_PROVIDER"] = "rapier"
+
+    try:
+        assert Config.get_physics_provider() == "rapier"
+        os.environ["PHYSICS_PROVIDER"] = "mcp"
+        assert Config.get_physics_provider() == "rapier"
+
+        Config.invalidate()
+        assert Config.get_physics_provider() == "mcp"
+    finally:
+        del os.environ["PHYSICS_PROVIDER"]
+
+
+def test_google_drive_requires_vfs_filesystem_storage():
+    """Test Google Drive stays disabled for other storage providers."""
+    os.environ["GOOGLE_CLIENT_ID"] = "test-client-id"
+    os.environ["GOOGLE_CLIENT_SECRET"] = "test-secret"
+    os.environ["STORAGE_PROVIDER"] = "vfs-memory"
+
+    try:
+        assert Config.is_google_drive_enabled() is False
+        assert Config.get_google_drive_config() is None
+
+        os.environ["STORAGE_PROVIDER"] = "vfs-filesystem"
+        Config.invalidate()
+        assert Config.is_google_drive_enabled() is True
+        assert Config.get_google_drive_config()["client_id"] == "test-client-id"
+    finally:
+        for key in ["GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET", "STORAGE_PROVIDER"]:
+            del os.environ[key]
+
+
+def test_get_google_drive_config_is_shared_and_read_only():
+    """Test the Google Drive config is built once and cannot be mutated."""
+    os.environ["GOOGLE_CLIENT_ID"] = "test-client-id"
+    os.environ["GOOGLE_CLIENT_SECRET"] = "test-secret"
+
+    try:
+        config = Config.get_google_drive_config()
+        assert config is Config.get_google_drive_config()
+
+        with pytest.raises(TypeError):
+            config["client_id"] = "other"  # type: ignore[index]
+    finally:
+        del os.environ["GOOGLE_CLIENT_ID"]
+        del os.environ["GOOGLE_CLIENT_SECRET"]
+
+
+def test_get_google_drive_config_rejects_malformed_credentials():
+    """Test quoted, whitespace or placeholder credentials disable Google Drive."""
+    os.environ["GOOGLE_CLIENT_SECRET"] = "test-client-secret"
+
+    try:
+        for client_id in ['"quoted-client-id"', "client id with spaces", "short"]:
+            os.environ["GOOGLE_CLIENT_ID"] = client_id
+            Config.invalidate()
+
+            assert Config.get_google_drive_config() is None, client_id
+            assert Config.is_google_drive_enabled() is False
+    finally:
+        del os.environ["GOOGLE_CLIENT_ID"]
+        del os.environ["GOOGLE_CLIENT_SECRET"]
@@ -1,6 +1,8 @@
 """Tests for scene exporters."""
 
 import json
+from unittest.mock import AsyncMock
+
 import pytest
 from chuk_artifacts import ArtifactStore
 
@@ -145,6 +147,18 @@ def scene_with_animations():
     return scene
 
 
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_ensure_directory_nested_and_existing(vfs):
+    """Test nested directories are created and existing ones are left alone."""
+    await SceneExporter._ensure_directory(vfs, "/deep/nested/dir")
+    assert await vfs.is_dir("/deep/nested/dir")
+
+    # Creating an existing directory again is harmless
+    await SceneExporter._ensure_directory(vfs, "/deep/nested/dir")
+    assert await vfs.is_dir("/deep/nested/dir")
+
+
 @pytest.mark.asyncio
 @pytest.mark.vfs_integration
 async def test_export_json(vfs, simple_scene):
@@ -166,6 +180,7 @@ async def test_export_json(vfs, simple_scene):
     assert parsed["name"] == "Test Scene"
     assert "box1" in parsed["objects"]
     assert "sphere1" in parsed["objects"]
+    assert result["bytes_written"] == len(data.encode("utf-8"))
 
 
 @pytest.mark.asyncio
@@ -182,6 +197,68 @@ async def test_export_json_default_path(vfs, simple_scene):
     assert result["scene"] == "/export/scene.json"
 
 
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_export_json_compact(vfs, simple_scene):
+    """Test compact JSON export round-trips to the same scene."""
+    result = await SceneExporter.export_scene(
+        scene=simple_scene,
+        format=ExportFormat.JSON_COMPACT,
+        vfs=vfs,
+        output_path="/test/scene.min.json",
+    )
+
+    assert result["scene"] == "/test/scene.min.json"
+
+    data = await vfs.read_binary("/test/scene.min.json")
+    assert b"\n" not in data
+    assert Scene.model_validate_json(data) == simple_scene
+
+    pretty = await SceneExporter.export_scene(
+        scene=simple_scene, format=ExportFormat.JSON, vfs=vfs, output_path="/test/scene.json"
+    )
+    assert len(data) < len(await vfs.read_text(pretty["scene"]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_export_json_from_shared_scene_data(vfs, simple_scene, monkeypatch, use_orjson):
+    """Test JSON exports from a pre-computed dump match exports from the scene."""
+    from chuk_mcp_stage import _json
+
+    if not use_orjson:
+        monkeypatch.setattr(_json, "json_backend", lambda: None)
+    scene_data = simple_scene.model_dump(mode="json")
+
+    for fmt in (ExportFormat.JSON, ExportFormat.JSON_COMPACT):
+        direct = await SceneExporter.export_scene(
+            scene=simple_scene, format=fmt, vfs=vfs, output_path="/test/direct.json"
+        )
+        direct_bytes = await vfs.read_binary(direct["scene"])
+
+        shared = await SceneExporter.export_scene(
+            scene=simple_scene,
+            format=fmt,
+            vfs=vfs,
+            output_path="/test/shared.json",
+            scene_data=scene_data,
+        )
+        assert await vfs.read_binary(shared["scene"]) == direct_bytes
+
+
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_export_json_matches_pydantic_layout(vfs, simple_scene):
+    """Test the orjson JSON export is byte-identical to pydantic's indented dump."""
+    pytest.importorskip("orjson")
+    result = await SceneExporter.export_scene(
+        scene=simple_scene, format=ExportFormat.JSON, vfs=vfs, output_path="/test/scene.json"
+    )
+
+    assert await vfs.read_text(result["scene"]) == simple_scene.model_dump_json(indent=2)
+
+
 @pytest.mark.asyncio
 @pytest.mark.vfs_integration
 async def test_export_r3f_basic(vfs, simple_scene):
@@ -198,6 +275,8 @@ async def test_export_r3f_basic(vfs, simple_scene):
 
     # Verify component file
     component_code = await vfs.read_text("/test/r3f/Scene.tsx")
+    assert result["line_count"] == len(component_code.splitlines())
+    assert result["bytes_written"] == len(component_code.encode("utf-8"))
     assert "import React from 'react'" in component_code
     assert "Canvas" in component_code
     assert "OrbitControls" in component_code
@@ -206,6 +285,24 @@ async def test_export_r3f_basic(vfs, simple_scene):
     assert "meshStandardMaterial" in component_code
 
 
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_export_r3f_large_scene_renders_in_thread(vfs, simple_scene, monkeypatch):
+    """Test R3F export of a large scene (rendered off-loop) matches inline rendering."""
+    from chuk_mcp_stage import exporters
+
+    monkeypatch.setattr(exporters, "_THREAD_RENDER_MIN_OBJECTS", 1)
+    result = await SceneExporter.export_scene(
+        scene=simple_scene,
+        format=ExportFormat.R3F_COMPONENT,
+        vfs=vfs,
+        output_path="/test/r3f-threaded",
+    )
+
+    component_code = await vfs.read_text(result["component"])
+    assert component_code == SceneExporter._generate_r3f_component(simple_scene)
+
+
 @pytest.mark.asyncio
 @pytest.mark.vfs_integration
 async def test_export_r3f_with_shots(vfs, scene_with_shots):
@@ -322,6 +419,73 @@ async def test_export_gltf_basic(vfs, simple_scene):
     assert len(gltf["meshes"]) == 2
 
 
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_export_pretty_flag(vfs, scene_with_animations):
+    """Test side JSON files are minified by default and indented with pretty."""
+    for pretty in (False, True):
+        gltf = await SceneExporter.export_scene(
+            scene=scene_with_animations,
+            format=ExportFormat.GLTF,
+            vfs=vfs,
+            output_path=f"/pretty-{pretty}/scene.gltf",
+            pretty=pretty,
+        )
+        r3f = await SceneExporter.export_scene(
+            scene=scene_with_animations,
+            format=ExportFormat.R3F_COMPONENT,
+            vfs=vfs,
+            output_path=f"/pretty-{pretty}/r3f",
+            pretty=pretty,
+        )
+        remotion = await SceneExporter.export_scene(
+            scene=scene_with_animations,
+            format=ExportFormat.REMOTION_PROJECT,
+            vfs=vfs,
+            output_path=f"/pretty-{pretty}/remotion",
+            pretty=pretty,
+        )
+
+        for path in (gltf["gltf"], r3f["animations"], remotion["package"]):
+            text = await vfs.read_text(path)
+            json.loads(text)
+            assert ("\n" in text) is pretty
+
+
+def test_build_gltf_emits_shared_materials_once():
+    """Test glTF meshes sharing a Material.of instance reference one material."""
+    scene = Scene(id="materials")
+    red = Material.of(MaterialPreset.PLASTIC_RED, color=(1.0, 0.0, 0.0))
+    glass = Material.of(MaterialPreset.GLASS_BLUE, opacity=0.5)
+    for obj_id, material in (("a", red), ("b", glass), ("c", red)):
+        scene.objects[obj_id] = SceneObject(id=obj_id, type=ObjectType.BOX, material=material)
+
+    gltf = SceneExporter._build_gltf(scene)
+
+    assert [mesh["extras"]["material"] for mesh in gltf["meshes"]] == [0, 1, 0]
+    assert len(gltf["materials"]) == 2
+    assert gltf["materials"][0]["name"] == "plastic-red"
+    assert gltf["materials"][0]["pbrMetallicRoughness"]["baseColorFactor"] == [1.0, 0.0, 0.0, 1.0]
+    assert "alphaMode" not in gltf["materials"][0]
+    assert gltf["materials"][1]["alphaMode"] == "BLEND"
+
+
+def test_build_gltf_dedupes_equal_materials():
+    """Test equal but separately built materials (e.g. a reloaded scene) share one entry."""
+    scene = Scene(id="materials")
+    for obj_id in ("a", "b"):
+        scene.objects[obj_id] = SceneObject(
+            id=obj_id,
+            type=ObjectType.BOX,
+            material=Material(preset=MaterialPreset.METAL_DARK, roughness=0.3),
+        )
+
+    gltf = SceneExporter._build_gltf(scene)
+
+    assert [mesh["extras"]["material"] for mesh in gltf["meshes"]] == [0, 0]
+    assert len(gltf["materials"]) == 1
+
+
 @pytest.mark.asyncio
 @pytest.mark.vfs_integration
 async def test_export_gltf_default_path(vfs, simple_scene):
@@ -336,6 +500,48 @@ async def test_export_gltf_default_path(vfs, simple_scene):
     assert result["gltf"] == "/export/scene.gltf"
 
 
+@pytest.mark.asyncio
+@pytest.mark.vfs_integration
+async def test_export_glb(vfs, simple_scene):
+    """Test GLB export writes a valid binary glTF container."""
+    import struct
+
+    result = await SceneExporter.export_scene(
+        scene=simple_scene,
+        format=ExportFormat.GLB,
+        vfs=vfs,
+        output_path="/test/scene.glb",
+    )
+
+    assert result["glb"] == "/test/scene.glb"
+
+    data = await vfs.read_binary("/test/scene.glb")
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    assert magic == 0x46546C67
+    assert version == 2
+    assert length == len(data)
+    assert length % 4 == 0
+
+    chunk_length, chunk_type = struct.unpack_from("<II", data, 12)
+    assert chunk_type == 0x4E4F534A
+    gltf = json.loads(data[20 : 20 + chunk_length])
+    # Vectors are built as tuples; compare the document as JSON sees it
+    assert gltf == json.loads(json.dumps(SceneExporter._build_gltf(simple_scene)))
+
+
+def test_pack_glb_pads_json_chunk():
+    """Test GLB packing pads the JSON chunk to a 4-byte boundary."""
+    import struct
+
+    glb = SceneExporter._pack_glb({"asset": {"version": "2.0"}, "x": "abc"})
+
+    json_length = struct.unpack_from("<I", glb, 12)[0]
+    assert json_length % 4 == 0
+    assert glb.endswith(b"}   ")
+    assert len(glb) == 20 + json_length
+    assert struct.unpack_from("<I", glb, 8)[0] == len(glb)
+
+
 @pytest.mark.asyncio
 @pytest.mark.vfs_integration
 async def test_export_unsupported_format(vfs, simple_scene):
@@ -425,6 +631,15 @@ def test_generate_r3f_component_material_colors():
     assert "transparent={true}" in code
 
 
+def test_color_hex_packs_channels():
+    """Test hex color formatting keeps per-channel zero padding."""
+    from chuk_mcp_stage.exporters import _color_hex
+
+    assert _color_hex(0.0, 0.0, 0.0) == "#000000"
+    assert _color_hex(1.0, 1.0, 1.0) == "#ffffff"
+    assert _color_hex(0.0, 0.02, 1.0) == "#0005ff"
+
+
 def test_generate_r3f_component_material_no_color():
     """Test R3F component with material without color."""
     scene = Scene(id="test", name="Test")
@@ -480,6 +695,11 @@ def test_generate_animations_data():
     assert parsed["obj1"]["frames"] == 600
     assert "obj2" in parsed
     assert parsed["obj2"]["fps"] == 30
+    assert parsed["obj2"]["format"] == "json"
+
+    # A shared scene dump yields the same document
+    scene_data = scene.model_dump(mode="json")
+    assert SceneExporter._generate_animations_data(scene, scene_data) == data
 
 
 def test_generate_remotion_composition():
@@ -541,3 +761,60 @@ def test_generate_package_json_no_name():
     package = json.loads(package_str)
 
     assert package["description"] == "Remotion project for scene scene-id"
+
+
+def test_generate_package_json_escapes_scene_strings():
+    """Test scene ids and names are JSON-escaped into the package template."""
+    scene = Scene(id='odd"id', name="Line\nbreak \\ Ünïcode")
+
+    package = json.loads(SceneExporter._generate_package_json(scene))
+
+    assert package["name"] == 'scene-odd"id'
+    assert package["description"] == "Remotion project for scene Line\nbreak \\ Ünïcode"
+    assert package["dependencies"]["three"] == "^0.160.0"
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_raises_on_failed_write():
+    """Test a write the VFS reports as failed is not counted as written."""
+    vfs = AsyncMock()
+    vfs.write_binary.return_value = False
+
+    with pytest.raises(OSError, match="/export/scene.json"):
+        await SceneExporter._write_bytes(vfs, "/export/scene.json", b"{}")
+
+
+def test_json_backend_is_imported_once():
+    """Test the optional orjson backend is resolved lazily and cached."""
+    from chuk_mcp_stage import _json
+
+    orjson = pytest.importorskip("orjson")
+    assert _json.json_backend() is orjson
+    assert _json.json_backend.cache_info().currsize == 1
+
+
+def test_package_json_matches_stdlib_fallback(monkeypatch):
+    """Test orjson and the stdlib fallback produce identical package.json."""
+    from chuk_mcp_stage import _json, exporters
+
+    scene = Scene(id="my-scene", name="My Cool Scene")
+    fast = SceneExporter._generate_package_json(scene)
+
+    monkeypatch.setattr(_json, "json_backend", lambda: None)
+    exporters._render_package_json.cache_clear()
+    assert SceneExporter._generate_package_json(scene) == fast
+    exporters._render_package_json.cache_clear()
+
+
+def test_remotion_root_render_is_cached():
+    """Test Remotion root source is rendered once per distinct timing."""
+    from chuk_mcp_stage import exporters
+
+    exporters._render_remotion_root.cache_clear()
+    scene = Scene(id="cached-scene")
+
+    first = SceneExporter._generate_remotion_root(scene)
+    second = SceneExporter._generate_remotion_root(scene)
+
+    assert first is second
+    assert exporters._render_remotion_root.cache_info().hits == 1
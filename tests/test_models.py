@@ -0,0 +1,172 @@
+"""Tests for chuk-mcp-stage models."""
+
+import pytest
+from pydantic import ValidationError
+
+from chuk_mcp_stage.models import (
+    Q_IDENTITY,
+    V_ONE,
+    V_ZERO,
+    CameraPath,
+    CameraPathMode,
+    Color,
+    Label,
+    Material,
+    MaterialPreset,
+    ObjectType,
+    SceneObject,
+    Shot,
+    Trail,
+    Transform,
+    Vector3,
+    material_preset,
+    vec3,
+)
+
+
+def test_vec3_returns_shared_instance():
+    """Test vec3 reuses the same Vector3 for equal components."""
+    a = vec3(0, 0, 0)
+    b = vec3(0, 0, 0)
+
+    assert a is b
+    assert a == Vector3()
+    assert vec3(1, 2, 3).to_list() == [1.0, 2.0, 3.0]
+    assert vec3(1, 2, 3).as_tuple == (1.0, 2.0, 3.0)
+    assert Q_IDENTITY.as_tuple == (0.0, 0.0, 0.0, 1.0)
+
+
+def test_vector3_is_frozen():
+    """Test shared vectors cannot be mutated."""
+    v = vec3(1, 1, 1)
+
+    with pytest.raises(ValidationError):
+        v.x = 5.0
+
+
+def test_value_models_are_frozen():
+    """Test rotations, colors, trails and labels cannot be mutated."""
+    for model, field, value in (
+        (Q_IDENTITY, "w", 0.0),
+        (Color(r=0.1, g=0.2, b=0.3), "r", 1.0),
+        (Trail(), "length", 10),
+        (Label(text="ball"), "text", "other"),
+    ):
+        with pytest.raises(ValidationError):
+            setattr(model, field, value)
+
+    assert Transform().rotation is Q_IDENTITY
+
+
+def test_material_preset_returns_shared_instance():
+    """Test material_preset reuses materials with identical preset and color."""
+    a = material_preset(MaterialPreset.METAL_DARK)
+    b = material_preset(MaterialPreset.METAL_DARK)
+
+    assert a is b
+    assert a == Material(preset=MaterialPreset.METAL_DARK)
+
+
+def test_material_preset_with_color():
+    """Test material_preset builds the color from an RGB tuple."""
+    mat = material_preset(MaterialPreset.GLASS_BLUE, color=(0.2, 0.5, 1.0))
+
+    assert mat.preset == MaterialPreset.GLASS_BLUE
+    assert mat.color == Color(r=0.2, g=0.5, b=1.0)
+    assert mat is not material_preset(MaterialPreset.GLASS_BLUE)
+
+
+def test_material_of_returns_shared_instance():
+    """Test Material.of interns materials regardless of override order."""
+    a = Material.of(MaterialPreset.GLASS_BLUE, color=(0.2, 0.5, 1.0), opacity=0.5)
+    b = Material.of(MaterialPreset.GLASS_BLUE, opacity=0.5, color=(0.2, 0.5, 1.0))
+
+    assert a is b
+    assert a.color == Color(r=0.2, g=0.5, b=1.0)
+    assert a.opacity == 0.5
+    assert Material.of(MaterialPreset.METAL_DARK) is material_preset(MaterialPreset.METAL_DARK)
+
+
+def test_material_of_validates_overrides():
+    """Test Material.of rejects invalid and unknown fields."""
+    with pytest.raises(ValidationError):
+        Material.of(MaterialPreset.PLASTIC_RED, roughness=2.0)
+
+    with pytest.raises(ValidationError):
+        Material.of(MaterialPreset.PLASTIC_RED, shininess=1.0)
+
+
+def test_material_is_frozen():
+    """Test shared materials cannot be mutated."""
+    mat = material_preset(MaterialPreset.PLASTIC_RED)
+
+    with pytest.raises(ValidationError):
+        mat.roughness = 0.9
+
+
+def test_scene_object_is_frozen():
+    """Test scene objects are immutable once built."""
+    obj = SceneObject(id="ball", type=ObjectType.SPHERE, radius=1.0)
+
+    with pytest.raises(ValidationError):
+        obj.radius = 2.0
+
+    updated = obj.model_copy(update={"physics_binding": "rapier://sim/body-ball"})
+    assert updated.physics_binding == "rapier://sim/body-ball"
+    assert obj.physics_binding is None
+
+
+def test_camera_path_rejects_unknown_fields():
+    """Test misspelled camera parameters are rejected instead of dropped."""
+    with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+        CameraPath(mode=CameraPathMode.CHASE, target="ball")
+
+
+def test_transform_defaults_share_common_vectors():
+    """Test Transform defaults reuse the shared zero/one vectors."""
+    transform = Transform()
+
+    assert transform.position is V_ZERO
+    assert transform.scale is V_ONE
+    assert V_ONE == Vector3(x=1.0, y=1.0, z=1.0)
+
+
+def test_shot_factories_match_explicit_construction():
+    """Test Shot factories build the same shots as the full constructor."""
+    orbit = Shot.orbit(
+        "orbit", focus="target", radius=8, elevation=25, speed=0.1, start_time=0, end_time=5
+    )
+    assert orbit == Shot(
+        id="orbit",
+        camera_path=CameraPath(
+            mode=CameraPathMode.ORBIT, focus="target", radius=8, elevation=25, speed=0.1
+        ),
+        start_time=0,
+        end_time=5,
+    )
+    assert Shot.model_validate_json(orbit.model_dump_json()) == orbit
+
+    static = Shot.static(
+        "static", position=vec3(1.0, 2.0, 3.0), look_at=V_ZERO, start_time=0, end_time=1
+    )
+    assert static.camera_path.mode == CameraPathMode.STATIC
+    assert static.camera_path.look_at is V_ZERO
+
+    dolly = Shot.dolly("dolly", from_position=V_ZERO, to_position=V_ONE, start_time=0, end_time=1)
+    assert dolly.camera_path.to_position is V_ONE
+
+    chase = Shot.chase("chase", focus="target", offset=V_ONE, start_time=0, end_time=1)
+    assert chase.camera_path.mode == CameraPathMode.CHASE
+    assert chase.camera_path.damping is None
+
+
+def test_shot_factories_still_validate_times():
+    """Test Shot factories reject invalid time ranges."""
+    with pytest.raises(ValidationError):
+        Shot.chase("chase", focus="target", offset=V_ONE, start_time=-1.0, end_time=1.0)
+
+
+def test_shot_factories_validate_camera_path():
+    """Test Shot factories reject camera parameters of the wrong type."""
+    with pytest.raises(ValidationError):
+        Shot.static("static", position=(1, 2, 3), look_at=V_ZERO, start_time=0, end_time=1)
@@ -1,13 +1,23 @@
 """Tests for physics bridge."""
 
+import asyncio
 import json
+import math
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
-from chuk_mcp_stage.physics_bridge import PhysicsBridge
+import httpx
+
+from chuk_mcp_stage.physics_bridge import BakedTrajectory, KeyframeCursor, PhysicsBridge
 from chuk_mcp_stage.models import Vector3, Quaternion
 
 
+def _trajectory_response(payload: dict) -> httpx.Response:
+    """Build a Rapier trajectory response."""
+    request = httpx.Request("POST", "http://localhost:8001/simulations/sim/bodies/body/trajectory")
+    return httpx.Response(200, json=payload, request=request)
+
+
 @pytest.mark.asyncio
 async def test_physics_bridge_init_no_server():
     """Test PhysicsBridge initialization without server URL defaults to public service."""
@@ -64,24 +74,24 @@ async def test_bake_simulation_with_duration():
     """Test baking simulation with specified duration."""
     bridge = PhysicsBridge(physics_server_url="http://localhost:8001")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "frames": [
-            {
-                "time": 0.0,
-                "position": [0, 0, 0],
-                "orientation": [0, 0, 0, 1],
-                "velocity": [0, 0, 0],
-            },
-            {
-                "time": 0.016667,
-                "position": [0, -0.1, 0],
-                "orientation": [0, 0, 0, 1],
-                "velocity": [0, -1, 0],
-            },
-        ]
-    }
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _trajectory_response(
+        {
+            "frames": [
+                {
+                    "time": 0.0,
+                    "position": [0, 0, 0],
+                    "orientation": [0, 0, 0, 1],
+                    "velocity": [0, 0, 0],
+                },
+                {
+                    "time": 0.016667,
+                    "position": [0, -0.1, 0],
+                    "orientation": [0, 0, 0, 1],
+                    "velocity": [0, -1, 0],
+                },
+            ]
+        }
+    )
 
     async with bridge:
         with patch.object(bridge._client, "post", new_callable=AsyncMock) as mock_post:
@@ -111,9 +121,7 @@ async def test_bake_simulation_no_duration():
     """Test baking simulation without duration (uses default)."""
     bridge = PhysicsBridge(physics_server_url="http://localhost:8001")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"frames": []}
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _trajectory_response({"frames": []})
 
     async with bridge:
         with patch.object(bridge._client, "post", new_callable=AsyncMock) as mock_post:
@@ -134,24 +142,24 @@ async def test_bake_simulation_keyframe_format():
     """Test that baked simulation returns correct keyframe format."""
     bridge = PhysicsBridge(physics_server_url="http://localhost:8001")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "frames": [
-            {
-                "time": 0.0,
-                "position": [1.0, 2.0, 3.0],
-                "orientation": [0.1, 0.2, 0.3, 0.9],
-                "velocity": [0.5, -0.5, 0.0],
-            },
-            {
-                "time": 1.0,
-                "position": [2.0, 3.0, 4.0],
-                "orientation": [0.2, 0.3, 0.4, 0.8],
-                "velocity": [1.0, -1.0, 0.0],
-            },
-        ]
-    }
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _trajectory_response(
+        {
+            "frames": [
+                {
+                    "time": 0.0,
+                    "position": [1.0, 2.0, 3.0],
+                    "orientation": [0.1, 0.2, 0.3, 0.9],
+                    "velocity": [0.5, -0.5, 0.0],
+                },
+                {
+                    "time": 1.0,
+                    "position": [2.0, 3.0, 4.0],
+                    "orientation": [0.2, 0.3, 0.4, 0.8],
+                    "velocity": [1.0, -1.0, 0.0],
+                },
+            ]
+        }
+    )
 
     async with bridge:
         with patch.object(bridge._client, "post", new_callable=AsyncMock) as mock_post:
@@ -180,6 +188,23 @@ async def test_bake_simulation_keyframe_format():
             assert frame2["position"] == [2.0, 3.0, 4.0]
 
 
+@pytest.mark.asyncio
+async def test_bake_simulation_parses_without_orjson():
+    """Test trajectories parse the same with and without the orjson backend."""
+    payload = {"frames": [{"time": 0.5, "position": [1, 2, 3], "orientation": [0, 0, 0, 1]}]}
+
+    results = []
+    for backend in (None, json):
+        with patch("chuk_mcp_stage._json.json_backend", return_value=backend):
+            async with PhysicsBridge(physics_server_url="http://localhost:8001") as bridge:
+                with patch.object(bridge._client, "post", new_callable=AsyncMock) as mock_post:
+                    mock_post.return_value = _trajectory_response(payload)
+                    results.append(await bridge.bake_simulation("sim-001", ["body1"]))
+
+    assert results[0] == results[1]
+    assert results[0]["body1"][0]["velocity"] == [0, 0, 0]
+
+
 @pytest.mark.asyncio
 async def test_bake_simulation_http_error():
     """Test baking simulation handles HTTP errors."""
@@ -198,6 +223,35 @@ async def test_bake_simulation_http_error():
                 )
 
 
+@pytest.mark.asyncio
+async def test_bake_simulation_fetches_bodies_concurrently():
+    """Test bodies are fetched concurrently, bounded, and returned in request order."""
+    bridge = PhysicsBridge(physics_server_url="http://localhost:8001")
+    in_flight = 0
+    peak = 0
+
+    async def fake_post(url, json):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _trajectory_response(
+            {"frames": [{"time": 0.0, "position": [0, 0, 0], "orientation": [0, 0, 0, 1]}]}
+        )
+
+    body_ids = [f"body{i}" for i in range(40)]
+    async with bridge:
+        with (
+            patch.object(bridge._client, "post", side_effect=fake_post),
+            patch("chuk_mcp_stage.physics_bridge.Config.get_rapier_concurrency", return_value=8),
+        ):
+            result = await bridge.bake_simulation("sim-001", body_ids, fps=60, duration=1.0)
+
+    assert list(result) == body_ids
+    assert peak == 8
+
+
 def test_keyframes_to_json():
     """Test converting keyframes to JSON."""
     keyframes = [
@@ -224,6 +278,27 @@ def test_keyframes_to_json():
     assert parsed[0]["time"] == 0.0
 
 
+def test_iter_keyframes_json_chunks():
+    """Test streamed keyframe JSON concatenates to the full array."""
+    keyframes = [
+        {
+            "time": i / 60,
+            "position": [0.0, 10.0 - i * 0.01, 0.0],
+            "rotation": [0.0, 0.0, 0.0, 1.0],
+            "velocity": [0.0, -1.0, 0.0],
+        }
+        for i in range(100)
+    ]
+
+    chunks = list(PhysicsBridge.iter_keyframes_json(keyframes, chunk_bytes=1024))
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == keyframes
+
+    # Empty input still produces a valid array
+    assert b"".join(PhysicsBridge.iter_keyframes_json([])) == b"[]"
+
+
 def test_keyframes_from_json():
     """Test parsing keyframes from JSON."""
     json_str = """[
@@ -353,10 +428,12 @@ def test_interpolate_keyframe_between():
     assert pos.y == 10.0  # (0 + 20) / 2
     assert pos.z == 15.0  # (0 + 30) / 2
 
-    assert rot.x == 0.1  # (0 + 0.2) / 2
-    assert rot.y == 0.2  # (0 + 0.4) / 2
-    assert rot.z == 0.3  # (0 + 0.6) / 2
-    assert rot.w == 0.9  # (1 + 0.8) / 2
+    # Slerp halfway: both ends weighted sin(theta / 2) / sin(theta), cos(theta) = 0.8
+    weight = math.sin(math.acos(0.8) / 2) / 0.6
+    assert rot.x == pytest.approx(0.2 * weight)
+    assert rot.y == pytest.approx(0.4 * weight)
+    assert rot.z == pytest.approx(0.6 * weight)
+    assert rot.w == pytest.approx(1.8 * weight)
 
     assert vel.x == 1.0  # (0 + 2) / 2
     assert vel.y == 2.0  # (0 + 4) / 2
@@ -405,6 +482,153 @@ def test_interpolate_keyframe_multiple_frames():
     assert pos.z == 2.5
 
 
+def test_interpolate_keyframe_long_trajectory():
+    """Test the keyframe search on a long trajectory, including a repeated time."""
+    keyframes = [
+        {"time": i / 60, "position": [i, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]}
+        for i in range(600)
+    ]
+    keyframes.insert(
+        301,
+        {"time": 300 / 60, "position": [-1, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+    )
+
+    pos, _, _ = PhysicsBridge.interpolate_keyframe(keyframes, 450.5 / 60)
+    assert pos.x == pytest.approx(450.5)
+
+    # The first keyframe at a repeated time wins
+    pos, _, _ = PhysicsBridge.interpolate_keyframe(keyframes, 300 / 60)
+    assert pos.x == 300
+
+
+def test_interpolate_keyframes_matches_single_lookups():
+    """Test batch interpolation returns the per-time results in query order."""
+    keyframes = [
+        {"time": 0.0, "position": [0, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+        {"time": 1.0, "position": [4, 2, 0], "rotation": [0, 0, 0, 1], "velocity": [1, 0, 0]},
+        {"time": 2.0, "position": [8, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+    ]
+    times = [1.5, 1.75, -1.0, 0.25, 0.5, 1.0, 1.25, 5.0]
+
+    batch = PhysicsBridge.interpolate_keyframes(keyframes, times)
+
+    assert batch == [PhysicsBridge.interpolate_keyframe(keyframes, t) for t in times]
+    assert (
+        PhysicsBridge.interpolate_keyframes([], [0.0, 1.0])
+        == [PhysicsBridge.interpolate_keyframe([], 0.0)] * 2
+    )
+
+
+def test_interpolate_keyframe_raw_matches_models():
+    """Test the tuple-returning lookup gives the same values as the model one."""
+    keyframes = [
+        {"time": 0.0, "position": [0, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+        {"time": 1.0, "position": [4, 2, 0], "rotation": [0, 0, 0.6, 0.8], "velocity": [1, 0, 0]},
+    ]
+    trajectory = BakedTrajectory.from_keyframes(keyframes)
+
+    for source in (keyframes, trajectory, [], BakedTrajectory.from_keyframes([])):
+        for t in [-1.0, 0.0, 0.25, 1.0, 2.0]:
+            pos, rot, vel = PhysicsBridge.interpolate_keyframe(source, t)
+            assert PhysicsBridge.interpolate_keyframe_raw(source, t) == (
+                pos.as_tuple,
+                rot.as_tuple,
+                vel.as_tuple,
+            )
+
+
+def test_keyframe_cursor_matches_lookups():
+    """Test cursors give lookup results stepping forward, jumping back and at the ends."""
+    keyframes = [
+        {"time": i * 0.5, "position": [i, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [1, 0, 0]}
+        for i in range(6)
+    ]
+    times = [-1.0, 0.0, 0.1, 0.5, 0.6, 0.9, 1.2, 1.3, 2.5, 9.0, 0.7, 0.75, 2.4]
+
+    for source in (keyframes, BakedTrajectory.from_keyframes(keyframes), []):
+        cursor = KeyframeCursor(source)
+        for t in times:
+            assert cursor.sample(t) == PhysicsBridge.interpolate_keyframe(source, t)
+            assert cursor.sample_raw(t) == PhysicsBridge.interpolate_keyframe_raw(source, t)
+
+
+def test_baked_trajectory_matches_keyframe_dicts():
+    """Test packed trajectories round-trip and interpolate like keyframe dicts."""
+    keyframes = [
+        {"time": 0.0, "position": [0, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+        {"time": 1.0, "position": [4, 2, 0], "rotation": [0, 0, 0.6, 0.8], "velocity": [1, 0, 0]},
+        {"time": 2.0, "position": [8, 0, 0], "rotation": [0, 0, 1, 0], "velocity": [0, 0, 0]},
+    ]
+    trajectory = BakedTrajectory.from_keyframes(keyframes)
+
+    assert len(trajectory) == 3
+    assert trajectory.to_keyframes() == keyframes
+    for t in [-1.0, 0.0, 0.25, 1.0, 1.5, 2.0, 5.0]:
+        assert PhysicsBridge.interpolate_keyframe(trajectory, t) == (
+            PhysicsBridge.interpolate_keyframe(keyframes, t)
+        )
+    times = [1.5, -1.0, 0.25, 0.5, 2.0]
+    assert PhysicsBridge.interpolate_keyframes(trajectory, times) == (
+        PhysicsBridge.interpolate_keyframes(keyframes, times)
+    )
+    assert BakedTrajectory.from_keyframes([]).interpolate(1.0) == (
+        PhysicsBridge.interpolate_keyframe([], 1.0)
+    )
+
+
+def test_baked_trajectory_bytes_round_trip():
+    """Test packed trajectories serialize to float32/float64 blobs and back."""
+    keyframes = [
+        {
+            "time": i / 60,
+            "position": [i * 0.1, 2.5, -1.0],
+            "rotation": [0, 0, 0, 1],
+            "velocity": [1, 0, 0],
+        }
+        for i in range(10)
+    ]
+    trajectory = BakedTrajectory.from_keyframes(keyframes)
+
+    exact = BakedTrajectory.from_bytes(trajectory.to_bytes("d"))
+    assert exact == trajectory
+
+    compact = trajectory.to_bytes()
+    assert len(compact) < len(trajectory.to_bytes("d"))
+    restored = BakedTrajectory.from_bytes(compact)
+    assert len(restored) == 10
+    assert restored.positions.typecode == "d"
+    assert all(math.isclose(a, b, rel_tol=1e-6) for a, b in zip(restored.times, trajectory.times))
+
+    with pytest.raises(ValueError, match="typecode"):
+        trajectory.to_bytes("e")
+    with pytest.raises(ValueError, match="Invalid trajectory data"):
+        BakedTrajectory.from_bytes(b"nope")
+    with pytest.raises(ValueError, match="Invalid trajectory data"):
+        BakedTrajectory.from_bytes(compact[:-4])
+
+
+def test_interpolate_keyframe_slerps_rotation():
+    """Test rotations follow the shorter arc at constant speed and stay unit length."""
+    half = math.sqrt(0.5)
+    keyframes = [
+        {"time": 0.0, "position": [0, 0, 0], "rotation": [0, 0, 0, 1], "velocity": [0, 0, 0]},
+        # 90 degrees about Z, stored with the opposite sign (same rotation)
+        {
+            "time": 1.0,
+            "position": [0, 0, 0],
+            "rotation": [0, 0, -half, -half],
+            "velocity": [0, 0, 0],
+        },
+    ]
+
+    _, rot, _ = PhysicsBridge.interpolate_keyframe(keyframes, 0.5)
+
+    # Halfway is 45 degrees about +Z
+    assert rot.z == pytest.approx(math.sin(math.pi / 8))
+    assert rot.w == pytest.approx(math.cos(math.pi / 8))
+    assert math.hypot(rot.x, rot.y, rot.z, rot.w) == pytest.approx(1.0)
+
+
 @pytest.mark.asyncio
 async def test_context_manager_cleanup():
     """Test that context manager properly closes client."""
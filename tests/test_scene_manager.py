@@ -1,5 +1,8 @@
 """Tests for SceneManager."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from chuk_mcp_stage.models import (
@@ -37,6 +40,28 @@ async def test_create_scene():
     assert len(scene.shots) == 0
 
 
+@pytest.mark.asyncio
+async def test_create_scene_with_initial_content():
+    """Test creating a scene with objects and shots in one call."""
+    manager = SceneManager()
+
+    ground = SceneObject(id="ground", type=ObjectType.PLANE)
+    ball = SceneObject(id="ball", type=ObjectType.SPHERE, radius=1.0)
+    shot = Shot(
+        id="orbit-shot",
+        camera_path=CameraPath(mode=CameraPathMode.ORBIT, focus="ball"),
+        start_time=0.0,
+        end_time=10.0,
+    )
+
+    await manager.create_scene(scene_id="test-scene", objects=[ground, ball], shots=[shot])
+
+    manager._scenes.clear()
+    scene = await manager.get_scene("test-scene")
+    assert list(scene.objects) == ["ground", "ball"]
+    assert list(scene.shots) == ["orbit-shot"]
+
+
 @pytest.mark.asyncio
 async def test_add_object():
     """Test adding objects to scene."""
@@ -89,6 +114,94 @@ async def test_add_shot():
     assert scene.shots["orbit-shot"].end_time == 10.0
 
 
+@pytest.mark.asyncio
+async def test_add_objects_batch():
+    """Test adding several objects in one call."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="test-scene")
+
+    ground = SceneObject(id="ground", type=ObjectType.PLANE, size=Vector3(x=10, y=10, z=1))
+    ball = SceneObject(id="ball", type=ObjectType.SPHERE, radius=0.5)
+
+    await manager.add_objects(scene.id, [ground, ball])
+
+    # Verify the batch was persisted, not just cached
+    manager._scenes.clear()
+    scene = await manager.get_scene(scene.id)
+    assert list(scene.objects) == ["ground", "ball"]
+    assert scene.objects["ball"].radius == 0.5
+
+
+@pytest.mark.asyncio
+async def test_add_shots_batch():
+    """Test adding several shots in one call."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="test-scene")
+
+    shots = [
+        Shot(
+            id="intro",
+            camera_path=CameraPath(mode=CameraPathMode.STATIC),
+            start_time=0.0,
+            end_time=2.0,
+        ),
+        Shot(
+            id="orbit",
+            camera_path=CameraPath(mode=CameraPathMode.ORBIT, focus="ball", radius=5.0),
+            start_time=2.0,
+            end_time=6.0,
+        ),
+    ]
+
+    await manager.add_shots(scene.id, shots)
+
+    manager._scenes.clear()
+    scene = await manager.get_scene(scene.id)
+    assert list(scene.shots) == ["intro", "orbit"]
+    assert scene.shots["orbit"].camera_path.mode == CameraPathMode.ORBIT
+
+
+@pytest.mark.asyncio
+async def test_concurrent_mutations_are_all_persisted():
+    """Test independent mutations run concurrently without losing saves."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="test-scene")
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(
+            manager.set_environment(
+                scene.id,
+                Environment(type=EnvironmentType.SOLID),
+                Lighting(preset=LightingPreset.NOON),
+            )
+        )
+        tg.create_task(
+            manager.add_objects(
+                scene.id,
+                [SceneObject(id=f"box-{i}", type=ObjectType.BOX) for i in range(5)],
+            )
+        )
+        tg.create_task(
+            manager.add_shot(
+                scene.id,
+                Shot(
+                    id="wide",
+                    camera_path=CameraPath(mode=CameraPathMode.STATIC),
+                    start_time=0.0,
+                    end_time=3.0,
+                ),
+            )
+        )
+
+    # The last save must contain every mutation
+    manager._scenes.clear()
+    scene = await manager.get_scene(scene.id)
+    assert scene.environment.type == EnvironmentType.SOLID
+    assert scene.lighting.preset == LightingPreset.NOON
+    assert len(scene.objects) == 5
+    assert "wide" in scene.shots
+
+
 @pytest.mark.asyncio
 async def test_bind_physics():
     """Test binding physics to objects."""
@@ -139,6 +252,115 @@ async def test_scene_persistence():
     assert loaded_scene.objects["box"].material.preset == MaterialPreset.METAL_DARK
 
 
+@pytest.mark.asyncio
+async def test_mutations_only_write_what_changed():
+    """Test each mutation rewrites only its own shard, and order survives reload."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="test-scene")
+    await manager.add_objects(
+        scene.id, [SceneObject(id=name, type=ObjectType.BOX) for name in ["c", "a", "b"]]
+    )
+    await manager.add_shot(
+        scene.id,
+        Shot(
+            id="wide", camera_path=CameraPath(mode=CameraPathMode.STATIC), start_time=0, end_time=1
+        ),
+    )
+
+    store = manager._store
+    with patch.object(store, "write_namespace", wraps=store.write_namespace) as write:
+        await manager.add_object(scene.id, SceneObject(id="d", type=ObjectType.SPHERE))
+        await manager.bind_physics(scene.id, "a", "rapier://sim-1/body-a")
+        await manager.set_environment(scene.id, Environment(type=EnvironmentType.SOLID))
+
+    written = [call.kwargs["path"] for call in write.call_args_list]
+    assert written == ["/objects/00000004.json", "/objects/00000001.json", "/scene.json"]
+
+    manager._scenes.clear()
+    scene = await manager.get_scene(scene.id)
+    assert list(scene.objects) == ["c", "a", "b", "d"]
+    assert scene.objects["a"].physics_binding == "rapier://sim-1/body-a"
+    assert list(scene.shots) == ["wide"]
+    assert scene.environment.type == EnvironmentType.SOLID
+
+    # New shards keep numbering after the reloaded ones
+    await manager.add_object(scene.id, SceneObject(id="e", type=ObjectType.BOX))
+    manager._scenes.clear()
+    assert list((await manager.get_scene(scene.id)).objects) == ["c", "a", "b", "d", "e"]
+
+
+@pytest.mark.asyncio
+async def test_load_migrates_single_file_scene():
+    """Test scenes saved with objects inline in /scene.json still load and get sharded."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="legacy-scene")
+    namespace_id = manager._scene_to_namespace[scene.id]
+
+    legacy = scene.model_copy(
+        update={"objects": {"ball": SceneObject(id="ball", type=ObjectType.SPHERE, radius=1.0)}}
+    )
+    await manager._store.write_namespace(
+        namespace_id, path="/scene.json", data=legacy.model_dump_json().encode()
+    )
+
+    manager._scenes.clear()
+    loaded = await manager.get_scene(scene.id)
+    assert list(loaded.objects) == ["ball"]
+
+    header = await manager._store.read_namespace(namespace_id, path="/scene.json")
+    assert b"ball" not in header
+    manager._scenes.clear()
+    assert (await manager.get_scene(scene.id)).objects["ball"].radius == 1.0
+
+
+@pytest.mark.asyncio
+async def test_load_skips_non_shard_files():
+    """Test stray files in the shard directories don't make a scene unloadable."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="stray-scene")
+    await manager.add_object(scene.id, SceneObject(id="ball", type=ObjectType.SPHERE))
+    namespace_id = manager._scene_to_namespace[scene.id]
+    await manager._store.write_namespace(namespace_id, path="/objects/notes.json", data=b"{}")
+    await manager._store.write_namespace(namespace_id, path="/objects/.DS_Store", data=b"")
+
+    manager._scenes.clear()
+    loaded = await manager.get_scene(scene.id)
+    assert list(loaded.objects) == ["ball"]
+
+
+@pytest.mark.asyncio
+async def test_full_save_bounds_concurrent_writes():
+    """Test a full save keeps at most _STORAGE_CONCURRENCY writes in flight."""
+    from chuk_mcp_stage import scene_manager
+
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="big-scene")
+    await manager.add_objects(
+        scene.id, [SceneObject(id=f"obj{i}", type=ObjectType.BOX) for i in range(10)]
+    )
+
+    store = manager._store
+    write_namespace = store.write_namespace
+    in_flight = 0
+    peak = 0
+
+    async def tracked_write(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await write_namespace(*args, **kwargs)
+
+    with (
+        patch.object(scene_manager, "_STORAGE_CONCURRENCY", 3),
+        patch.object(store, "write_namespace", side_effect=tracked_write),
+    ):
+        await manager._save_scene(scene, manager._scene_to_namespace[scene.id])
+
+    assert peak == 3
+
+
 @pytest.mark.asyncio
 async def test_create_scene_with_metadata():
     """Test creating scene with full metadata."""
@@ -171,6 +393,18 @@ async def test_get_scene_not_found():
         await manager.get_scene("nonexistent-scene")
 
 
+@pytest.mark.asyncio
+async def test_snapshot_returns_cached_scene():
+    """Test snapshot returns the live cached scene without loading."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="snap-scene")
+
+    assert manager.snapshot("snap-scene") is scene
+
+    with pytest.raises(ValueError, match="Scene not loaded"):
+        manager.snapshot("nonexistent-scene")
+
+
 @pytest.mark.asyncio
 async def test_set_environment():
     """Test setting scene environment and lighting."""
@@ -301,6 +535,26 @@ async def test_add_baked_animation_object_not_found():
         await manager.add_baked_animation(scene.id, "nonexistent", animation)
 
 
+@pytest.mark.asyncio
+async def test_add_baked_animations_is_all_or_nothing():
+    """Test a batch with an unknown object adds none of its animations."""
+    manager = SceneManager()
+    scene = await manager.create_scene(scene_id="anim-scene")
+    await manager.add_object(scene.id, SceneObject(id="ball", type=ObjectType.SPHERE))
+
+    animations = {
+        object_id: BakedAnimation(
+            object_id=object_id, source="sim", fps=60, frames=10, data_path=f"/{object_id}"
+        )
+        for object_id in ("ball", "nonexistent")
+    }
+
+    with pytest.raises(ValueError, match="Object not found: nonexistent"):
+        await manager.add_baked_animations(scene.id, animations)
+
+    assert (await manager.get_scene(scene.id)).baked_animations == {}
+
+
 @pytest.mark.asyncio
 async def test_get_scene_vfs():
     """Test getting VFS for scene workspace."""
@@ -1,9 +1,12 @@
 """Tests for chuk-mcp-stage server tools."""
 
+import asyncio
 import sys
-from unittest.mock import patch, MagicMock, ANY
+from unittest.mock import patch, AsyncMock, MagicMock, ANY
 import pytest
 from chuk_mcp_stage import server
+from chuk_mcp_stage.physics_bridge import BakedTrajectory, PhysicsBridge
+from chuk_mcp_stage.models import AnimationFormat
 
 # Import unwrapped versions of tool functions for direct testing
 # The @tool decorator wraps async functions, so we need __wrapped__
@@ -128,6 +131,24 @@ async def test_stage_add_object_plane():
     assert result.object_id == "ground"
 
 
+@pytest.mark.asyncio
+async def test_stage_add_object_invalid_type():
+    """Test unknown enum values are still rejected with ValueError."""
+    scene_result = await stage_create_scene()
+    with pytest.raises(ValueError, match="not a valid ObjectType"):
+        await stage_add_object(
+            scene_id=scene_result.scene_id, object_id="thing", object_type="dodecahedron"
+        )
+
+
+def test_enum_parser_accepts_values_and_members():
+    """Test the tool enum parsers map values and members to the same member."""
+    from chuk_mcp_stage.models import ObjectType
+
+    assert server._parse_object_type("sphere") is ObjectType.SPHERE
+    assert server._parse_object_type(ObjectType.SPHERE) is ObjectType.SPHERE
+
+
 @pytest.mark.asyncio
 async def test_stage_set_environment():
     """Test setting environment."""
@@ -265,6 +286,8 @@ async def test_stage_export_json():
     assert result.scene_id == scene_id
     assert result.format.value == "json"
     assert result.output_path is not None
+    assert result.bytes_written > 0
+    assert "bytes_written" not in result.artifacts
 
 
 @pytest.mark.asyncio
@@ -433,8 +456,8 @@ async def test_stage_bake_simulation_with_mock():
         mock_bridge.__aexit__ = async_exit
         mock_bridge.bake_simulation = async_bake
 
-        # Mock the static method keyframes_to_json
-        mock_bridge_class.keyframes_to_json = MagicMock(return_value=json.dumps(mock_keyframes))
+        # Keep the real keyframe serializer on the mocked class
+        mock_bridge_class.iter_keyframes_json = PhysicsBridge.iter_keyframes_json
         mock_bridge_class.return_value = mock_bridge
 
         result = await stage_bake_simulation(
@@ -450,15 +473,156 @@ async def test_stage_bake_simulation_with_mock():
         assert result.total_frames == 2
         assert result.fps == 60
 
+    vfs = await server.get_scene_manager().get_scene_vfs(scene_id)
+    assert json.loads(await vfs.read_text("/animations/obj1.json")) == mock_keyframes
+
+
+@pytest.mark.asyncio
+async def test_stage_bake_simulation_bounds_concurrent_writes():
+    """Test per-body animation writes respect the Rapier concurrency limit."""
+    scene_result = await stage_create_scene()
+    scene_id = scene_result.scene_id
+    object_ids = [f"obj{i}" for i in range(6)]
+    for i, object_id in enumerate(object_ids):
+        await stage_add_object(scene_id=scene_id, object_id=object_id, object_type="box")
+        await stage_bind_physics(
+            scene_id=scene_id,
+            object_id=object_id,
+            physics_body_id=f"rapier://sim-001/body-{i}",
+        )
+
+    keyframes = [{"time": 0.0, "position": [0, 0, 0], "rotation": [0, 0, 0, 1]}]
+    bake = AsyncMock(return_value={str(i): keyframes for i in range(6)})
+
+    in_flight = 0
+    peak = 0
+
+    async def tracked_chunks(chunks):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        for chunk in chunks:
+            yield chunk
+        in_flight -= 1
+
+    manager = server.get_scene_manager()
+    save_scene = manager._save_scene
+
+    with (
+        patch.object(PhysicsBridge, "bake_simulation", bake),
+        patch("chuk_mcp_stage.server._aiter_chunks", tracked_chunks),
+        patch("chuk_mcp_stage.server.Config.get_rapier_concurrency", return_value=2),
+        patch.object(manager, "_save_scene", wraps=save_scene) as mock_save,
+    ):
+        result = await stage_bake_simulation(scene_id=scene_id, simulation_id="sim-001")
+
+    # All six animations are registered with one header save
+    mock_save.assert_awaited_once()
+    assert set((await manager.get_scene(scene_id)).baked_animations) == set(object_ids)
+    assert result.baked_objects == object_ids
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stage_bake_simulation_write_failure_cancels_pending():
+    """Test a failed animation write cancels the other writes and registers nothing."""
+    scene_result = await stage_create_scene()
+    scene_id = scene_result.scene_id
+    for i in range(3):
+        await stage_add_object(scene_id=scene_id, object_id=f"obj{i}", object_type="box")
+        await stage_bind_physics(
+            scene_id=scene_id,
+            object_id=f"obj{i}",
+            physics_body_id=f"rapier://sim-001/body-{i}",
+        )
+
+    bake = AsyncMock(return_value={str(i): [{"time": float(i)}] for i in range(3)})
+    cancelled = []
+
+    async def stream_write(path, stream):
+        if path == "/animations/obj0.json":
+            return False
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(path)
+            raise
+        return True
+
+    vfs = AsyncMock()
+    vfs.stream_write.side_effect = stream_write
+    manager = server.get_scene_manager()
+
+    with (
+        patch.object(PhysicsBridge, "bake_simulation", bake),
+        patch.object(manager, "get_scene_vfs", AsyncMock(return_value=vfs)),
+        pytest.raises(OSError, match="obj0.json"),
+    ):
+        await stage_bake_simulation(scene_id=scene_id, simulation_id="sim-001")
+
+    await asyncio.sleep(0)
+    assert sorted(cancelled) == ["/animations/obj1.json", "/animations/obj2.json"]
+    assert (await manager.get_scene(scene_id)).baked_animations == {}
+
+
+@pytest.mark.asyncio
+async def test_stage_bake_simulation_binary_format():
+    """Test baking with the binary animation encoding."""
+    scene_result = await stage_create_scene()
+    scene_id = scene_result.scene_id
+    await stage_add_object(scene_id=scene_id, object_id="obj1", object_type="sphere")
+    await stage_bind_physics(
+        scene_id=scene_id,
+        object_id="obj1",
+        physics_body_id="rapier://sim-001/body-1",
+    )
+
+    keyframes = [
+        {
+            "time": i / 60,
+            "position": [0.0, 5.0 - i * 0.5, 0.0],
+            "rotation": [0.0, 0.0, 0.0, 1.0],
+            "velocity": [0.0, -0.5, 0.0],
+        }
+        for i in range(3)
+    ]
+    bake = AsyncMock(return_value={"1": keyframes})
+
+    with patch.object(PhysicsBridge, "bake_simulation", bake):
+        result = await stage_bake_simulation(
+            scene_id=scene_id, simulation_id="sim-001", animation_format="binary"
+        )
+
+    assert result.baked_objects == ["obj1"]
+    assert result.total_frames == 3
+
+    manager = server.get_scene_manager()
+    baked = (await manager.get_scene(scene_id)).baked_animations["obj1"]
+    assert baked.format == AnimationFormat.BINARY
+    assert baked.data_path == "/animations/obj1.bin"
+
+    vfs = await manager.get_scene_vfs(scene_id)
+    trajectory = BakedTrajectory.from_bytes(await vfs.read_binary(baked.data_path))
+    assert len(trajectory) == 3
+    assert trajectory.to_keyframes()[2]["position"] == [0.0, 4.0, 0.0]
+
+    with pytest.raises(ValueError):
+        await stage_bake_simulation(
+            scene_id=scene_id, simulation_id="sim-001", animation_format="yaml"
+        )
+
 
 def test_main_default_stdio():
     """Test main function defaults to stdio mode."""
     from chuk_mcp_stage.server import main
 
-    with patch("chuk_mcp_stage.server.run") as mock_run:
-        with patch.object(sys, "argv", ["chuk-mcp-stage"]):
-            main()
-            mock_run.assert_called_once_with(transport="stdio")
+    with (
+        patch("chuk_mcp_stage.server.run") as mock_run,
+        patch.object(sys, "argv", ["chuk-mcp-stage"]),
+    ):
+        main()
+        mock_run.assert_called_once_with(transport="stdio")
 
 
 def test_main_http_mode():